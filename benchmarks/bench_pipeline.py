@@ -0,0 +1,228 @@
+"""
+End-to-end scaffold benchmark: from `mydjango` to a project that answers HTTP.
+
+    python benchmarks/bench_pipeline.py --wheelhouse DIR [-n 3] [--apps 1,5,20]
+                                        [--caches cold,warm] [-o results.json]
+                                        [--baseline old.json] [--threshold 0.2]
+    python benchmarks/bench_pipeline.py --compare old.json new.json
+
+Every run is a headless `mydjango --spec ... --offline --venv-cache --trace`
+in a fresh scratch directory, installing only from the local wheelhouse, so
+no run touches the network. The run counts as finished when the development
+server first answers an HTTP request; the harness then stops it with Ctrl+C.
+
+  * cold: every run gets an empty cache (venv template, DB snapshot, banner)
+  * warm: one unmeasured run fills a cache that the measured runs share
+
+Per scenario it reports the median and p95 of the time to HTTP, of the
+pipeline wall time and of every step (from the trace), and writes them as
+JSON. With --baseline (or --compare), steps whose median grew by more than
+--threshold (and by at least --min-delta seconds) are flagged as regressions
+and the exit status is 1.
+"""
+import os
+import sys
+import json
+import math
+import time
+import shutil
+import signal
+import socket
+import argparse
+import platform
+import statistics
+import subprocess
+import tempfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.insert(0, ROOT)
+
+from my_django_starter.builder.history import percentile  # noqa: E402
+from my_django_starter.builder.wheelhouse import Wheelhouse  # noqa: E402
+from my_django_starter.modules.server_runner.readiness import ServerNotReady, wait_until_ready  # noqa: E402
+
+PASSWORD = "bench-Passw0rd!"
+
+
+def describe(values: list) -> dict:
+    return {"median": statistics.median(values), "p95": percentile(values, 95), "samples": values}
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def latest_django(wheelhouse: str) -> str:
+    versions = [wheel["version"] for wheel in Wheelhouse(wheelhouse).wheels() if wheel["name"] == "django"]
+    if not versions:
+        raise SystemExit(f"no Django wheel in {wheelhouse} (fill it with 'mydjango cache prefetch')")
+    return max(versions, key=lambda version: [int(part) if part.isdigit() else 0 for part in version.split(".")])
+
+
+def write_spec(path: str, django_version: str, apps: int):
+    names = ", ".join(f'"app{index}"' for index in range(1, apps + 1))
+    with open(path, "w") as f:
+        f.write(f'project_name = "benchsite"\nvenv_name = "env"\ndjango_version = "{django_version}"\n'
+                f"apps = [{names}]\nrun_server = true\nvenv_cache = true\n")
+
+
+def run_once(workdir: str, spec: str, cache_dir: str, wheelhouse: str, timeout: float) -> dict:
+    """One scaffold; returns time to HTTP, pipeline wall time and per-step wall times."""
+    os.makedirs(workdir)
+    port = free_port()
+    trace = os.path.join(workdir, "trace.json")
+    # MYDJANGO_HISTORY=off: benchmark runs must not skew the user's `mydjango stats`
+    env = dict(os.environ, MYDJANGO_CACHE_DIR=cache_dir, DJANGO_PORT=str(port), MYDJANGO_HISTORY="off",
+               DJANGO_SUPERUSER_PASSWORD=PASSWORD, PIP_NO_INDEX="1", PYTHONPATH=ROOT)
+    argv = [sys.executable, "-m", "my_django_starter.main", "--spec", spec, "--offline",
+            "--wheelhouse", wheelhouse, "--trace", trace]
+
+    with open(os.path.join(workdir, "mydjango.log"), "w") as log:
+        start = time.perf_counter()
+        # Default SIGINT handling, even when this script runs in the background
+        process = subprocess.Popen(argv, cwd=workdir, env=env, stdin=subprocess.DEVNULL, stdout=log,
+                                   stderr=subprocess.STDOUT,
+                                   preexec_fn=lambda: signal.signal(signal.SIGINT, signal.SIG_DFL))
+        try:
+            ready = wait_until_ready(process, "127.0.0.1", port, timeout=timeout, interval=0.02, started=start)
+        except ServerNotReady as e:
+            process.kill()
+            process.wait()
+            with open(log.name) as f:
+                tail = f.read().splitlines()[-25:]
+            raise SystemExit(f"run in {workdir} failed: {e}\n" + "\n".join(tail))
+        process.send_signal(signal.SIGINT)  # stops the server; the trace is written on the way out
+        process.wait(timeout=60)
+
+    with open(trace) as f:
+        # The server step lasts until the Ctrl+C above; time_to_http covers its startup
+        events = [event for event in json.load(f)["traceEvents"]
+                  if event.get("cat") == "step" and event["name"] != "ServerRunner"]
+    return {
+        "time_to_http": ready["first_response"],
+        "pipeline": (max(e["ts"] + e["dur"] for e in events) - min(e["ts"] for e in events)) / 1e6,
+        "steps": {event["name"]: event["dur"] / 1e6 for event in events},
+    }
+
+
+def run_scenario(scratch: str, name: str, spec: str, cold: bool, rounds: int, wheelhouse: str, timeout: float) -> dict:
+    runs = []
+    warm_cache = os.path.join(scratch, f"{name}-cache")
+    if not cold:
+        run_once(os.path.join(scratch, f"{name}-prime"), spec, warm_cache, wheelhouse, timeout)
+    for index in range(rounds):
+        cache_dir = os.path.join(scratch, f"{name}-cache-{index}") if cold else warm_cache
+        workdir = os.path.join(scratch, f"{name}-{index}")
+        runs.append(run_once(workdir, spec, cache_dir, wheelhouse, timeout))
+        shutil.rmtree(workdir, ignore_errors=True)
+        if cold:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+        print(f"  {name} run {index + 1}/{rounds}: {runs[-1]['time_to_http']:.2f}s to HTTP", flush=True)
+
+    step_names = list(dict.fromkeys(step for run in runs for step in run["steps"]))
+    return {
+        "runs": rounds,
+        "time_to_http": describe([run["time_to_http"] for run in runs]),
+        "pipeline": describe([run["pipeline"] for run in runs]),
+        "steps": {step: describe([run["steps"].get(step, 0.0) for run in runs]) for step in step_names},
+    }
+
+
+def report(results: dict):
+    for name, scenario in results["scenarios"].items():
+        print(f"\n{name} ({scenario['runs']} runs)")
+        print(f"  {'':<24}{'MEDIAN s':>10}{'P95 s':>10}")
+        for label in ("time_to_http", "pipeline"):
+            print(f"  {label.upper().replace('_', ' '):<24}{scenario[label]['median']:>10.3f}{scenario[label]['p95']:>10.3f}")
+        for step, numbers in scenario["steps"].items():
+            print(f"    {step:<22}{numbers['median']:>10.3f}{numbers['p95']:>10.3f}")
+
+
+def compare(old: dict, new: dict, threshold: float, min_delta: float) -> list:
+    """(scenario, metric, old median, new median) for every median that regressed."""
+    regressions = []
+    for name, scenario in new["scenarios"].items():
+        before = old["scenarios"].get(name)
+        if before is None:
+            continue
+        metrics = {label: (before[label], scenario[label]) for label in ("time_to_http", "pipeline")}
+        metrics.update({step: (before["steps"][step], numbers)
+                        for step, numbers in scenario["steps"].items() if step in before["steps"]})
+        for metric, (was, now) in metrics.items():
+            if now["median"] - was["median"] >= min_delta and now["median"] > was["median"] * (1 + threshold):
+                regressions.append((name, metric, was["median"], now["median"]))
+    return regressions
+
+
+def print_regressions(regressions: list, threshold: float) -> int:
+    if not regressions:
+        print(f"\nno regressions beyond {threshold:.0%}")
+        return 0
+    print(f"\nREGRESSIONS (median up by more than {threshold:.0%}):")
+    for name, metric, was, now in regressions:
+        print(f"  {name:<12}{metric:<24}{was:>8.3f}s -> {now:>8.3f}s  (+{(now / was - 1) if was else math.inf:.0%})")
+    return 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--wheelhouse", help="local wheel directory (default: the mydjango wheelhouse)")
+    parser.add_argument("--django-version", help="default: the newest Django wheel in the wheelhouse")
+    parser.add_argument("-n", "--rounds", type=int, default=3, help="measured runs per scenario")
+    parser.add_argument("--apps", default="1,5,20", help="comma-separated app counts")
+    parser.add_argument("--caches", default="cold,warm", help="cold, warm or both")
+    parser.add_argument("--timeout", type=float, default=900, help="seconds a run may take to answer HTTP")
+    parser.add_argument("-o", "--output", default="bench_pipeline.json", help="where to write the results")
+    parser.add_argument("--baseline", help="earlier results to compare against")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="only compare two result files")
+    parser.add_argument("--threshold", type=float, default=0.2, help="relative slowdown that counts (default 0.2)")
+    parser.add_argument("--min-delta", type=float, default=0.05, help="ignore slowdowns under this many seconds")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        old, new = (json.load(open(path)) for path in args.compare)
+        return print_regressions(compare(old, new, args.threshold, args.min_delta), args.threshold)
+    if os.name == "nt":
+        raise SystemExit("the harness stops the server with SIGINT, which needs a POSIX system")
+
+    wheelhouse = Wheelhouse(args.wheelhouse).path
+    django_version = args.django_version or latest_django(wheelhouse)
+    results = {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "django": django_version,
+            "rounds": args.rounds,
+        },
+        "scenarios": {},
+    }
+
+    with tempfile.TemporaryDirectory(prefix="mydjango-bench-") as scratch:
+        for apps in [int(count) for count in args.apps.split(",")]:
+            spec = os.path.join(scratch, f"apps{apps}.toml")
+            write_spec(spec, django_version, apps)
+            for cache in args.caches.split(","):
+                if cache not in ("cold", "warm"):
+                    raise SystemExit(f"unknown cache state '{cache}' (cold or warm)")
+                name = f"{cache}-{apps}apps"
+                results["scenarios"][name] = run_scenario(
+                    scratch, name, spec, cache == "cold", args.rounds, wheelhouse, args.timeout)
+
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=1)
+    report(results)
+    print(f"\nresults written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        return print_regressions(compare(baseline, results, args.threshold, args.min_delta), args.threshold)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
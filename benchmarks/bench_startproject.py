@@ -0,0 +1,98 @@
+"""
+Compare `django-admin startproject` against the in-process template renderer.
+
+    python benchmarks/bench_startproject.py path/to/venv [-n 20]
+
+Each round creates a project both ways in a scratch directory, checks that
+the trees are identical apart from SECRET_KEY, and reports median timings.
+"""
+import os
+import re
+import sys
+import glob
+import argparse
+import filecmp
+import statistics
+import subprocess
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from my_django_starter.builder import django_templates  # noqa: E402
+
+SECRET_KEY = re.compile(r"SECRET_KEY = '[^']*'")
+
+
+def python_in(venv: str) -> str:
+    for candidate in ("bin/python", "Scripts/python.exe"):
+        path = os.path.join(venv, candidate)
+        if os.path.exists(path):
+            return path
+    raise SystemExit(f"no interpreter found in {venv}")
+
+
+def compare(left: str, right: str) -> list:
+    """Relative paths whose content or mode differs (SECRET_KEY masked)."""
+    differences = []
+    left_files = sorted(os.path.relpath(p, left) for p in glob.glob(os.path.join(left, "**"), recursive=True))
+    right_files = sorted(os.path.relpath(p, right) for p in glob.glob(os.path.join(right, "**"), recursive=True))
+    if left_files != right_files:
+        return sorted(set(left_files) ^ set(right_files))
+    for relative in left_files:
+        a, b = os.path.join(left, relative), os.path.join(right, relative)
+        if os.path.isdir(a):
+            continue
+        if os.stat(a).st_mode != os.stat(b).st_mode:
+            differences.append(relative + " (mode)")
+        elif relative.endswith("settings.py"):
+            with open(a) as fa, open(b) as fb:
+                if SECRET_KEY.sub("", fa.read()) != SECRET_KEY.sub("", fb.read()):
+                    differences.append(relative)
+        elif not filecmp.cmp(a, b, shallow=False):
+            differences.append(relative)
+    return differences
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("venv", help="Virtual environment with Django installed")
+    parser.add_argument("-n", "--rounds", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    venv = os.path.abspath(args.venv)
+    python_cmd = python_in(venv)
+    subprocess_times, render_times = [], []
+    cold_start = time.perf_counter()
+    django_templates.load_template(venv, "project")
+    cold = time.perf_counter() - cold_start
+
+    with tempfile.TemporaryDirectory() as scratch:
+        for index in range(args.rounds):
+            name = f"benchproject{index}"
+            left, right = os.path.join(scratch, "subprocess"), os.path.join(scratch, "render")
+            os.makedirs(left, exist_ok=True)
+            os.makedirs(right, exist_ok=True)
+
+            start = time.perf_counter()
+            subprocess.run([python_cmd, "-m", "django", "startproject", name], cwd=left, check=True)
+            subprocess_times.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            django_templates.load_template(venv, "project").render(name, os.path.join(right, name))
+            render_times.append(time.perf_counter() - start)
+
+            differences = compare(os.path.join(left, name), os.path.join(right, name))
+            if differences:
+                print(f"MISMATCH in round {index}: {', '.join(differences)}")
+                return 1
+
+    sub, ren = statistics.median(subprocess_times), statistics.median(render_times)
+    print(f"startproject subprocess : {sub * 1000:8.2f} ms (median of {args.rounds})")
+    print(f"in-process render       : {ren * 1000:8.2f} ms (median, +{cold * 1000:.2f} ms first load)")
+    print(f"speedup                 : {sub / ren:8.1f}x, output identical apart from SECRET_KEY")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,82 @@
+"""
+Measure how long the command-line entry points take to start.
+
+    python benchmarks/bench_startup.py [-n 20] [--top 10] [--budget 50]
+
+Runs `mydjango --help` and `mydjango-add-generalapp --help` from this
+checkout in fresh interpreters and reports the median wall time next to a
+bare `python -c pass`. A `python -X importtime` run of each command lists
+the imports that cost the most. With --budget, exits 1 when a command's
+median (interpreter startup included) exceeds that many milliseconds.
+"""
+import os
+import sys
+import argparse
+import statistics
+import subprocess
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+COMMANDS = {
+    "python -c pass": ["-c", "pass"],
+    "mydjango --help": ["-m", "my_django_starter.main", "--help"],
+    "mydjango-add-generalapp --help": ["-m", "my_django_starter.app_generalapp", "--help"],
+}
+
+
+def environment() -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [os.path.abspath(ROOT), env.get("PYTHONPATH")]))
+    return env
+
+
+def wall_times(argv: list, rounds: int, env: dict) -> list:
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *argv], env=env, stdout=subprocess.DEVNULL, check=True)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def slowest_imports(argv: list, env: dict, top: int) -> list:
+    """(cumulative µs, self µs, module) of the most expensive top-level imports."""
+    result = subprocess.run([sys.executable, "-X", "importtime", *argv], env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True)
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, module = line[len("import time:"):].split("|", 2)
+        if not module[1:].startswith(" "):  # nested imports are part of their parent's total
+            rows.append((int(cumulative), int(own), module.strip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-n", "--rounds", type=int, default=20)
+    parser.add_argument("--top", type=int, default=8, help="imports to list per command")
+    parser.add_argument("--budget", type=float, metavar="MS", help="fail when a median exceeds MS milliseconds")
+    args = parser.parse_args(argv)
+
+    env = environment()
+    over_budget = []
+    for name, command in COMMANDS.items():
+        median = statistics.median(wall_times(command, args.rounds, env))
+        print(f"{name:<32}: {median * 1000:8.2f} ms (median of {args.rounds})")
+        if command[0] != "-c":
+            for cumulative, own, module in slowest_imports(command, env, args.top):
+                print(f"    {cumulative / 1000:7.2f} ms  {module} (self {own / 1000:.2f} ms)")
+            if args.budget is not None and median * 1000 > args.budget:
+                over_budget.append(name)
+
+    if over_budget:
+        print(f"OVER BUDGET ({args.budget:.0f} ms): {', '.join(over_budget)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,203 @@
+# animations/live_view.py
+import re
+import time
+import shutil
+import threading
+from collections import deque
+
+ANSI_ESCAPE = re.compile(r"\033\[[0-9;?]*[A-Za-z]")
+SPINNER = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
+FAILURE_TAIL_LINES = 20  # output shown again when a step fails in the live view
+
+
+class LineWriter:
+    """
+    Stands in for sys.stdout while a renderer is active, so plain print()
+    calls from the steps are queued too. Lines are assembled per thread;
+    flush() hands over a pending partial line (an input() prompt) at once.
+    """
+
+    def __init__(self, renderer, stream):
+        self._renderer = renderer
+        self._stream = stream
+        self._partial = threading.local()
+
+    def write(self, text: str) -> int:
+        *lines, rest = (getattr(self._partial, "text", "") + text).split("\n")
+        self._partial.text = rest
+        if lines:
+            self._renderer.emit(lines)
+        return len(text)
+
+    def flush(self):
+        rest = getattr(self._partial, "text", "")
+        if rest:
+            self._partial.text = ""
+            self._renderer.write_now(rest)
+
+    def __getattr__(self, name):
+        # encoding, fileno(), isatty() ... of the real stream
+        return getattr(self._stream, name)
+
+
+class Renderer:
+    """
+    Base renderer: steps only append to an in-memory queue, and a background
+    thread does the actual writing every `interval` seconds. A slow terminal
+    or a full pipe therefore stalls the renderer, never the step.
+    """
+    interval = 0.25
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.writer = LineWriter(self, stream)
+        self._pending = []
+        self._lock = threading.Lock()        # guards the queue and step state
+        self._write_lock = threading.Lock()  # one writer at a time
+        self._stopping = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="terminal-renderer", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.drain(final=True)
+
+    def _run(self):
+        while not self._stopping.wait(self.interval):
+            self.drain()
+
+    def emit(self, lines: list):
+        with self._lock:
+            self._pending.extend(f"{line}\n" for line in lines)
+
+    def write_now(self, text: str):
+        """Write `text` (no newline added) together with everything queued before it."""
+        with self._lock:
+            self._pending.append(text)
+        self.drain()
+
+    def drain(self, final: bool = False):
+        with self._write_lock:
+            with self._lock:
+                chunks, self._pending = self._pending, []
+            try:
+                self._write(chunks, final)
+            except (OSError, ValueError):  # closed or broken stream: drop the output
+                pass
+
+    def _write(self, chunks: list, final: bool):
+        raise NotImplementedError
+
+    # Progress hooks; the plain renderer only needs the output itself.
+    def step_started(self, name: str):
+        pass
+
+    def step_finished(self, name: str, failed: bool = False):
+        pass
+
+    def command_output(self, label: str, lines: list, caller: int = None):
+        self.emit([f"[{label}] {line}" for line in lines])
+
+
+class PlainRenderer(Renderer):
+    """Logs and pipes: whole lines in batches, without colors or cursor movement."""
+    interval = 0.5
+
+    def _write(self, chunks, final):
+        if chunks:
+            self.stream.write(ANSI_ESCAPE.sub("", "".join(chunks)))
+            self.stream.flush()
+
+
+class _RunningStep:
+    def __init__(self, name: str):
+        self.name = name
+        self.start = time.perf_counter()
+        self.output = deque(maxlen=FAILURE_TAIL_LINES)
+
+
+class LiveRenderer(Renderer):
+    """
+    Terminals: messages scroll as usual, and below them a status block shows
+    every running step with its elapsed time and the last lines of its
+    subprocess output. The block is erased and redrawn on each frame.
+    """
+    interval = 0.1
+
+    def __init__(self, stream, total_steps: int = 0, tail_lines: int = 3):
+        super().__init__(stream)
+        self.total_steps = total_steps
+        self.tail_lines = tail_lines
+        self._running = {}  # thread ident -> _RunningStep
+        self._finished = 0
+        self._drawn = 0
+        self._frame = 0
+        self._started = time.perf_counter()
+
+    def step_started(self, name):
+        with self._lock:
+            self._running[threading.get_ident()] = _RunningStep(name)
+
+    def step_finished(self, name, failed=False):
+        with self._lock:
+            step = self._running.pop(threading.get_ident(), None)
+            self._finished += 1
+            # Only the tail was on screen; show what led up to the failure
+            if failed and step is not None and step.output:
+                self._pending.append(f"[{name}: last {len(step.output)} lines of output]\n")
+                self._pending.extend(f"  {line}\n" for line in step.output)
+
+    def command_output(self, label, lines, caller=None):
+        with self._lock:
+            step = self._running.get(caller)
+            if step is None:
+                self._pending.extend(f"[{label}] {line}\n" for line in lines)
+            else:
+                step.output.extend(f"[{label}] {line}" for line in lines)
+
+    def start(self):
+        self.stream.write("\033[?25l")  # hide the cursor while redrawing
+        super().start()
+
+    def _block(self, width: int) -> list:
+        with self._lock:
+            running = list(self._running.values())
+            finished = self._finished
+        now = time.perf_counter()
+        spinner = SPINNER[self._frame % len(SPINNER)]
+        self._frame += 1
+        done = f"{finished}/{self.total_steps}" if self.total_steps else str(finished)
+        lines = [f"\033[96m{spinner} {done} STEPS DONE · {now - self._started:.1f}s\033[0m"]
+        for step in running:
+            lines.append(_fit(f"  {spinner} {step.name} {now - step.start:.1f}s", width))
+            for line in list(step.output)[-self.tail_lines:]:
+                lines.append(f"\033[2m{_fit('      ' + line, width)}\033[0m")
+        return lines
+
+    def _write(self, chunks, final):
+        width = shutil.get_terminal_size((80, 20)).columns
+        out = [f"\033[{self._drawn}F\033[J"] if self._drawn else []
+        text = "".join(chunks)
+        if text and not text.endswith("\n"):
+            text += "\n"
+        out.append(text)
+        block = [] if final else self._block(width)
+        out.extend(f"{line}\n" for line in block)
+        self._drawn = len(block)
+        if final:
+            out.append("\033[?25h")
+        self.stream.write("".join(out))
+        self.stream.flush()
+
+
+def _fit(line: str, width: int) -> str:
+    """One terminal row: no carriage-return progress bars, colors or wrapping."""
+    line = ANSI_ESCAPE.sub("", line.rsplit("\r", 1)[-1]).expandtabs()
+    return line[:max(1, width - 1)]
@@ -1,5 +1,7 @@
 import sys
-import time
+import threading
+from contextlib import contextmanager
+from .live_view import LiveRenderer, PlainRenderer
 
 COLOR_CODES = {
     "RED": "\033[91m",
@@ -9,16 +11,189 @@ COLOR_CODES = {
     "RESET": "\033[0m"
 }
 
-def status_tag(text, symbol="🔔", color="YELLOW"):
-    color_code = COLOR_CODES.get(color.upper(), "")
-    reset_code = COLOR_CODES["RESET"]
-    print(f"{color_code}[{symbol}] {text}{reset_code}", flush=True)
-
-def type_writer(text, delay=0.01, color="RESET"):
-    color_code = COLOR_CODES.get(color.upper(), "")
-    reset_code = COLOR_CODES["RESET"]
-    for char in text:
-        sys.stdout.write(f"{color_code}{char}{reset_code}")
+# Steps may run on several threads; keep each line in one piece.
+_output_lock = threading.RLock()
+_animations_enabled = True
+_live_view_allowed = False
+_renderer = None  # set while a pipeline runs with a renderer
+_held = None  # set while a step prompts; see prompting()
+
+def disable_animations():
+    """Never draw the live status view, not even on a terminal (batch workers, CI)."""
+    global _animations_enabled
+    _animations_enabled = False
+
+def enable_live_view():
+    """Let pipelines draw the live status view on a terminal. Only for runs that never prompt."""
+    global _live_view_allowed
+    _live_view_allowed = True
+
+def _isatty(stream) -> bool:
+    try:
+        return stream.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+def _paint(text, color):
+    if not _isatty(sys.stdout):
+        return text
+    return f"{COLOR_CODES.get(color.upper(), '')}{text}{COLOR_CODES['RESET']}"
+
+def _emit(lines):
+    held = _held
+    if held is not None and threading.get_ident() != held.owner:
+        held.hold(_emit, list(lines))
+        return
+    renderer = _renderer
+    if renderer is not None:
+        renderer.emit(lines)
+        return
+    with _output_lock:
+        for line in lines:
+            sys.stdout.write(f"{line}\n")
         sys.stdout.flush()
-        time.sleep(delay)
-    print()
+
+def status_tag(text, symbol="🔔", color="YELLOW"):
+    _emit([_paint(f"[{symbol}] {text}", color)])
+
+def write_lines(lines):
+    """Print several lines as one block, uninterrupted by other threads."""
+    _emit(list(lines))
+
+def type_writer(text, delay=None, color="RESET"):
+    # delay is kept so existing callers still work; text is no longer typed out
+    _emit([_paint(text, color)])
+
+def command_output(label, lines, caller=None):
+    """Output of a subprocess run on behalf of the step running on thread `caller`."""
+    held = _held
+    if held is not None and caller != held.owner:
+        held.hold(command_output, label, lines, caller)
+        return
+    renderer = _renderer
+    if renderer is not None:
+        renderer.command_output(label, lines, caller)
+    else:
+        _emit([f"[{label}] {line}" for line in lines])
+
+
+def _install(renderer):
+    global _renderer
+    renderer.start()
+    sys.stdout = renderer.writer
+    _renderer = renderer
+
+def _uninstall(renderer):
+    global _renderer
+    _renderer = None
+    sys.stdout = renderer.stream
+    renderer.stop()
+
+@contextmanager
+def live_view(total_steps=0):
+    """
+    Route all output through a background renderer for the duration of a run:
+    the live status view on a terminal (if enabled), batched plain lines when
+    stdout is a file or pipe. Interactive terminal runs keep writing directly.
+    """
+    stream = sys.stdout
+    tty = _isatty(stream)
+    if _renderer is not None or (tty and not (_live_view_allowed and _animations_enabled)):
+        yield
+        return
+    renderer = LiveRenderer(stream, total_steps) if tty else PlainRenderer(stream)
+    _install(renderer)
+    try:
+        yield renderer
+    finally:
+        _uninstall(renderer)
+
+class _HeldOutput:
+    """
+    Stands in for sys.stdout while one thread prompts: that thread writes
+    straight through, every other thread's output is kept until the prompt
+    is answered.
+    """
+
+    def __init__(self, stream, owner):
+        self.stream = stream
+        self.owner = owner
+        self.calls = []
+        self._partial = {}
+
+    def hold(self, function, *args):
+        with _output_lock:
+            self.calls.append((function, args))
+
+    def write(self, text):
+        ident = threading.get_ident()
+        if ident == self.owner:
+            return self.stream.write(text)
+        with _output_lock:
+            *lines, self._partial[ident] = (self._partial.get(ident, "") + text).split("\n")
+            if lines:
+                self.calls.append((_emit, (lines,)))
+        return len(text)
+
+    def flush(self):
+        if threading.get_ident() == self.owner:
+            self.stream.flush()
+
+    def release(self):
+        with _output_lock:
+            rest = [line for line in self._partial.values() if line]
+            calls = self.calls + ([(_emit, (rest,))] if rest else [])
+            self.calls, self._partial = [], {}
+        for function, args in calls:
+            function(*args)
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+@contextmanager
+def prompting():
+    """
+    The calling thread may prompt until the block exits: output from every
+    other thread is held back meanwhile, so it never lands inside a question,
+    and printed afterwards. Runs that never prompt are left alone.
+    """
+    global _held
+    if _live_view_allowed or _held is not None:
+        yield
+        return
+    held = _HeldOutput(sys.stdout, threading.get_ident())
+    with _output_lock:
+        sys.stdout, _held = held, held
+    try:
+        yield
+    finally:
+        with _output_lock:
+            sys.stdout, _held = held.stream, None
+        held.release()
+
+@contextmanager
+def step_progress(name, exclusive=False):
+    """
+    Show step `name` as running until the block exits. An `exclusive` step
+    (one that owns the terminal, like the development server) pauses the
+    live view and writes directly while it runs.
+    """
+    renderer = _renderer
+    if renderer is None:
+        yield
+        return
+    if exclusive and isinstance(renderer, LiveRenderer):
+        _uninstall(renderer)
+        try:
+            yield
+        finally:
+            _install(renderer)
+        renderer.step_finished(name)
+        return
+    renderer.step_started(name)
+    try:
+        yield
+    except BaseException:
+        renderer.step_finished(name, failed=True)
+        raise
+    renderer.step_finished(name)
@@ -1,14 +1,15 @@
 import os
-from my_django_starter.modules.os_detector.os_detector import OSDetector
-from my_django_starter.modules.app_creator.app_creator import AppCreator
-from my_django_starter.modules.banner.banner import Banner
-from my_django_starter.modules.settings_modifier.settings_modifier import SettingsModifier
-from my_django_starter.builder.pipeline import Pipeline
-from my_django_starter.modules.win_path_helper.win_path_helper import ensure_cli_works
-from my_django_starter.animations.terminal_fx import status_tag, type_writer
+import argparse
+from my_django_starter.builder.registry import create_step
+from my_django_starter.animations.terminal_fx import status_tag, type_writer, enable_live_view
 
-def add_general_app():
+def add_general_app(argv=None):
     """Add a single Django app to an existing project."""
+    parser = argparse.ArgumentParser(prog="mydjango-add-generalapp", description=add_general_app.__doc__)
+    parser.add_argument("--app", dest="apps", action="append", metavar="NAME",
+                        help="app to create without prompting (repeatable)")
+    args = parser.parse_args(argv)
+    from my_django_starter.modules.win_path_helper.win_path_helper import ensure_cli_works
     ensure_cli_works()  # Fixes PATH automatically (Windows only)
 
     # Initialize context
@@ -22,12 +23,15 @@ def add_general_app():
         'python_cmd': '',  # Will be set if virtual environment is active
         'pip_cmd': ''  # Will be set if virtual environment is active
     }
+    if args.apps:
+        context['spec'] = {'apps': args.apps}
+        enable_live_view()
 
     # Check if a virtual environment is active
     venv_path = os.environ.get('VIRTUAL_ENV')
     if not venv_path:
         # Use OSDetector to set context['os'] and get OS name
-        OSDetector().execute(context)
+        create_step("OSDetector").execute(context)
         os_name = context['os'].lower()
         activation_example = "venv\\Scripts\\activate" if os_name == 'windows' else "source venv/bin/activate"
         status_tag("No active virtual environment detected. Please activate your virtual environment and try again.", symbol="⚠️", color="YELLOW")
@@ -37,7 +41,7 @@ def add_general_app():
 
     # Set virtual environment paths
     context['venv_path'] = venv_path
-    context['os'] = OSDetector().execute(context) or context['os']  # Ensure os is set
+    context['os'] = create_step("OSDetector").execute(context) or context['os']  # Ensure os is set
     os_name = context['os'].lower()
     context['python_cmd'] = os.path.join(venv_path, "Scripts", "python.exe" if os_name == 'windows' else "bin", "python")
     context['pip_cmd'] = os.path.join(venv_path, "Scripts", "pip.exe" if os_name == 'windows' else "bin", "pip")
@@ -48,11 +52,13 @@ def add_general_app():
         return
 
     # Create pipeline with app creation and settings modification
+    from my_django_starter.builder.pipeline import Pipeline
+    from my_django_starter.builder.history import run_history
     pipeline = Pipeline([
-        Banner(),  # Display banner
-        AppCreator(),  # Create and structure the new app
-        SettingsModifier()  # Update settings.py and urls.py
-    ])
+        create_step("Banner"),  # Display banner
+        create_step("AppCreator"),  # Create and structure the new app
+        create_step("SettingsModifier")  # Update settings.py and urls.py
+    ], history=run_history("add-generalapp"))
 
     # Execute pipeline
     pipeline.build_all(context)
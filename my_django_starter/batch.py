@@ -0,0 +1,168 @@
+# my_django_starter/batch.py
+import os
+import sys
+import glob
+import time
+import subprocess
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from my_django_starter.animations.terminal_fx import status_tag, type_writer
+from my_django_starter.spec import load_spec, spec_requirements
+from my_django_starter.builder.wheelhouse import Wheelhouse, cache_root
+
+SPEC_PATTERNS = ("*.toml", "*.json")
+
+
+def find_specs(spec_dir: str) -> list:
+    specs = []
+    for pattern in SPEC_PATTERNS:
+        specs.extend(glob.glob(os.path.join(spec_dir, pattern)))
+    return sorted(os.path.abspath(path) for path in specs)
+
+
+@contextmanager
+def _redirect_output(log_file):
+    """Send this process's stdout/stderr, and its children's, to `log_file`."""
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved = os.dup(1), os.dup(2)
+    os.dup2(log_file.fileno(), 1)
+    os.dup2(log_file.fileno(), 2)
+    try:
+        yield
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(saved[0], 1)
+        os.dup2(saved[1], 2)
+        os.close(saved[0])
+        os.close(saved[1])
+
+
+@contextmanager
+def _scoped_environ(extra: dict):
+    """
+    Apply `extra` to os.environ and put the environment back afterwards. Pool
+    processes are reused, so a password one spec sets must not leak into the
+    next, while the one inherited from the parent must survive.
+    """
+    saved = dict(os.environ)
+    os.environ.update(extra)
+    try:
+        yield
+    finally:
+        os.environ.clear()
+        os.environ.update(saved)
+
+
+def scaffold_project(spec_path: str, workdir: str, shared_env: dict,
+                     offline: bool = False, wheelhouse: str = None) -> dict:
+    """
+    Worker entry point: scaffold one project from `spec_path` inside `workdir`.
+    Each worker is its own process, so the os.chdir calls made by the steps
+    cannot leak into other projects.
+    """
+    from my_django_starter.main import build_parser, build_pipeline, initial_context
+    from my_django_starter.spec import build_spec
+    from my_django_starter.builder.checkpoint import Checkpoint
+    from my_django_starter.builder.history import run_history
+    from my_django_starter.animations.terminal_fx import disable_animations
+
+    start = time.perf_counter()
+    os.makedirs(workdir, exist_ok=True)
+    disable_animations()
+
+    log_path = os.path.join(workdir, "mydjango.log")
+    error = None
+    context = {}
+    with _scoped_environ(shared_env), open(log_path, "w") as log, _redirect_output(log):
+        try:
+            os.chdir(workdir)
+            spec = build_spec(build_parser().parse_args(["--spec", spec_path]))
+            context = initial_context(spec, offline=offline, wheelhouse=wheelhouse)
+            venv_cache = bool(spec.get('venv_cache'))
+            options = {'run_server': False, 'venv_cache': venv_cache, 'offline': offline, 'wheelhouse': wheelhouse}
+            pipeline = build_pipeline(checkpoint=Checkpoint(workdir, options=options), run_server=False,
+                                      venv_cache=venv_cache, history=run_history("batch"))
+            pipeline.build_all(context)
+        except Exception as e:
+            error = f"{e.__class__.__name__}: {e}"
+
+    return {
+        'spec': spec_path,
+        'name': os.path.basename(workdir),
+        'ok': error is None,
+        'error': error,
+        'seconds': time.perf_counter() - start,
+        'project_path': context.get('project_path'),
+        'log': log_path,
+    }
+
+
+def prefetch_wheels(specs: list, wheelhouse: Wheelhouse) -> bool:
+    """Download everything the specs install (Django versions, model packages) once, before fanning out."""
+    packages = {"python-decouple"}
+    for path in specs:
+        try:
+            # Batch projects never start a server
+            packages.update(spec_requirements(dict(load_spec(path), run_server=False)))
+        except Exception:
+            continue  # the worker reports the broken spec
+
+    try:
+        wheelhouse.prefetch(sorted(packages))
+        return True
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError):
+        return False
+
+
+def print_report(results: list, wall: float):
+    width = max([len(result['name']) for result in results] + [7])
+    print()
+    print(f"{'PROJECT':<{width}}  {'STATUS':<6}  {'SECONDS':>8}  DETAILS")
+    for result in results:
+        status = "ok" if result['ok'] else "FAILED"
+        details = result['project_path'] if result['ok'] else f"{result['error']} (log: {result['log']})"
+        print(f"{result['name']:<{width}}  {status:<6}  {result['seconds']:>8.2f}  {details}")
+    print()
+    failed = sum(1 for result in results if not result['ok'])
+    color = "RED" if failed else "GREEN"
+    status_tag(f"{len(results) - failed}/{len(results)} PROJECTS SCAFFOLDED IN {wall:.2f}s", symbol="📦", color=color)
+
+
+def run_batch(spec_dir: str, jobs: int = None, output_dir: str = None,
+              offline: bool = False, wheelhouse: str = None) -> int:
+    """Scaffold one project per spec file in `spec_dir` on a bounded process pool."""
+    specs = find_specs(spec_dir)
+    if not specs:
+        status_tag(f"No *.toml or *.json specs found in {spec_dir}", symbol="❌", color="RED")
+        return 1
+
+    output_dir = os.path.abspath(output_dir or os.getcwd())
+    wheelhouse = Wheelhouse(wheelhouse)
+    shared_env = {"PIP_CACHE_DIR": os.path.join(cache_root(), "pip")}
+
+    if not offline:
+        type_writer(f"[🔧 PREFETCHING PACKAGES FOR {len(specs)} PROJECTS ...]", color="CYAN")
+        if not prefetch_wheels(specs, wheelhouse):
+            status_tag("PREFETCH FAILED; WORKERS WILL DOWNLOAD ON THEIR OWN", symbol="⚠️", color="YELLOW")
+
+    jobs = jobs or min(len(specs), os.cpu_count() or 1)
+    type_writer(f"[🔧 SCAFFOLDING {len(specs)} PROJECTS WITH {jobs} WORKERS ...]", color="CYAN")
+    start = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {}
+        for spec_path in specs:
+            name = os.path.splitext(os.path.basename(spec_path))[0]
+            workdir = os.path.join(output_dir, name)
+            futures[pool.submit(scaffold_project, spec_path, workdir, shared_env, offline, wheelhouse.path)] = name
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            symbol, color = ("✅", "GREEN") if result['ok'] else ("❌", "RED")
+            status_tag(f"{result['name']} ({result['seconds']:.2f}s)", symbol=symbol, color=color)
+
+    results.sort(key=lambda result: result['name'])
+    print_report(results, time.perf_counter() - start)
+    return 0 if all(result['ok'] for result in results) else 1
@@ -2,7 +2,24 @@
 from abc import ABC, abstractmethod
 
 class Step(ABC):
+    # Context keys this step consumes and produces. The pipeline uses them to
+    # work out which steps can run side by side. Leaving them as None marks the
+    # step as a barrier: it runs alone, after everything before it.
+    reads = None
+    writes = None
+    # Requirements this step needs in the project venv. They are installed
+    # together with Django in one pip run instead of one run per step.
+    packages = ()
+
     @abstractmethod
     def execute(self, context: dict):
         """Execute this step."""
         pass
+
+    def counters(self, context: dict) -> dict:
+        """
+        Step-specific numbers for profile reports (--profile-steps). Read
+        before and after the step runs; numeric values are reported as the
+        change between the two, anything else as its final value.
+        """
+        return {}
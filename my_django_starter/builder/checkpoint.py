@@ -0,0 +1,124 @@
+# builder/checkpoint.py
+import os
+import json
+from .documents import PythonDocument
+from .overlay import OVERLAY, Overlay
+
+CHECKPOINT_FILE = ".mydjango_checkpoint.json"
+
+# Context keys that point at files earlier steps produced. A resumed run checks
+# they still exist before skipping the steps that created them.
+ARTIFACT_KEYS = ("python_cmd", "pip_cmd", "project_path", "settings_path", "urls_path", "env_path")
+
+
+def _json_context(context: dict) -> dict:
+    """
+    The context as plain JSON. Documents keep their pending text and the
+    overlay the files it has not committed; both are rebuilt from those on
+    --resume. Any other value json cannot store is left out.
+    """
+    saved = {}
+    for key, value in dict(context).items():  # a copy, as steps may still be adding keys
+        if isinstance(value, Overlay):
+            saved[key] = value.snapshot()
+        elif isinstance(value, PythonDocument):
+            saved[key] = value.text
+        else:
+            try:
+                json.dumps(value)
+            except (TypeError, ValueError):
+                continue
+            saved[key] = value
+    return saved
+
+
+class Checkpoint:
+    """
+    Persists the pipeline context and finished steps after every step, along
+    with the options the pipeline was built from (server, venv cache, ...),
+    so --resume rebuilds the same pipeline whatever flags it is given.
+    """
+
+    def __init__(self, launch_dir: str = None, options: dict = None):
+        self.launch_dir = os.path.abspath(launch_dir or os.getcwd())
+        self.options = dict(options or {})
+        self.path = None
+
+    def _target(self, context: dict) -> str:
+        # Until ProjectCreator runs there is no project directory yet, so the
+        # checkpoint lives next to where mydjango was started.
+        project_path = context.get("project_path")
+        if project_path and os.path.isdir(project_path):
+            return os.path.join(project_path, CHECKPOINT_FILE)
+        return os.path.join(self.launch_dir, CHECKPOINT_FILE)
+
+    def save(self, context: dict, completed: set, step_names: list):
+        target = self._target(context)
+        state = {
+            "steps": step_names,
+            "options": self.options,
+            "completed": sorted(completed),
+            "last_completed": max(completed) if completed else -1,
+            "context": _json_context(context),
+        }
+        tmp_path = target + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp_path, target)
+
+        if self.path and self.path != target and os.path.exists(self.path):
+            os.remove(self.path)
+        self.path = target
+
+    def clear(self):
+        if self.path and os.path.exists(self.path):
+            os.remove(self.path)
+        self.path = None
+
+    @classmethod
+    def load(cls, location: str = None):
+        """Read a checkpoint from a project directory or a checkpoint file path."""
+        location = os.path.abspath(location or os.getcwd())
+        path = location if os.path.isfile(location) else os.path.join(location, CHECKPOINT_FILE)
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"No checkpoint found at {path}")
+        with open(path, "r") as f:
+            state = json.load(f)
+
+        checkpoint = cls(os.path.dirname(path), options=state.get("options"))
+        checkpoint.path = path
+        return checkpoint, state
+
+
+def missing_artifacts(context: dict) -> list:
+    """Return the context keys whose files or directories are gone."""
+    # Files the checkpoint still holds in its overlay count as present
+    snapshot = context.get(OVERLAY)
+    pending = set()
+    if isinstance(snapshot, dict):
+        pending = set(snapshot.get("dirs") or ()) | set(snapshot.get("files") or ())
+        if pending:
+            pending.add(snapshot["root"])
+    exists = lambda path: os.path.abspath(path) in pending or os.path.exists(path)
+
+    missing = []
+    for key in ARTIFACT_KEYS:
+        value = context.get(key)
+        if value and not exists(value):
+            missing.append(key)
+
+    project_path = context.get("project_path")
+    project_name = context.get("project_name")
+    if project_path and "project_path" not in missing:
+        expected = [os.path.join(project_path, "manage.py")]
+        if project_name:
+            expected.append(os.path.join(project_path, project_name, "settings.py"))
+        if not all(exists(path) for path in expected):
+            missing.append("project_path")
+    if project_path:
+        # App directories: AppCreator's (app_names) and the home app (apps)
+        if not all(exists(os.path.join(project_path, app)) for app in context.get("app_names") or ()):
+            missing.append("app_names")
+        if context.get("apps") is not None and not exists(os.path.join(project_path, "home")):
+            missing.append("apps")
+    return missing
@@ -0,0 +1,196 @@
+# builder/commands.py
+import os
+import sys
+import time
+import asyncio
+import threading
+import subprocess
+from my_django_starter.animations.terminal_fx import command_output
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DEFAULT_TIMEOUT = 900  # seconds; a cold `pip install django` on a slow mirror fits comfortably
+OUTPUT_TAIL_LINES = 20
+
+
+class CommandResult:
+    """Outcome of one command: exit code, timing and the tail of its output."""
+
+    def __init__(self, args, label, caller):
+        self.args = [str(arg) for arg in args]
+        self.label = label
+        self.caller = caller  # thread ident of the step that asked for it
+        self.returncode = None
+        self.start = 0.0
+        self.duration = 0.0
+        self.children_cpu = 0.0
+        self.output = ""
+        self.tail = []
+        self.timed_out = False
+
+    @property
+    def command(self) -> str:
+        return " ".join(self.args)
+
+    def check(self):
+        if self.timed_out:
+            raise subprocess.TimeoutExpired(self.args, self.duration, output=self.output)
+        if self.returncode != 0:
+            raise subprocess.CalledProcessError(self.returncode, self.args, output=self.output)
+        return self
+
+
+class CommandRunner:
+    """
+    One asyncio event loop, on a background thread, that runs every subprocess
+    the steps need. Steps call the blocking `run`/`run_many` from their own
+    threads; output is streamed line by line with a `[label]` prefix so
+    concurrent commands never interleave mid-line.
+    """
+
+    def __init__(self, max_concurrency: int = 4, default_timeout: float = DEFAULT_TIMEOUT):
+        self.max_concurrency = max_concurrency
+        self.default_timeout = default_timeout
+        self.history = []
+        self.observers = []
+        self._loop = None
+        self._semaphore = None
+        self._lock = threading.Lock()
+
+    # ---------------------- event loop ---------------------- #
+
+    def _ensure_loop(self):
+        with self._lock:
+            if self._loop is None:
+                ready = threading.Event()
+                thread = threading.Thread(target=self._serve, args=(ready,), name="command-runner", daemon=True)
+                thread.start()
+                ready.wait()
+        return self._loop
+
+    def _serve(self, ready: threading.Event):
+        if sys.platform == "win32":
+            loop = asyncio.ProactorEventLoop()
+        else:
+            loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._loop = loop
+        ready.set()
+        loop.run_forever()
+
+    # ---------------------- public API ---------------------- #
+
+    def run(self, args, label: str = None, cwd: str = None, env: dict = None,
+            timeout: float = None, check: bool = True, capture: bool = False) -> CommandResult:
+        """Run one command and block until it finishes."""
+        return self.run_many([dict(args=args, label=label, cwd=cwd, env=env, timeout=timeout, capture=capture)],
+                             check=check)[0]
+
+    def run_many(self, commands: list, check: bool = True) -> list:
+        """
+        Run several independent commands concurrently (bounded by
+        max_concurrency). Each entry is a dict of `run` keyword arguments.
+        Results come back in the order given.
+        """
+        loop = self._ensure_loop()
+        caller = threading.get_ident()
+        coroutines = [self._execute(caller=caller, **command) for command in commands]
+        future = asyncio.run_coroutine_threadsafe(self._gather(coroutines), loop)
+        results = future.result()
+        if check:
+            for result in results:
+                result.check()
+        return results
+
+    def record(self, result: CommandResult):
+        """Add a result produced elsewhere (e.g. by the manage.py worker) to the history."""
+        self._publish(result)
+
+    # ---------------------- internals ---------------------- #
+
+    async def _gather(self, coroutines):
+        return await asyncio.gather(*coroutines)
+
+    async def _execute(self, args, caller, label=None, cwd=None, env=None, timeout=None, capture=False):
+        label = label or os.path.basename(str(args[0]))
+        result = CommandResult(args, label, caller)
+        timeout = self.default_timeout if timeout is None else timeout
+
+        async with self._semaphore:
+            usage_before = _children_cpu()
+            result.start = time.perf_counter()
+            process = await asyncio.create_subprocess_exec(
+                *result.args, cwd=cwd, env=env,
+                stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            )
+            lines = []
+            try:
+                await asyncio.wait_for(self._pump(process, result, lines, capture), timeout)
+            except asyncio.TimeoutError:
+                result.timed_out = True
+                process.kill()
+                await process.wait()
+            result.duration = time.perf_counter() - result.start
+            # Process-wide child rusage: exact when commands do not overlap,
+            # an approximation when they do.
+            result.children_cpu = max(0.0, _children_cpu() - usage_before)
+
+        result.returncode = process.returncode
+        result.output = "".join(lines)
+        result.tail = lines[-OUTPUT_TAIL_LINES:]
+        self._publish(result)
+        return result
+
+    async def _pump(self, process, result: CommandResult, lines: list, capture: bool):
+        while True:
+            raw = await process.stdout.readline()
+            if not raw:
+                break
+            line = raw.decode(errors="replace")
+            lines.append(line)
+            if not capture:
+                command_output(result.label, [line.rstrip()], result.caller)
+        await process.wait()
+
+    def _publish(self, result: CommandResult):
+        with self._lock:
+            self.history.append(result)
+            observers = list(self.observers)
+        for observer in observers:
+            observer(result)
+
+
+def _children_cpu() -> float:
+    if resource is None:
+        return 0.0
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+_runner = None
+_runner_lock = threading.Lock()
+
+
+def get_command_runner() -> CommandRunner:
+    """The process-wide runner shared by all steps."""
+    global _runner
+    with _runner_lock:
+        if _runner is None:
+            _runner = CommandRunner()
+        return _runner
+
+
+def _forget_runner():
+    # A forked child (e.g. a batch worker) inherits the runner and its loop,
+    # but not the thread that drives the loop: start over with a fresh one.
+    global _runner, _runner_lock
+    _runner = None
+    _runner_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_runner)
@@ -0,0 +1,156 @@
+# django_templates.py
+import os
+import re
+import ast
+import glob
+import stat
+import secrets
+import threading
+import importlib.util
+from .overlay import DirectFS
+
+# Same alphabet and length as django.core.management.utils.get_random_secret_key
+SECRET_KEY_CHARS = "abcdefghijklmnopqrstuvwxyz0123456789!@#$%^&*(-_=+)"
+SECRET_KEY_LENGTH = 50
+
+_VARIABLE = re.compile(r"{{\s*(\w+)\s*}}")
+_RELEASE_SUFFIX = {"alpha": "a", "beta": "b", "rc": "rc"}
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+class UnsupportedTemplate(Exception):
+    """The installed Django needs its real template engine; use the subprocess path."""
+
+
+def find_django_package(venv_path: str) -> str:
+    patterns = [
+        os.path.join(venv_path, "lib", "python*", "site-packages", "django"),
+        os.path.join(venv_path, "Lib", "site-packages", "django"),
+    ]
+    for pattern in patterns:
+        for match in glob.glob(pattern):
+            if os.path.isfile(os.path.join(match, "__init__.py")):
+                return match
+    raise UnsupportedTemplate(f"Django not found in {venv_path}")
+
+
+def _read_version(django_dir: str) -> tuple[str, str]:
+    """Return (django_version, docs_version) from django/__init__.py without importing it."""
+    with open(os.path.join(django_dir, "__init__.py"), encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(t, "id", None) == "VERSION" for t in node.targets):
+            major, minor, micro, level, serial = ast.literal_eval(node.value)
+            break
+    else:
+        raise UnsupportedTemplate("django.VERSION not found")
+
+    if level == "alpha" and serial == 0:
+        raise UnsupportedTemplate("development versions embed a git changeset")
+    version = f"{major}.{minor}" if micro == 0 else f"{major}.{minor}.{micro}"
+    if level != "final":
+        version += f"{_RELEASE_SUFFIX[level]}{serial}"
+    docs_version = f"{major}.{minor}" if level == "final" else "dev"
+    return version, docs_version
+
+
+def _compile(content: str) -> list:
+    """Split a template into literal text and variable names (odd indices)."""
+    parts = _VARIABLE.split(content)
+    if any(marker in text for text in parts[::2] for marker in ("{{", "{%", "{#")):
+        raise UnsupportedTemplate("template uses tags, comments or filters")
+    return parts
+
+
+class DjangoTemplate:
+    """Django's project_template or app_template, read and compiled once per venv."""
+
+    def __init__(self, django_dir: str, kind: str):
+        if kind not in ("project", "app"):
+            raise ValueError(f"Unknown template kind '{kind}'")
+        self.kind = kind
+        self.template_dir = os.path.join(django_dir, "conf", f"{kind}_template")
+        self.django_version, self.docs_version = _read_version(django_dir)
+        with open(os.path.join(django_dir, "core", "management", "commands", "startproject.py"), encoding="utf-8") as f:
+            self.secret_prefix = "django-insecure-" if "SECRET_KEY_INSECURE_PREFIX" in f.read() else ""
+        self.directories = []
+        self.files = []  # (relative path, compiled parts or None for verbatim copy, mode)
+        self._load()
+
+    def _load(self):
+        prefix_length = len(self.template_dir) + 1
+        for root, dirs, files in os.walk(self.template_dir):
+            dirs[:] = [d for d in dirs if not d.startswith(".") and d != "__pycache__"]
+            if root != self.template_dir:
+                self.directories.append(root[prefix_length:])
+            for filename in files:
+                if filename.endswith((".pyo", ".pyc", ".py.class")):
+                    continue
+                path = os.path.join(root, filename)
+                relative = path[prefix_length:]
+                if relative.endswith(".py-tpl"):
+                    relative = relative[:-len(".py-tpl")] + ".py"
+                mode = stat.S_IMODE(os.stat(path).st_mode)  # the bits shutil.copymode copies
+                if relative.endswith(".py"):
+                    with open(path, encoding="utf-8") as f:
+                        self.files.append((relative, _compile(f.read()), mode))
+                else:
+                    with open(path, "rb") as f:
+                        self.files.append((relative, f.read(), mode))
+
+    def render(self, name: str, target_dir: str, secret_key: str = None, include: set = None, fs=None):
+        """
+        Write the tree exactly as `startproject`/`startapp name` would. With
+        `include`, only those top-level entries are written. `fs` is the
+        builder's overlay; by default files go straight to disk.
+        """
+        fs = fs or DirectFS()
+        placeholder = f"{self.kind}_name"
+        variables = {
+            placeholder: name,
+            f"{self.kind}_directory": target_dir,
+            f"camel_case_{self.kind}_name": "".join(x for x in name.title() if x != "_"),
+            "docs_version": self.docs_version,
+            "django_version": self.django_version,
+            "secret_key": self.secret_prefix + (secret_key or new_secret_key()),
+        }
+        if fs.exists(target_dir):
+            raise RuntimeError(f"'{target_dir}' already exists")
+        fs.makedirs(target_dir)
+
+        for directory in self.directories:
+            directory = directory.replace(placeholder, name)
+            if include is None or directory.split(os.sep)[0] in include:
+                fs.makedirs(os.path.join(target_dir, directory))
+        for relative, body, mode in self.files:
+            relative = relative.replace(placeholder, name)
+            if include is not None and relative.split(os.sep)[0] not in include:
+                continue
+            if isinstance(body, list):
+                body = "".join(
+                    part if index % 2 == 0 else str(variables.get(part, ""))
+                    for index, part in enumerate(body)
+                )
+            # Like startproject: shutil.copymode from the template, then make it writable
+            fs.write(os.path.join(target_dir, relative), body, mode | stat.S_IWUSR)
+
+
+def new_secret_key() -> str:
+    return "".join(secrets.choice(SECRET_KEY_CHARS) for _ in range(SECRET_KEY_LENGTH))
+
+
+def load_template(venv_path: str, kind: str = "project") -> DjangoTemplate:
+    """Compiled template set for the Django installed in `venv_path` (cached per venv)."""
+    django_dir = os.path.realpath(find_django_package(venv_path))
+    with _cache_lock:
+        if (django_dir, kind) not in _cache:
+            _cache[django_dir, kind] = DjangoTemplate(django_dir, kind)
+        return _cache[django_dir, kind]
+
+
+def check_module_name(name: str):
+    """Mirror startproject/startapp's rule that the name must not shadow an importable module."""
+    if importlib.util.find_spec(name) is not None:
+        raise UnsupportedTemplate(f"'{name}' conflicts with an existing Python module")
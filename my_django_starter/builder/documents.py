@@ -0,0 +1,315 @@
+# builder/documents.py
+import os
+import ast
+import threading
+from .overlay import DirectFS, project_fs
+
+SETTINGS_DOC = "settings_doc"
+URLS_DOC = "urls_doc"
+
+
+class Block:
+    """One top-level statement (or the comments/blank lines between them)."""
+    __slots__ = ("kind", "name", "lines")
+
+    def __init__(self, kind: str, name: str, lines: list):
+        self.kind = kind  # "import", "assign", "docstring", "code" or "text"
+        self.name = name
+        self.lines = lines
+
+    @property
+    def text(self) -> str:
+        return "".join(self.lines)
+
+
+def _classify(node) -> tuple[str, str]:
+    if isinstance(node, (ast.Import, ast.ImportFrom)):
+        return "import", None
+    if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+        return "assign", node.targets[0].id
+    if isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
+        return "docstring", None
+    return "code", None
+
+
+def _expression(source: str):
+    return ast.dump(ast.parse(source.strip(), mode="eval").body)
+
+
+class PythonDocument:
+    """
+    A generated module (settings.py, urls.py) held in memory as a list of
+    top-level statements indexed by the name they assign. Steps edit it through
+    the methods below; every edit is idempotent and nothing is written until
+    save(), which hands the text to `fs` (the project overlay).
+    """
+
+    def __init__(self, path: str, text: str = None, fs=None):
+        self.path = path
+        self.fs = fs or DirectFS()
+        self.dirty = text is not None
+        if text is None:
+            text = self.fs.read(path)
+        self._lock = threading.RLock()
+        self._parse(text)
+
+    def _parse(self, text: str):
+        lines = text.splitlines(keepends=True)
+        if lines and not lines[-1].endswith("\n"):
+            lines[-1] += "\n"
+        self.blocks = []
+        self.names = {}
+        position = 0
+        for node in ast.parse(text).body:
+            start, end = node.lineno - 1, node.end_lineno
+            if start < position:  # second statement on a line (`a = 1; b = 2`)
+                continue
+            if start > position:
+                self.blocks.append(Block("text", None, lines[position:start]))
+            kind, name = _classify(node)
+            block = Block(kind, name, lines[start:end])
+            self.blocks.append(block)
+            if name:
+                self.names[name] = block
+            position = end
+        if position < len(lines):
+            self.blocks.append(Block("text", None, lines[position:]))
+
+    def __str__(self) -> str:
+        return self.text
+
+    @property
+    def text(self) -> str:
+        with self._lock:
+            return "".join(block.text for block in self.blocks)
+
+    def _insert(self, index: int, block: Block):
+        self.blocks.insert(index, block)
+        if block.name:
+            self.names[block.name] = block
+        self.dirty = True
+
+    # ---------------------- imports ---------------------- #
+
+    def _import_position(self) -> int:
+        """Just after the last top-level import (or the module docstring)."""
+        position = 0
+        for index, block in enumerate(self.blocks):
+            if block.kind == "import":
+                position = index + 1
+            elif block.kind == "docstring" and all(b.kind == "text" for b in self.blocks[:index]):
+                position = index + 1
+        return position
+
+    def add_import(self, statement: str):
+        """Add e.g. `import os` unless it is already there."""
+        statement = statement.strip()
+        with self._lock:
+            if any(block.kind == "import" and block.text.strip() == statement for block in self.blocks):
+                return
+            self._insert(self._import_position(), Block("import", None, [statement + "\n"]))
+
+    def import_name(self, module: str, name: str):
+        """Make sure `name` is imported from `module`, extending an existing `from module import ...`."""
+        with self._lock:
+            for block in self.blocks:
+                if block.kind != "import":
+                    continue
+                node = ast.parse(block.text).body[0]
+                if isinstance(node, ast.ImportFrom) and node.module == module and node.level == 0:
+                    names = [alias.name for alias in node.names]
+                    if name in names or "*" in names:
+                        return
+                    if len(block.lines) == 1 and all(alias.asname is None for alias in node.names):
+                        block.lines = [f"from {module} import {', '.join(names + [name])}\n"]
+                        self.dirty = True
+                        return
+            self.add_import(f"from {module} import {name}")
+
+    # ---------------------- assignments ---------------------- #
+
+    def get(self, name: str):
+        """The literal value assigned to `name`; ValueError if it isn't a literal."""
+        with self._lock:
+            block = self.names.get(name)
+            if block is None:
+                raise KeyError(name)
+            return ast.literal_eval(ast.parse(block.text).body[0].value)
+
+    def set(self, name: str, source: str, comment: str = None):
+        self.set_many({name: source}, comment)
+
+    def set_many(self, assignments: dict, comment: str = None):
+        """
+        Assign each name the given source expression: in place when it is
+        already defined, otherwise appended at the end (under `comment`).
+        """
+        with self._lock:
+            appended = []
+            for name, source in assignments.items():
+                lines = f"{name} = {source}\n".splitlines(keepends=True)
+                block = self.names.get(name)
+                if block is None:
+                    appended.append(Block("assign", name, lines))
+                elif block.lines != lines:
+                    block.lines = lines
+                    self.dirty = True
+            if not appended:
+                return
+            header = ["\n"]
+            if comment and not any(block.kind == "text" and comment in block.text for block in self.blocks):
+                header.append(f"{comment}\n")
+            self._insert(len(self.blocks), Block("text", None, header))
+            for block in appended:
+                self._insert(len(self.blocks), block)
+
+    def add_to_list(self, name: str, item: str, first: bool = False):
+        """Add the `item` expression to the list assigned to `name` unless an equal one is there."""
+        with self._lock:
+            block = self.names.get(name)
+            if block is None:
+                raise ValueError(f"{name} not found in {os.path.basename(self.path)}!")
+            value = ast.parse(block.text).body[0].value
+            if not isinstance(value, (ast.List, ast.Tuple)):
+                raise ValueError(f"{name} in {os.path.basename(self.path)} is not a list")
+            wanted = _expression(item)
+            if any(ast.dump(element) == wanted for element in value.elts):
+                return
+
+            if len(block.lines) == 1:
+                # `NAME = [a, b]` -> one item per line
+                elements = [ast.get_source_segment(block.text, element) for element in value.elts]
+                open_bracket, close_bracket = ("[", "]") if isinstance(value, ast.List) else ("(", ")")
+                block.lines = [f"{name} = {open_bracket}\n"] + [f"    {element},\n" for element in elements] + [f"{close_bracket}\n"]
+
+            line = f"    {item},\n"
+            if first:
+                block.lines.insert(1, line)
+            else:
+                closers = [i for i, text in enumerate(block.lines) if text.strip().startswith(("]", ")"))]
+                closing = closers[-1] if closers else len(block.lines) - 1
+                block.lines.insert(closing, line)
+            self.dirty = True
+
+    # ---------------------- free-form code ---------------------- #
+
+    def add_block(self, source: str):
+        """Append a statement (e.g. an `if settings.DEBUG:` block) unless it is already present."""
+        with self._lock:
+            wanted = ast.dump(ast.parse(source))
+            if any(block.kind == "code" and ast.dump(ast.parse(block.text)) == wanted for block in self.blocks):
+                return
+            self._insert(len(self.blocks), Block("text", None, ["\n"]))
+            self._insert(len(self.blocks), Block("code", None, source.splitlines(keepends=True)))
+
+    # ---------------------- disk ---------------------- #
+
+    def save(self) -> bool:
+        """Write the module if anything changed; returns whether it did."""
+        with self._lock:
+            if not self.dirty:
+                return False
+            self.fs.write(self.path, self.text)
+            self.dirty = False
+            return True
+
+
+class SettingsDocument(PythonDocument):
+    def add_installed_app(self, app_name: str):
+        self.add_to_list("INSTALLED_APPS", repr(app_name))
+
+    def set_setting(self, name: str, source: str, comment: str = None):
+        self.set(name, source, comment)
+
+    def set_template_dirs(self, source: str):
+        """Point TEMPLATES[0]['DIRS'] at `source`."""
+        with self._lock:
+            block = self.names.get("TEMPLATES")
+            if block is None:
+                raise ValueError("TEMPLATES not found in settings.py!")
+            line = f"        'DIRS': {source},\n"
+            for index, text in enumerate(block.lines):
+                if "'DIRS'" in text or '"DIRS"' in text:
+                    if text != line:
+                        block.lines[index] = line
+                        self.dirty = True
+                    return
+            backend = next((i for i, text in enumerate(block.lines) if "BACKEND" in text), 1)
+            block.lines.insert(backend + 1, line)
+            self.dirty = True
+
+
+class UrlsDocument(PythonDocument):
+    def add_include(self, prefix: str, module: str, first: bool = False):
+        """Route `prefix` to `include(module)` in urlpatterns."""
+        self.import_name("django.urls", "include")
+        self.add_to_list("urlpatterns", f"path({prefix!r}, include({module!r}))", first=first)
+
+    def add_media_serving(self):
+        self.add_import("from django.conf import settings")
+        self.add_import("from django.conf.urls.static import static")
+        self.add_block("if settings.DEBUG:\n    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)\n")
+
+
+# ---------------------- context helpers ---------------------- #
+
+_documents_lock = threading.Lock()
+
+
+def _document(context: dict, key: str, filename: str, cls, default: str = None) -> PythonDocument:
+    project_path = context.get("project_path")
+    project_name = context.get("project_name")
+    if not project_path or not project_name:
+        raise ValueError("Required context data (project_path or project_name) missing!")
+    path = os.path.join(project_path, project_name, filename)
+    fs = project_fs(context)
+
+    with _documents_lock:
+        document = context.get(key)
+        if isinstance(document, cls):
+            return document
+        if isinstance(document, str):
+            # Restored from a checkpoint: the pending text, not yet on disk
+            document = cls(path, text=document, fs=fs)
+        else:
+            try:
+                document = cls(path, fs=fs)
+            except (FileNotFoundError, SyntaxError):
+                if default is None:
+                    raise
+                document = cls(path, text=default, fs=fs)
+        context[key] = document
+        return document
+
+
+def settings_document(context: dict) -> SettingsDocument:
+    """The project's settings.py, parsed once and shared through the context."""
+    return _document(context, SETTINGS_DOC, "settings.py", SettingsDocument)
+
+
+def urls_document(context: dict, default: str = None) -> UrlsDocument:
+    """The project's root urls.py; `default` replaces a missing or unparsable file."""
+    return _document(context, URLS_DOC, "urls.py", UrlsDocument, default)
+
+
+def write_documents(context: dict) -> list:
+    """Hand every edited document to the project overlay; returns their paths."""
+    written = []
+    for key in (SETTINGS_DOC, URLS_DOC):
+        document = context.get(key)
+        if isinstance(document, str):
+            document = (settings_document if key == SETTINGS_DOC else urls_document)(context)
+        if isinstance(document, PythonDocument) and document.save():
+            written.append(document.path)
+    return written
+
+
+def commit_project(context: dict) -> int:
+    """
+    Flush the documents and commit the overlay, putting every generated file
+    on disk; returns the number of files written.
+    """
+    if not context.get("project_path"):
+        return 0
+    write_documents(context)
+    return project_fs(context).commit()
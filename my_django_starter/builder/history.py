@@ -0,0 +1,178 @@
+# builder/history.py
+import os
+import math
+import time
+import sqlite3
+import threading
+from contextlib import contextmanager
+from .overlay import OVERLAY
+from my_django_starter.animations.terminal_fx import status_tag
+
+HISTORY_ENV = "MYDJANGO_HISTORY"  # a path, or "off"
+HISTORY_FILE = "history.sqlite3"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    command TEXT NOT NULL,
+    started REAL NOT NULL,
+    wall REAL NOT NULL,
+    ok INTEGER NOT NULL,
+    django_version TEXT,
+    app_count INTEGER NOT NULL,
+    subprocesses INTEGER NOT NULL,
+    bytes_written INTEGER NOT NULL,
+    files_written INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS steps (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    name TEXT NOT NULL,
+    wall REAL NOT NULL,
+    subprocesses INTEGER NOT NULL,
+    ok INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS steps_by_name ON steps(name, run_id);
+"""
+
+
+def default_history_path() -> str:
+    """Where runs are recorded: $MYDJANGO_HISTORY, else the cache directory. None when turned off."""
+    path = os.environ.get(HISTORY_ENV)
+    if path and path.lower() in ("off", "0", "no", "false"):
+        return None
+    if path:
+        return path
+    from .wheelhouse import cache_root
+    return os.path.join(cache_root(), HISTORY_FILE)
+
+
+def percentile(values: list, q: float) -> float:
+    """Nearest-rank percentile: always a value that was actually measured."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(q / 100 * len(ordered)) - 1)]
+
+
+def _connect(path: str) -> sqlite3.Connection:
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    # Batch workers append concurrently; WAL lets `mydjango stats` read meanwhile
+    connection = sqlite3.connect(path, timeout=30)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.executescript(SCHEMA)
+    return connection
+
+
+class RunHistory:
+    """
+    Records every pipeline run in a local SQLite file: the run's wall time,
+    outcome, Django version, app count, subprocess count and bytes written,
+    plus each step's wall time and subprocess count.
+    """
+
+    def __init__(self, path: str = None, command: str = "mydjango"):
+        self.path = path or default_history_path()
+        self.command = command
+        self._steps = []
+        self._active = {}  # thread ident -> step record
+        self._subprocesses = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def run(self, context: dict):
+        """Wrap one Pipeline.build_all; the run is appended when it ends, failed or not."""
+        from .commands import get_command_runner
+        runner = get_command_runner()
+        runner.observers.append(self._record_command)
+        started, start = time.time(), time.perf_counter()
+        ok = False
+        try:
+            yield self
+            ok = True
+        finally:
+            runner.observers.remove(self._record_command)
+            self._append(context, started, time.perf_counter() - start, ok)
+
+    @contextmanager
+    def step(self, name: str):
+        record = {"name": name, "wall": 0.0, "subprocesses": 0, "ok": False}
+        self._active[threading.get_ident()] = record
+        start = time.perf_counter()
+        try:
+            yield record
+            record["ok"] = True
+        finally:
+            record["wall"] = time.perf_counter() - start
+            self._active.pop(threading.get_ident(), None)
+            with self._lock:
+                self._steps.append(record)
+
+    def _record_command(self, result):
+        with self._lock:
+            self._subprocesses += 1
+            record = self._active.get(result.caller)
+            if record is not None:
+                record["subprocesses"] += 1
+
+    def _append(self, context: dict, started: float, wall: float, ok: bool):
+        resolved = context.get('resolved_packages') or {}
+        django_version = next((version for name, version in resolved.items() if name.lower() == "django"),
+                              context.get('django_version') or None)
+        overlay = context.get(OVERLAY)
+        with self._lock:
+            steps, self._steps = self._steps, []
+            subprocesses, self._subprocesses = self._subprocesses, 0
+        try:
+            connection = _connect(self.path)
+            try:
+                with connection:
+                    run_id = connection.execute(
+                        "INSERT INTO runs (command, started, wall, ok, django_version, app_count, subprocesses,"
+                        " bytes_written, files_written) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (self.command, started, wall, int(ok), django_version, len(context.get('app_names') or []),
+                         subprocesses, getattr(overlay, "bytes_written", 0), getattr(overlay, "files_written", 0)),
+                    ).lastrowid
+                    connection.executemany(
+                        "INSERT INTO steps (run_id, name, wall, subprocesses, ok) VALUES (?, ?, ?, ?, ?)",
+                        [(run_id, s["name"], s["wall"], s["subprocesses"], int(s["ok"])) for s in steps],
+                    )
+            finally:
+                connection.close()
+        except (sqlite3.Error, OSError) as e:
+            # Bookkeeping must never fail the scaffold itself
+            status_tag(f"RUN NOT RECORDED IN {self.path}: {e}", symbol="⚠️", color="YELLOW")
+
+
+def run_history(command: str = "mydjango"):
+    """A RunHistory at the default location, or None when history is turned off."""
+    path = default_history_path()
+    return RunHistory(path, command) if path else None
+
+
+def load_history(path: str, since: float = None, command: str = None) -> dict:
+    """
+    Runs recorded since `since` (unix time), failed ones included, and the
+    wall times of the steps that succeeded in them:
+    {"runs": [row dicts], "steps": {step name: [seconds, ...]}}.
+    """
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"No run history at {path}")
+    connection = sqlite3.connect(path, timeout=30)
+    connection.row_factory = sqlite3.Row
+    try:
+        filters, params = ["1 = 1"], []
+        if since is not None:
+            filters.append("started >= ?")
+            params.append(since)
+        if command is not None:
+            filters.append("command = ?")
+            params.append(command)
+        where = " AND ".join(filters)
+        runs = [dict(row) for row in connection.execute(f"SELECT * FROM runs WHERE {where} ORDER BY id", params)]
+        steps = {}
+        for name, wall in connection.execute(
+                f"SELECT name, wall FROM steps WHERE ok = 1 AND run_id IN (SELECT id FROM runs WHERE {where})"
+                " ORDER BY run_id", params):
+            steps.setdefault(name, []).append(wall)
+    finally:
+        connection.close()
+    return {"runs": runs, "steps": steps}
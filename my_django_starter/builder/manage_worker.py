@@ -0,0 +1,220 @@
+# builder/manage_worker.py
+import os
+import re
+import ast
+import json
+import queue
+import atexit
+import hashlib
+import threading
+import subprocess
+import time
+from my_django_starter.animations.terminal_fx import command_output
+from .commands import CommandResult, DEFAULT_TIMEOUT, OUTPUT_TAIL_LINES, get_command_runner
+
+# Runs inside the project's venv, so it may only use the standard library and
+# Django. Replies go out on a private copy of stdout; anything the commands
+# print lands on stderr, which the parent streams with a label.
+WORKER_SOURCE = r'''
+import io, os, sys, json, importlib, traceback
+protocol = os.fdopen(os.dup(1), "w", buffering=1)
+os.dup2(2, 1)
+sys.path.insert(0, os.getcwd())
+import django
+django.setup()
+from django.conf import settings
+from django.core.management import CommandError, call_command
+from django.db import connections
+protocol.write(json.dumps({"ready": True, "django_version": django.get_version()}) + "\n")
+for line in sys.stdin:
+    request = json.loads(line)
+    saved = {key: os.environ.get(key) for key in request["env"]}
+    os.environ.update(request["env"])
+    output = io.StringIO()
+    try:
+        importlib.invalidate_caches()
+        call_command(*request["argv"], stdout=output, stderr=output)
+        reply = {"returncode": 0}
+    except SystemExit as exc:
+        reply = {"returncode": exc.code if isinstance(exc.code, int) else 1}
+    except CommandError as exc:
+        output.write("CommandError: %s\n" % exc)
+        reply = {"returncode": getattr(exc, "returncode", 1)}
+    except Exception:
+        output.write(traceback.format_exc())
+        reply = {"returncode": 1}
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+    reply["output"] = output.getvalue()
+    protocol.write(json.dumps(reply) + "\n")
+connections.close_all()
+'''
+
+_SETTINGS_MODULE = re.compile(r"""DJANGO_SETTINGS_MODULE['"]\s*,\s*['"]([\w.]+)['"]""")
+
+
+def settings_module(project_path: str) -> str:
+    """The settings module manage.py points at."""
+    with open(os.path.join(project_path, "manage.py")) as f:
+        match = _SETTINGS_MODULE.search(f.read())
+    if not match:
+        raise RuntimeError(f"DJANGO_SETTINGS_MODULE not found in {project_path}/manage.py")
+    return match.group(1)
+
+
+def installed_apps_key(settings_path: str):
+    """
+    INSTALLED_APPS as a tuple when settings.py spells it out literally,
+    otherwise a hash of the whole file (so any edit counts as a change).
+    """
+    with open(settings_path, "rb") as f:
+        source = f.read()
+    try:
+        for node in ast.parse(source).body:
+            if isinstance(node, ast.Assign) and any(getattr(t, "id", None) == "INSTALLED_APPS" for t in node.targets):
+                return tuple(ast.literal_eval(node.value))
+    except (SyntaxError, ValueError):
+        pass
+    return hashlib.sha1(source).hexdigest()
+
+
+class ManageWorker:
+    """
+    One interpreter in the project's venv with Django set up once; management
+    commands are sent to it over a pipe and run with `call_command`. The
+    worker is restarted only when INSTALLED_APPS changes.
+    """
+
+    def __init__(self, python_cmd: str, project_path: str, default_timeout: float = DEFAULT_TIMEOUT):
+        self.python_cmd = python_cmd
+        self.project_path = project_path
+        self.default_timeout = default_timeout
+        self.settings_module = settings_module(project_path)
+        self.settings_path = os.path.join(project_path, *self.settings_module.split(".")) + ".py"
+        self.django_version = None
+        self.starts = 0
+        self._process = None
+        self._apps_key = None
+        self._replies = None
+        self._stderr = []
+        self._label = "manage"
+        self._caller = None
+        self._lock = threading.Lock()
+
+    # ---------------------- lifecycle ---------------------- #
+
+    def _start(self):
+        env = os.environ.copy()
+        env["DJANGO_SETTINGS_MODULE"] = self.settings_module
+        env["PYTHONUNBUFFERED"] = "1"
+        self._apps_key = installed_apps_key(self.settings_path)
+        self._stderr = []
+        self._replies = queue.Queue()
+        self._process = subprocess.Popen(
+            [self.python_cmd, "-c", WORKER_SOURCE], cwd=self.project_path, env=env,
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+        )
+        threading.Thread(target=self._read_replies, args=(self._process, self._replies), daemon=True).start()
+        threading.Thread(target=self._read_stderr, args=(self._process,), daemon=True).start()
+        self.starts += 1
+
+        try:
+            reply = self._replies.get(timeout=self.default_timeout)
+        except queue.Empty:
+            reply = None
+        if reply is None or not reply.get("ready"):
+            self.stop()
+            raise subprocess.CalledProcessError(1, [self.python_cmd, "manage.py"], output="".join(self._stderr))
+        self.django_version = reply.get("django_version")
+
+    def stop(self):
+        process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+            process.wait(timeout=10)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+
+    def _read_replies(self, process, replies):
+        for line in process.stdout:
+            replies.put(json.loads(line))
+        replies.put(None)
+
+    def _read_stderr(self, process):
+        for line in process.stderr:
+            self._stderr.append(line)
+            command_output(self._label, [line.rstrip()], self._caller)
+
+    # ---------------------- public API ---------------------- #
+
+    def call(self, argv: list, label: str = None, env: dict = None, timeout: float = None,
+             check: bool = True, capture: bool = False) -> CommandResult:
+        """Run `manage.py <argv>` in the worker; mirrors CommandRunner.run."""
+        label = label or argv[0]
+        result = CommandResult(["manage.py"] + list(argv), label, threading.get_ident())
+        timeout = self.default_timeout if timeout is None else timeout
+
+        with self._lock:
+            if self._process is not None and (self._process.poll() is not None
+                                              or installed_apps_key(self.settings_path) != self._apps_key):
+                self.stop()
+            if self._process is None:
+                self._start()
+
+            self._label, self._caller = label, result.caller
+            result.start = time.perf_counter()
+            self._process.stdin.write(json.dumps({"argv": [str(arg) for arg in argv], "env": env or {}}) + "\n")
+            self._process.stdin.flush()
+            try:
+                reply = self._replies.get(timeout=timeout)
+            except queue.Empty:
+                reply = None
+                result.timed_out = True
+            result.duration = time.perf_counter() - result.start
+
+            if reply is None:
+                result.returncode = self._process.poll() or 1
+                result.output = "".join(self._stderr)
+                self.stop()
+            else:
+                result.returncode = reply["returncode"]
+                result.output = reply["output"]
+            self._label, self._caller = "manage", None
+
+        lines = result.output.splitlines()
+        if not capture and reply is not None and lines:
+            command_output(label, lines, result.caller)
+        result.tail = lines[-OUTPUT_TAIL_LINES:]
+        get_command_runner().record(result)
+        if check:
+            result.check()
+        return result
+
+
+_workers = {}
+_workers_lock = threading.Lock()
+
+
+def get_manage_worker(python_cmd: str, project_path: str) -> ManageWorker:
+    """The worker for this project, started lazily on first call."""
+    key = (os.path.abspath(python_cmd), os.path.realpath(project_path))
+    with _workers_lock:
+        if key not in _workers:
+            _workers[key] = ManageWorker(python_cmd, project_path)
+        return _workers[key]
+
+
+@atexit.register
+def shutdown_workers():
+    with _workers_lock:
+        workers = list(_workers.values())
+        _workers.clear()
+    for worker in workers:
+        worker.stop()
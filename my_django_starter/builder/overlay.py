@@ -0,0 +1,231 @@
+# builder/overlay.py
+import os
+import base64
+import shutil
+import tempfile
+import threading
+
+OVERLAY = "overlay"  # context key
+
+_umask = None
+_umask_lock = threading.Lock()
+
+
+def current_umask() -> int:
+    """The process umask, looked up once, the first time a new project directory needs it."""
+    global _umask
+    with _umask_lock:
+        if _umask is None:
+            try:
+                # Linux shows it without changing it
+                with open("/proc/self/status") as f:
+                    _umask = next(int(line.split()[1], 8) for line in f if line.startswith("Umask:"))
+            except (OSError, StopIteration, ValueError):
+                # Elsewhere it can only be read by setting it
+                _umask = os.umask(0o077)
+                os.umask(_umask)
+        return _umask
+
+
+def _open(path: str, content):
+    """str is written as UTF-8 text, bytes as-is."""
+    if isinstance(content, str):
+        return open(path, "w", encoding="utf-8")
+    return open(path, "wb")
+
+
+def _write(path: str, content, mode: int = None) -> int:
+    """Write one file and fsync it."""
+    with _open(path, content) as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    if mode is not None:
+        os.chmod(path, mode)
+    return len(content)
+
+
+def _fsync_dir(path: str):
+    if os.name == "nt":  # directories can't be opened for fsync on Windows
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class DirectFS:
+    """Same interface as Overlay, writing straight to disk (used outside a pipeline run)."""
+
+    def makedirs(self, path: str):
+        os.makedirs(path, exist_ok=True)
+
+    def write(self, path: str, content, mode: int = None):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with _open(path, content) as f:
+            f.write(content)
+        if mode is not None:
+            os.chmod(path, mode)
+
+    def exists(self, path: str) -> bool:
+        return os.path.exists(path)
+
+    def read(self, path: str) -> str:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+
+
+class Overlay(DirectFS):
+    """
+    Buffers every file and directory a run generates under `root` in memory.
+    commit() writes them into a staging directory next to `root`, fsyncs them
+    in one pass and moves them into place: a single os.rename of the whole
+    tree when `root` doesn't exist yet, os.replace file by file when it does.
+    Nothing reaches `root` before commit(), so a failed run leaves no
+    half-written project behind.
+    """
+
+    def __init__(self, root: str):
+        self.root = os.path.abspath(root)
+        self.bytes_written = 0
+        self.files_written = 0
+        self._files = {}  # absolute path -> (content, mode)
+        self._dirs = set()
+        self._lock = threading.Lock()
+
+    def _inside(self, path: str) -> str:
+        path = os.path.abspath(path)
+        if path != self.root and not path.startswith(self.root + os.sep):
+            raise ValueError(f"'{path}' is outside the project at '{self.root}'")
+        return path
+
+    def _add_parents(self, path: str):
+        while path != self.root and path not in self._dirs:
+            self._dirs.add(path)
+            path = os.path.dirname(path)
+
+    # ---------------------- filesystem interface ---------------------- #
+
+    def makedirs(self, path: str):
+        path = self._inside(path)
+        with self._lock:
+            self._add_parents(path)
+
+    def write(self, path: str, content, mode: int = None):
+        path = self._inside(path)
+        with self._lock:
+            self._add_parents(os.path.dirname(path))
+            self._files[path] = (content, mode)
+
+    def exists(self, path: str) -> bool:
+        path = os.path.abspath(path)
+        with self._lock:
+            if path in self._files or path in self._dirs or (path == self.root and (self._files or self._dirs)):
+                return True
+        return os.path.exists(path)
+
+    def read(self, path: str) -> str:
+        path = os.path.abspath(path)
+        with self._lock:
+            entry = self._files.get(path)
+        if entry is None:
+            return super().read(path)
+        content = entry[0]
+        return content if isinstance(content, str) else content.decode("utf-8")
+
+    # ---------------------- checkpoints ---------------------- #
+
+    def snapshot(self) -> dict:
+        """The pending files and directories as plain JSON (binary files base64-encoded)."""
+        with self._lock:
+            files = {}
+            for path, (content, mode) in self._files.items():
+                if isinstance(content, str):
+                    files[path] = {"text": content, "mode": mode}
+                else:
+                    files[path] = {"base64": base64.b64encode(content).decode("ascii"), "mode": mode}
+            return {"root": self.root, "dirs": sorted(self._dirs), "files": files}
+
+    @classmethod
+    def restore(cls, snapshot: dict) -> "Overlay":
+        """An overlay holding what `snapshot` held, ready to be committed."""
+        overlay = cls(snapshot["root"])
+        overlay._dirs = set(snapshot.get("dirs") or ())
+        for path, entry in (snapshot.get("files") or {}).items():
+            content = entry["text"] if "text" in entry else base64.b64decode(entry["base64"])
+            overlay._files[path] = (content, entry.get("mode"))
+        return overlay
+
+    # ---------------------- commit ---------------------- #
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._files) + len(self._dirs)
+
+    def discard(self):
+        with self._lock:
+            self._files.clear()
+            self._dirs.clear()
+
+    def commit(self) -> int:
+        """Move everything buffered so far onto disk; returns the number of files written."""
+        with self._lock:
+            files, dirs = dict(self._files), set(self._dirs)
+            self._files.clear()
+            self._dirs.clear()
+        if not files and not dirs:
+            return 0
+
+        parent = os.path.dirname(self.root)
+        os.makedirs(parent, exist_ok=True)
+        staging = tempfile.mkdtemp(prefix=f".{os.path.basename(self.root)}.staging-", dir=parent)
+        relocate = lambda path: staging + path[len(self.root):]
+        try:
+            for directory in sorted(dirs):
+                os.makedirs(relocate(directory), exist_ok=True)
+            written = 0
+            for path, (content, mode) in files.items():
+                written += _write(relocate(path), content, mode)
+            for directory in sorted(dirs, reverse=True) + [staging]:
+                _fsync_dir(directory if directory == staging else relocate(directory))
+
+            if not os.path.exists(self.root):
+                # mkdtemp creates 0700; give the project the usual permissions
+                os.chmod(staging, 0o777 & ~current_umask())
+                os.rename(staging, self.root)
+            else:
+                for directory in sorted(dirs):
+                    os.makedirs(directory, exist_ok=True)
+                for path in files:
+                    os.replace(relocate(path), path)
+                shutil.rmtree(staging)
+            _fsync_dir(parent)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        self.bytes_written += written
+        self.files_written += len(files)
+        return len(files)
+
+
+_overlay_lock = threading.Lock()
+
+
+def project_fs(context: dict) -> Overlay:
+    """The overlay for the current project, created on first use."""
+    project_path = context.get("project_path")
+    if not project_path:
+        raise ValueError("Required context data (project_path) missing!")
+    with _overlay_lock:
+        overlay = context.get(OVERLAY)
+        if isinstance(overlay, dict):
+            # Restored from a checkpoint: the files that were not on disk yet
+            overlay = Overlay.restore(overlay)
+            context[OVERLAY] = overlay
+        if not isinstance(overlay, Overlay) or overlay.root != os.path.abspath(project_path):
+            overlay = Overlay(project_path)
+            context[OVERLAY] = overlay
+        return overlay
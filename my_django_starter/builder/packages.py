@@ -0,0 +1,141 @@
+# builder/packages.py
+import os
+import re
+import glob
+import json
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from email.parser import HeaderParser
+from .commands import get_command_runner
+from .wheelhouse import install_args, normalize
+
+# Versions already in the form pip freeze prints (PEP 440 normal form, no epoch)
+_CANONICAL_VERSION = re.compile(r"^\d+(\.\d+)*((a|b|rc)\d+)?(\.post\d+)?(\.dev\d+)?(\+[a-z0-9]+(\.[a-z0-9]+)*)?$")
+
+
+def register_packages(context: dict, steps: list) -> list:
+    """Collect the `packages` every step declares into context['packages']."""
+    packages = context.setdefault('packages', [])
+    for step in steps:
+        for package in getattr(step, 'packages', ()):
+            if package not in packages:
+                packages.append(package)
+    return packages
+
+
+def _read_report(report_path: str) -> dict:
+    try:
+        with open(report_path) as f:
+            report = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return {item["metadata"]["name"]: item["metadata"]["version"] for item in report.get("install", [])}
+
+
+def install_packages(pip_cmd: str, packages: list, context: dict, label: str = "pip") -> dict:
+    """
+    Resolve and install `packages` with a single pip invocation. Returns the
+    {name: version} map of what pip installed, taken from its --report, so the
+    caller never needs a separate `pip freeze`.
+    """
+    args = [pip_cmd, "install", *install_args(context, packages)]
+    handle, report_path = tempfile.mkstemp(prefix="pip-report-", suffix=".json")
+    os.close(handle)
+    try:
+        runner = get_command_runner()
+        result = runner.run(args + ["--report", report_path, *packages], label=label, check=False)
+        if result.returncode != 0 and "no such option: --report" in result.output:
+            # pip < 22.2: install anyway; the requirements fall back to pip freeze.
+            runner.run(args + list(packages), label=label)
+            return {}
+        result.check()
+        return _read_report(report_path)
+    finally:
+        os.remove(report_path)
+
+
+def format_requirements(resolved: dict) -> str:
+    """Pinned lines ordered like `pip freeze` (case-insensitive by name)."""
+    return "".join(f"{name}=={resolved[name]}\n" for name in sorted(resolved, key=str.lower))
+
+
+def format_lock(resolved: dict, hashes: dict) -> str:
+    """format_requirements() with `--hash` options, for `pip install --require-hashes`."""
+    lines = []
+    for name in sorted(resolved, key=str.lower):
+        options = "".join(f" \\\n    --hash=sha256:{digest}" for digest in hashes[name])
+        lines.append(f"{name}=={resolved[name]}{options}\n")
+    return "".join(lines)
+
+
+# ---------------------- installed distributions ---------------------- #
+
+def site_packages(venv_path: str) -> list:
+    return sorted(glob.glob(os.path.join(venv_path, "lib", "python*", "site-packages"))
+                  + glob.glob(os.path.join(venv_path, "Lib", "site-packages")))
+
+
+def venv_python_version(venv_path: str) -> tuple:
+    """(major, minor) of the venv's interpreter, from pyvenv.cfg."""
+    try:
+        with open(os.path.join(venv_path, "pyvenv.cfg"), "r") as f:
+            for line in f:
+                key, _, value = line.partition("=")
+                if key.strip() in ("version", "version_info"):
+                    return tuple(int(part) for part in value.strip().split(".")[:2])
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _read_metadata(dist_info: str) -> tuple:
+    """(Name, Version, installed from a URL?) from a .dist-info directory."""
+    with open(os.path.join(dist_info, "METADATA"), "r", encoding="utf-8", errors="replace") as f:
+        header = []
+        for line in f:  # the body (long description) can be large; stop at the headers
+            if not line.strip():
+                break
+            header.append(line)
+    metadata = HeaderParser().parsestr("".join(header))
+    direct_url = os.path.exists(os.path.join(dist_info, "direct_url.json"))
+    return metadata.get("Name"), metadata.get("Version"), direct_url
+
+
+def installed_distributions(venv_path: str, include_all: bool = False) -> dict:
+    """
+    {name: version} of what is installed in the venv, read straight from the
+    .dist-info metadata (no pip, no subprocess). Like `pip freeze` it leaves out
+    pip itself, plus setuptools, wheel and distribute before Python 3.12.
+    Returns None where pip freeze would print something else: legacy
+    .egg-info/.egg-link installs, URL or editable installs, duplicate or
+    unreadable metadata, non-normalized versions.
+    """
+    directories = site_packages(venv_path)
+    legacy = ("*.egg-info", "*.egg-link", "*.egg")
+    if not directories or any(glob.glob(os.path.join(d, pattern)) for d in directories for pattern in legacy):
+        return None
+    dist_infos = [path for d in directories for path in glob.glob(os.path.join(d, "*.dist-info"))]
+    try:
+        with ThreadPoolExecutor(max_workers=min(8, len(dist_infos) or 1)) as pool:
+            found = list(pool.map(_read_metadata, dist_infos))
+    except OSError:
+        return None
+
+    hidden = {"pip"}
+    python_version = venv_python_version(venv_path)
+    if include_all:
+        hidden = set()
+    elif python_version is None or python_version < (3, 12):
+        hidden |= {"setuptools", "wheel", "distribute"}
+
+    installed, seen = {}, set()
+    for name, version, direct_url in found:
+        if not name or not version or direct_url or not _CANONICAL_VERSION.match(version):
+            return None
+        key = normalize(name)
+        if key in seen:
+            return None
+        seen.add(key)
+        if key not in hidden:
+            installed[name] = version
+    return installed
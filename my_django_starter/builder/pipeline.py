@@ -1,20 +1,192 @@
 # my_django_starter/builder/pipeline.py
+import threading
+from functools import partial
+from contextlib import ExitStack
+from concurrent.futures import ThreadPoolExecutor
 from .base import Step
-from my_django_starter.animations.terminal_fx import status_tag, type_writer
+from .documents import commit_project
+from .packages import register_packages
+from my_django_starter.animations.terminal_fx import live_view, prompting, status_tag, step_progress
+
+
+def _declared(step: Step) -> bool:
+    return step.reads is not None and step.writes is not None
+
+
+def build_dependencies(steps: list[Step]) -> list[set]:
+    """
+    Work out, for every step, the indices of the earlier steps it must wait for.
+    A step waits for an earlier one when either writes a key the other touches
+    (read-after-write, write-after-read, write-after-write), so the outcome is
+    the same as running the list in order. Undeclared steps act as barriers.
+    """
+    deps = []
+    for j, step in enumerate(steps):
+        wait_for = set()
+        for i in range(j):
+            earlier = steps[i]
+            if not _declared(step) or not _declared(earlier):
+                wait_for.add(i)
+                continue
+            reads_j, writes_j = set(step.reads), set(step.writes)
+            reads_i, writes_i = set(earlier.reads), set(earlier.writes)
+            if writes_i & (reads_j | writes_j) or reads_i & writes_j:
+                wait_for.add(i)
+        deps.append(wait_for)
+    return deps
+
+
+def _runs_inline(step: Step) -> bool:
+    # Prompts and barrier steps (e.g. ServerRunner waiting for Ctrl+C) stay on
+    # the main thread, which is the only one that sees KeyboardInterrupt.
+    return not _declared(step) or "stdin" in step.writes
+
 
 class Pipeline:
-    def __init__(self, steps: list[Step]):
+    def __init__(self, steps: list[Step], max_workers: int = 4, tracer=None, checkpoint=None, history=None,
+                 profiler=None):
+        # Steps mostly wait on subprocesses and disk, so the pool size is not
+        # tied to the CPU count. max_workers=1 restores strictly serial runs.
         self.steps = steps
+        self.max_workers = max_workers
+        self.tracer = tracer
+        self.checkpoint = checkpoint
+        self.history = history
+        self.profiler = profiler
+
+    @property
+    def step_names(self) -> list[str]:
+        return [step.__class__.__name__ for step in self.steps]
+
+    def invalidate(self, completed: set, keys: list) -> set:
+        """
+        Drop the steps that produced `keys` from `completed`, together with
+        every step that (transitively) depends on them, so they run again.
+        """
+        deps = build_dependencies(self.steps)
+        stale = {
+            index for index, step in enumerate(self.steps)
+            if step.writes and set(step.writes) & set(keys)
+        }
+        for index in range(len(self.steps)):
+            if deps[index] & stale:
+                stale.add(index)
+        return set(completed) - stale
 
-    def build_all(self, context: dict):
+    def build_all(self, context: dict, completed=None):
         """
-        Execute each step in the pipeline, passing the context.
+        Execute the steps, passing the shared context.
+        Independent steps run concurrently on a thread pool; a step starts as
+        soon as every step it depends on has finished. Indices in `completed`
+        are treated as already done (used when resuming from a checkpoint).
         Stop and report if any step fails.
         """
-        for step in self.steps:
-            try:
+        done = set(completed or ())
+        register_packages(context, self.steps)
+        with ExitStack() as stack:
+            if self.history is not None:
+                stack.enter_context(self.history.run(context))
+            with live_view(len(self.steps) - len(done)):
+                if self.tracer is None:
+                    self._schedule(context, done)
+                else:
+                    with self.tracer.activate():
+                        self._schedule(context, done)
+
+            # Generated files and settings.py/urls.py edits stay in memory until
+            # here, or until a step hands the project to Django and commits early.
+            # A failed run never gets this far, so it leaves no partial project.
+            commit_project(context)
+        if self.checkpoint is not None:
+            self.checkpoint.clear()
+
+    def _mark_done(self, index: int, done: set, context: dict):
+        done.add(index)
+        if self.checkpoint is not None:
+            self.checkpoint.save(context, done, self.step_names)
+
+    def _schedule(self, context: dict, done: set):
+        if self.max_workers == 1:
+            for index, step in enumerate(self.steps):
+                if index not in done:
+                    self._run_step(step, context)
+                    self._mark_done(index, done, context)
+            return
+
+        deps = build_dependencies(self.steps)
+        started = set(done)
+        inline = set()  # ready steps that must run on this thread
+        state = {"running": 0, "failure": None}
+        # Pool steps start their successors as they finish, so work keeps
+        # flowing while this thread sits in a prompt
+        changed = threading.Condition()
+
+        def start_ready():
+            if state["failure"] is not None:
+                return
+            for index, step in enumerate(self.steps):
+                if index in started or not deps[index] <= done:
+                    continue
+                started.add(index)
+                if _runs_inline(step):
+                    inline.add(index)
+                    continue
+                state["running"] += 1
+                future = pool.submit(self._run_step, step, context)
+                future.add_done_callback(partial(finished, index))
+
+        def finished(index, future):
+            with changed:
+                state["running"] -= 1
+                try:
+                    future.result()
+                    self._mark_done(index, done, context)
+                    start_ready()
+                except Exception as error:
+                    state["failure"] = state["failure"] or error
+                finally:
+                    changed.notify_all()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            with changed:
+                start_ready()
+            while True:
+                with changed:
+                    while not (inline and state["failure"] is None) and state["running"]:
+                        changed.wait()
+                    if not inline or state["failure"] is not None:
+                        break
+                    index = min(inline)
+                    inline.discard(index)
+                try:
+                    self._run_step(self.steps[index], context)
+                except Exception as error:
+                    with changed:
+                        state["failure"] = state["failure"] or error
+                    continue
+                with changed:
+                    self._mark_done(index, done, context)
+                    start_ready()
+
+        if state["failure"] is not None:
+            raise state["failure"]
+
+    def _run_step(self, step: Step, context: dict):
+        name = step.__class__.__name__
+        try:
+            with ExitStack() as stack:
+                if self.profiler is not None:
+                    # First, so waiting for another profiled step is not counted as this one's time
+                    stack.enter_context(self.profiler.step(step, context))
+                # Barrier steps may own the terminal (the server), so they get it unshared
+                stack.enter_context(step_progress(name, exclusive=not _declared(step)))
+                if _declared(step) and "stdin" in step.writes:
+                    stack.enter_context(prompting())
+                if self.tracer is not None:
+                    stack.enter_context(self.tracer.step(name))
+                if self.history is not None:
+                    stack.enter_context(self.history.step(name))
                 step.execute(context) # Passes the same context to all steps
-            except Exception as e:
-                status_tag(f"Pipeline failed at {step.__class__.__name__}: {str(e)}", symbol="❌", color="RED")
-                raise
- 
+        except Exception as e:
+            status_tag(f"Pipeline failed at {name}: {str(e)}", symbol="❌", color="RED")
+            raise
@@ -0,0 +1,132 @@
+# builder/profiling.py
+import io
+import os
+import sys
+import time
+import pstats
+import cProfile
+import threading
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from .base import Step
+
+PROFILE_DIR = "mydjango-profile"
+# From 3.12 cProfile runs on sys.monitoring, which allows one active profiler
+# per process, so profiled steps have to take turns there.
+_ONE_PROFILER = sys.version_info >= (3, 12)
+
+
+def _delta(before, after):
+    if isinstance(before, (int, float)) and isinstance(after, (int, float)) and not isinstance(after, bool):
+        return after - before
+    return after
+
+
+class StepProfiler:
+    """
+    Runs selected steps under cProfile and tracemalloc. For each one it writes
+    `<Step>.prof` (for pstats, snakeviz, ...) and `<Step>.txt`, which lists the
+    step's counters, its slowest functions and its top allocation sites.
+
+    Profiled steps overlap like any others, except on Python 3.12+, where
+    they take turns (so --profile-all runs the pipeline one step at a time).
+    tracemalloc sees the whole process: allocations and the peak of steps
+    running alongside can show up in the report. Work done in subprocesses
+    (pip, manage.py) only shows as time spent waiting.
+    """
+
+    def __init__(self, output_dir: str = PROFILE_DIR, steps=None, top: int = 20):
+        # steps=None profiles every step
+        self.output_dir = os.path.abspath(output_dir)
+        self.steps = None if steps is None else set(steps)
+        self.top = top
+        self.written = []
+        self._lock = threading.Lock()  # tracemalloc start/stop and snapshots
+        self._turn = threading.Lock()  # held for a whole step where cProfile needs it
+        self._tracing = 0  # profiled steps running
+        self._started_tracing = False
+
+    def selects(self, name: str) -> bool:
+        return self.steps is None or name in self.steps
+
+    def check(self, step_names: list):
+        """Reject step names that are not in the pipeline, before anything runs."""
+        unknown = sorted((self.steps or set()) - set(step_names))
+        if unknown:
+            raise ValueError(f"no step named {', '.join(unknown)} (steps: {', '.join(step_names)})")
+
+    @contextmanager
+    def step(self, step: Step, context: dict):
+        name = step.__class__.__name__
+        if not self.selects(name):
+            yield
+            return
+
+        with self._turn if _ONE_PROFILER else nullcontext():
+            counters = step.counters(context)
+            before = self._start_tracing()
+            profile = cProfile.Profile()
+            wall, cpu = time.perf_counter(), time.thread_time()
+            ok = False
+            profile.enable()
+            try:
+                yield
+                ok = True
+            finally:
+                profile.disable()
+                wall, cpu = time.perf_counter() - wall, time.thread_time() - cpu
+                after, peak = self._stop_tracing()
+                after_counters = step.counters(context)
+                counters = {key: _delta(counters.get(key), value) for key, value in after_counters.items()}
+                counters = {"ok": ok, "wall_seconds": round(wall, 6), "cpu_seconds": round(cpu, 6),
+                            "peak_traced_bytes": peak, **counters}
+                # Leave out the memory held by the `before` snapshot itself
+                ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+                allocations = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), "lineno")
+                self._write(name, profile, allocations, counters)
+
+    def _start_tracing(self):
+        """Start tracemalloc for the first profiled step running; returns the `before` snapshot."""
+        with self._lock:
+            if self._tracing == 0:
+                self._started_tracing = not tracemalloc.is_tracing()
+                if self._started_tracing:
+                    tracemalloc.start()
+                tracemalloc.reset_peak()
+            self._tracing += 1
+            return tracemalloc.take_snapshot()
+
+    def _stop_tracing(self):
+        """The `after` snapshot and peak; stops tracemalloc after the last profiled step."""
+        with self._lock:
+            after = tracemalloc.take_snapshot()
+            peak = tracemalloc.get_traced_memory()[1]
+            self._tracing -= 1
+            if self._tracing == 0 and self._started_tracing:
+                tracemalloc.stop()
+            return after, peak
+
+    def _write(self, name: str, profile: cProfile.Profile, allocations: list, counters: dict):
+        os.makedirs(self.output_dir, exist_ok=True)
+        prof_path = os.path.join(self.output_dir, f"{name}.prof")
+        profile.dump_stats(prof_path)
+
+        functions = io.StringIO()
+        pstats.Stats(profile, stream=functions).strip_dirs().sort_stats("cumulative").print_stats(self.top)
+
+        lines = [f"# {name}", ""]
+        lines += [f"{key:<24}{value}" for key, value in counters.items()]
+        lines += ["", f"## Top {self.top} functions by cumulative time", functions.getvalue().strip(), ""]
+        lines += [f"## Top {self.top} allocation sites (net, while the step ran)"]
+        grown = [stat for stat in allocations if stat.size_diff > 0][:self.top]
+        for stat in grown:
+            frame = stat.traceback[0]
+            lines.append(f"{stat.size_diff / 1024:>10.1f} KiB {stat.count_diff:>+8} blocks  "
+                         f"{frame.filename}:{frame.lineno}")
+        if not grown:
+            lines.append("(none)")
+
+        report_path = os.path.join(self.output_dir, f"{name}.txt")
+        with open(report_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        self.written.append((name, prof_path, report_path))
@@ -0,0 +1,40 @@
+# builder/registry.py
+from importlib import import_module
+
+# Step name -> module that defines it. A step's module (and whatever it pulls
+# in: pyfiglet, asyncio, http.client ...) is imported only when a pipeline
+# that uses the step is built, so `mydjango --help`, `mydjango cache ...` and
+# argument errors start without it.
+STEPS = {
+    "Banner": "my_django_starter.modules.banner.banner",
+    "OSDetector": "my_django_starter.modules.os_detector.os_detector",
+    "VirtualEnvCreator": "my_django_starter.modules.virtualenv_creator.virtualenv_creator",
+    "DjangoInstaller": "my_django_starter.modules.django_installer.django_installer",
+    "ProjectCreator": "my_django_starter.modules.project_creator.project_creator",
+    "AppCreator": "my_django_starter.modules.app_creator.app_creator",
+    "SettingsModifier": "my_django_starter.modules.settings_modifier.settings_modifier",
+    "EnvManager": "my_django_starter.modules.env_manager.env_manager",
+    "RequirementsGenerator": "my_django_starter.modules.requirements_generator.requirements_generator",
+    "HomePageRenderer": "my_django_starter.modules.home_page_renderer.home_page_renderer",
+    "MediaFileHandler": "my_django_starter.modules.media_file_handler.media_file_handler",
+    "MigrationManager": "my_django_starter.modules.migration_manager.migration_manager",
+    "AdminSetup": "my_django_starter.modules.create_superuser.create_superuser",
+    "ServerRunner": "my_django_starter.modules.server_runner.server_runner",
+}
+
+
+def register_step(name: str, module: str):
+    """Make a Step subclass called `name`, defined in `module`, available to create_step."""
+    STEPS[name] = module
+
+
+def step_module(name: str):
+    """Import and return the module that defines step `name` (and its strategies)."""
+    if name not in STEPS:
+        raise ValueError(f"Unknown step '{name}' (registered: {', '.join(STEPS)})")
+    return import_module(STEPS[name])
+
+
+def create_step(name: str, *args, **kwargs):
+    """Instantiate step `name`, importing its module on first use."""
+    return getattr(step_module(name), name)(*args, **kwargs)
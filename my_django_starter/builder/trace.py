@@ -0,0 +1,110 @@
+# builder/trace.py
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+from .commands import get_command_runner
+
+
+class PipelineTracer:
+    """Collects wall, CPU and child-process time per step and per subprocess."""
+
+    def __init__(self):
+        self.events = []
+        self.steps = []
+        self._lock = threading.RLock()
+        self._origin = time.perf_counter()
+        self._tids = {}
+        self.run_wall = 0.0
+        self._active = {}  # thread ident -> record of the step running there
+
+    def _tid(self, ident: int) -> int:
+        with self._lock:
+            return self._tids.setdefault(ident, len(self._tids) + 1)
+
+    def _us(self, seconds: float) -> int:
+        return int((seconds - self._origin) * 1_000_000)
+
+    @contextmanager
+    def activate(self):
+        """Record every command run through the shared CommandRunner for the duration of a run."""
+        runner = get_command_runner()
+        runner.observers.append(self._record_command)
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.run_wall = time.perf_counter() - start
+            runner.observers.remove(self._record_command)
+
+    @contextmanager
+    def step(self, name: str):
+        record = {"name": name, "wall": 0.0, "cpu": 0.0, "children": 0.0, "processes": 0, "ok": False}
+        self._active[threading.get_ident()] = record
+        start, cpu_start = time.perf_counter(), time.thread_time()
+        try:
+            yield record
+            record["ok"] = True
+        finally:
+            end = time.perf_counter()
+            record["wall"] = end - start
+            record["cpu"] = time.thread_time() - cpu_start
+            self._active.pop(threading.get_ident(), None)
+            with self._lock:
+                self.steps.append(record)
+                self.events.append({
+                    "name": name, "cat": "step", "ph": "X",
+                    "ts": self._us(start), "dur": int(record["wall"] * 1_000_000),
+                    "pid": os.getpid(), "tid": self._tid(threading.get_ident()),
+                    "args": {
+                        "cpu_s": round(record["cpu"], 6),
+                        "children_cpu_s": round(record["children"], 6),
+                        "subprocesses": record["processes"],
+                        "ok": record["ok"],
+                    },
+                })
+
+    def _record_command(self, result):
+        """Observer for commands run through the shared CommandRunner."""
+        step = self._active.get(result.caller)
+        with self._lock:
+            if step is not None:
+                step["children"] += result.children_cpu
+                step["processes"] += 1
+            self.events.append({
+                "name": result.label, "cat": "subprocess", "ph": "X",
+                "ts": self._us(result.start), "dur": int(result.duration * 1_000_000),
+                "pid": os.getpid(), "tid": self._tid(result.caller),
+                "args": {
+                    "command": result.command,
+                    "step": step["name"] if step else None,
+                    "returncode": result.returncode,
+                    "timed_out": result.timed_out,
+                    "children_cpu_s": round(result.children_cpu, 6),
+                },
+            })
+
+    def summary(self) -> str:
+        """Render a plain-text table of per-step timings."""
+        header = f"{'STEP':<24}{'WALL s':>10}{'CPU s':>10}{'CHILD s':>10}{'PROCS':>7}  STATUS"
+        rows = [header, "-" * len(header)]
+        for record in self.steps:
+            rows.append(
+                f"{record['name']:<24}{record['wall']:>10.3f}{record['cpu']:>10.3f}"
+                f"{record['children']:>10.3f}{record['processes']:>7}  {'ok' if record['ok'] else 'FAILED'}"
+            )
+        total = sum(record["wall"] for record in self.steps)
+        rows.append("-" * len(header))
+        rows.append(f"{'TOTAL (sum of steps)':<24}{total:>10.3f}")
+        rows.append(f"{'PIPELINE WALL':<24}{self.run_wall:>10.3f}")
+        return "\n".join(rows) + "\n"
+
+    def export(self, path: str) -> str:
+        """Write a Chrome/Perfetto trace to `path` and the summary table next to it."""
+        with open(path, "w") as f:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, f, indent=1)
+        summary_path = os.path.splitext(path)[0] + ".txt"
+        with open(summary_path, "w") as f:
+            f.write(self.summary())
+        return summary_path
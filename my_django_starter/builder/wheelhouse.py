@@ -0,0 +1,140 @@
+# builder/wheelhouse.py
+import os
+import re
+import sys
+import time
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from .commands import get_command_runner
+
+
+def cache_root() -> str:
+    """Root of everything my-django-starter caches between runs."""
+    root = os.environ.get("MYDJANGO_CACHE_DIR")
+    if root:
+        return root
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "my-django-starter")
+
+
+def normalize(name: str) -> str:
+    return re.sub(r"[-_.]+", "_", name).lower()
+
+
+def parse_requirement(requirement: str) -> tuple[str, str]:
+    """'django==5.0' -> ('django', '5.0'); 'python-decouple' -> ('python_decouple', None)."""
+    name, _, version = requirement.partition("==")
+    return normalize(name.strip()), (version.strip() or None)
+
+
+def parse_wheel(filename: str) -> tuple[str, str]:
+    name, version = filename.split("-")[:2]
+    return normalize(name), version
+
+
+class Wheelhouse:
+    """
+    A local directory of wheels that pip can install from without touching
+    the package index (`--no-index --find-links`).
+    """
+
+    def __init__(self, path: str = None):
+        self.path = os.path.abspath(path or os.environ.get("MYDJANGO_WHEELHOUSE") or os.path.join(cache_root(), "wheels"))
+
+    def wheels(self) -> list[dict]:
+        if not os.path.isdir(self.path):
+            return []
+        found = []
+        for filename in sorted(os.listdir(self.path)):
+            if not filename.endswith(".whl"):
+                continue
+            full = os.path.join(self.path, filename)
+            name, version = parse_wheel(filename)
+            stat = os.stat(full)
+            found.append({"file": filename, "name": name, "version": version,
+                          "size": stat.st_size, "mtime": stat.st_mtime})
+        return found
+
+    def has(self, requirement: str) -> bool:
+        name, version = parse_requirement(requirement)
+        return any(wheel["name"] == name and (version is None or wheel["version"] == version)
+                   for wheel in self.wheels())
+
+    def missing(self, requirements: list) -> list:
+        return [requirement for requirement in requirements if not self.has(requirement)]
+
+    def _sha256(self, filename: str) -> str:
+        digest = hashlib.sha256()
+        with open(os.path.join(self.path, filename), "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def hashes(self, resolved: dict) -> dict:
+        """
+        sha256 of every cached wheel of each pinned {name: version}, as
+        {name: [digest, ...]}; names with no wheel here are left out.
+        """
+        wanted = {(normalize(name), version): name for name, version in resolved.items()}
+        files = [(wanted[wheel["name"], wheel["version"]], wheel["file"]) for wheel in self.wheels()
+                 if (wheel["name"], wheel["version"]) in wanted]
+        with ThreadPoolExecutor(max_workers=min(8, len(files) or 1)) as pool:
+            digests = list(pool.map(self._sha256, [filename for _, filename in files]))
+        hashes = {}
+        for (name, _), digest in zip(files, digests):
+            hashes.setdefault(name, []).append(digest)
+        return {name: sorted(digests) for name, digests in hashes.items()}
+
+    def pip_args(self, requirements: list, offline: bool = False) -> list:
+        """
+        Extra `pip install` arguments. Offline mode never contacts the index
+        and fails before starting pip if a top-level wheel is absent.
+        """
+        if offline:
+            missing = self.missing(requirements)
+            if missing:
+                raise RuntimeError(
+                    f"Offline mode: no wheel for {', '.join(missing)} in {self.path} "
+                    f"(fill it with 'mydjango cache prefetch')"
+                )
+            return ["--no-index", "--find-links", self.path]
+        if os.path.isdir(self.path):
+            return ["--find-links", self.path]
+        return []
+
+    def prefetch(self, requirements: list, python_cmd: str = None):
+        """Download wheels for `requirements` (and their dependencies) for this interpreter."""
+        os.makedirs(self.path, exist_ok=True)
+        get_command_runner().run(
+            [python_cmd or sys.executable, "-m", "pip", "download", "--only-binary=:all:",
+             "--dest", self.path, *requirements],
+            label="pip download",
+        )
+
+    def prune(self, keep: int = None, older_than_days: float = None) -> list:
+        """
+        Delete wheels older than `older_than_days`, and/or all but the `keep`
+        newest versions of each project. Returns the removed file names.
+        """
+        removed = []
+        by_project = {}
+        for wheel in self.wheels():
+            by_project.setdefault(wheel["name"], []).append(wheel)
+
+        cutoff = time.time() - older_than_days * 86400 if older_than_days is not None else None
+        for wheels in by_project.values():
+            wheels.sort(key=lambda wheel: wheel["mtime"], reverse=True)
+            for index, wheel in enumerate(wheels):
+                too_old = cutoff is not None and wheel["mtime"] < cutoff
+                surplus = keep is not None and index >= keep
+                if too_old or surplus:
+                    os.remove(os.path.join(self.path, wheel["file"]))
+                    removed.append(wheel["file"])
+        return removed
+
+
+def install_args(context: dict, requirements: list) -> list:
+    """pip arguments for installing `requirements` according to the run's wheelhouse settings."""
+    if not context.get('wheelhouse') and not context.get('offline'):
+        return []
+    return Wheelhouse(context.get('wheelhouse')).pip_args(requirements, offline=bool(context.get('offline')))
@@ -0,0 +1,66 @@
+# my_django_starter/cache.py
+from my_django_starter.animations.terminal_fx import status_tag
+
+
+def add_cache_parser(commands):
+    cache = commands.add_parser("cache", help="manage the local wheelhouse used for offline installs")
+    actions = cache.add_subparsers(dest="cache_action", metavar="ACTION")
+    actions.required = True
+    actions.add_parser("list", help="show the wheels in the wheelhouse")
+    prune = actions.add_parser("prune", help="delete old wheels")
+    prune.add_argument("--keep", type=int, metavar="N", help="keep only the N newest versions of each package")
+    prune.add_argument("--older-than", type=float, metavar="DAYS", help="delete wheels older than DAYS")
+    prefetch = actions.add_parser("prefetch", help="download Django (and python-decouple) wheels")
+    prefetch.add_argument("django_versions", nargs="*", metavar="VERSION", help="Django versions (default: latest)")
+    prefetch.add_argument("--package", action="append", default=[], metavar="REQ", help="extra requirement to fetch (repeatable)")
+    prefetch.add_argument("--spec", action="append", default=[], metavar="FILE",
+                          help="also fetch what this spec installs: its Django, model packages and server (repeatable)")
+    return cache
+
+
+def _human(size: int) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+def run_cache_command(args) -> int:
+    from my_django_starter.builder.wheelhouse import Wheelhouse  # pulls in the command runner
+    from my_django_starter.spec import load_spec, spec_requirements
+
+    wheelhouse = Wheelhouse(args.wheelhouse)
+
+    if args.cache_action == "list":
+        wheels = wheelhouse.wheels()
+        if not wheels:
+            status_tag(f"WHEELHOUSE IS EMPTY: {wheelhouse.path}", color="YELLOW")
+            return 0
+        width = max(len(wheel["name"]) for wheel in wheels)
+        for wheel in wheels:
+            print(f"{wheel['name']:<{width}}  {wheel['version']:<12}  {_human(wheel['size']):>9}  {wheel['file']}")
+        print()
+        status_tag(f"{len(wheels)} WHEELS, {_human(sum(w['size'] for w in wheels))} IN {wheelhouse.path}", color="CYAN")
+        return 0
+
+    if args.cache_action == "prune":
+        if args.keep is None and args.older_than is None:
+            status_tag("Nothing to do: pass --keep N and/or --older-than DAYS", symbol="⚠️", color="YELLOW")
+            return 1
+        removed = wheelhouse.prune(keep=args.keep, older_than_days=args.older_than)
+        for filename in removed:
+            print(f"removed {filename}")
+        status_tag(f"PRUNED {len(removed)} WHEELS", symbol="✅", color="GREEN")
+        return 0
+
+    requirements = [f"django=={version}" for version in args.django_versions]
+    try:
+        for path in args.spec:
+            requirements += spec_requirements(load_spec(path))
+    except (FileNotFoundError, RuntimeError, ValueError) as e:
+        status_tag(f"INVALID SPEC: {e}", symbol="❌", color="RED")
+        return 2
+    requirements = list(dict.fromkeys((requirements or ["django"]) + ["python-decouple"] + args.package))
+    wheelhouse.prefetch(requirements)
+    status_tag(f"WHEELS FOR {', '.join(requirements)} READY IN {wheelhouse.path}", symbol="✅", color="GREEN")
+    return 0
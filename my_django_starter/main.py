@@ -1,55 +1,247 @@
 import os
-import json
-from my_django_starter.modules.banner.banner import Banner
-from my_django_starter.modules.os_detector.os_detector import OSDetector
-
-from my_django_starter.modules.virtualenv_creator.virtualenv_creator import VirtualEnvCreator
-from my_django_starter.modules.django_installer.django_installer import DjangoInstaller
-from my_django_starter.modules.project_creator.project_creator import ProjectCreator
-from my_django_starter.modules.app_creator.app_creator import AppCreator
-from my_django_starter.modules.settings_modifier.settings_modifier import SettingsModifier
-from my_django_starter.modules.env_manager.env_manager import EnvManager
-from my_django_starter.modules.migration_manager.migration_manager import MigrationManager
-from my_django_starter.modules.requirements_generator.requirements_generator import RequirementsGenerator
-from my_django_starter.modules.home_page_renderer.home_page_renderer import HomePageRenderer
-from my_django_starter.modules.media_file_handler.media_file_handler import MediaFileHandler
-from my_django_starter.modules.create_superuser.create_superuser import  AdminSetup
-from my_django_starter.modules.server_runner.server_runner import ServerRunner
- 
-from my_django_starter.builder.pipeline import Pipeline
-from my_django_starter.modules.win_path_helper.win_path_helper import ensure_cli_works
-
-def main():
-    ensure_cli_works()  # Fixes PATH automatically (Windows only)
-    
+import argparse
+from my_django_starter.animations.terminal_fx import status_tag, enable_live_view
+from my_django_starter.spec import add_spec_arguments, build_spec
+from my_django_starter.cache import add_cache_parser
+from my_django_starter.stats import add_stats_parser
+
+# Steps, the pipeline and the batch/cache machinery are imported where they
+# are used, so `mydjango --help` and argument errors answer immediately.
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="mydjango",
+        description="Scaffold and launch a Django project.",
+    )
+    parser.add_argument(
+        "--trace", metavar="OUT.json",
+        help="record per-step and per-subprocess timings as a Chrome/Perfetto trace",
+    )
+    profile = parser.add_mutually_exclusive_group()
+    profile.add_argument(
+        "--profile-steps", metavar="STEP,...",
+        help="run these steps (e.g. SettingsModifier,AppCreator) under cProfile and tracemalloc",
+    )
+    profile.add_argument(
+        "--profile-all", action="store_true",
+        help="profile every step (on Python 3.12+ this runs the steps one at a time)",
+    )
+    parser.add_argument(
+        "--profile-dir", metavar="DIR", default="mydjango-profile",
+        help="where --profile-steps/--profile-all write <Step>.prof and <Step>.txt (default: ./mydjango-profile)",
+    )
+    parser.add_argument(
+        "--resume", nargs="?", const=".", metavar="DIR",
+        help="continue a failed run from the checkpoint in DIR (default: current directory)",
+    )
+    parser.add_argument(
+        "--venv-cache", action="store_true",
+        help="clone the virtualenv (and a pinned Django) from a local template cache",
+    )
+    parser.add_argument(
+        "--offline", action="store_true",
+        help="install only from the local wheelhouse (--no-index); fail fast if a wheel is missing",
+    )
+    parser.add_argument(
+        "--wheelhouse", metavar="DIR",
+        help="wheel directory to install from (default: ~/.cache/my-django-starter/wheels)",
+    )
+    parser.add_argument(
+        "--lock", action="store_true",
+        help="also write requirements.lock with sha256 hashes of the cached wheels",
+    )
+    parser.add_argument(
+        "--server", choices=("gunicorn", "runserver", "uvicorn"),
+        help="server to launch at the end (default: runserver); gunicorn/uvicorn are installed and sized to the CPU count",
+    )
+    parser.add_argument(
+        "--preload", action="store_true",
+        help="with --server=gunicorn, import the project once before starting workers",
+    )
+    parser.add_argument(
+        "--no-server", action="store_true",
+        help="stop after setup instead of launching the development server",
+    )
+    add_spec_arguments(parser)
+
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND")
+    batch = commands.add_parser("batch", help="scaffold one project per spec file, in parallel")
+    batch.add_argument("spec_dir", help="directory containing *.toml / *.json specs")
+    batch.add_argument("-j", "--jobs", type=int, help="worker processes (default: CPU count)")
+    batch.add_argument("-o", "--output", metavar="DIR", help="where to create the projects (default: current directory)")
+    add_cache_parser(commands)
+    add_stats_parser(commands)
+    return parser
+
+
+def initial_context(spec: dict = None, offline: bool = False, wheelhouse: str = None, lock: bool = False) -> dict:
+    from my_django_starter.builder.wheelhouse import Wheelhouse
+    from my_django_starter.modules.app_creator.model_generator import model_packages
+
     # Initialize context with default project name and no apps
     context = {
         'project_name': 'testproject',
         'app_names': [],
+        'wheelhouse': Wheelhouse(wheelhouse).path,
+        'offline': offline,
+        'lock': lock or bool(spec and spec.get('lock')),
     }
+    if spec is not None:
+        context['spec'] = spec
+        # Packages the code generated from the spec's models imports
+        context['packages'] = model_packages(spec.get('models') or {})
+    return context
+
+
+def build_pipeline(tracer=None, checkpoint=None, run_server: bool = True, venv_cache: bool = False,
+                   server: str = "runserver", preload: bool = False, history=None, profiler=None):
+    from my_django_starter.builder.pipeline import Pipeline
+    from my_django_starter.builder.registry import create_step, step_module
+
+    # Checked first, so a bad server choice fails before the other steps are
+    # imported; without a server step it is not checked at all
+    server_step = None
+    if run_server:
+        server_step = create_step("ServerRunner", step_module("ServerRunner").server_strategy(server, preload=preload))
+    venv_strategy = step_module("VirtualEnvCreator").CachedVenvStrategy() if venv_cache else None
+    steps = [
+        create_step("Banner"),
+        create_step("OSDetector"),
+        create_step("VirtualEnvCreator", venv_strategy),
+        create_step("DjangoInstaller"),
+        create_step("ProjectCreator"),
+        # Need only the project, so they run on the pool while AppCreator prompts
+        create_step("EnvManager"),
+        create_step("MediaFileHandler"),
+        create_step("AppCreator"),
+        create_step("SettingsModifier"),
+        create_step("RequirementsGenerator"),
+        create_step("HomePageRenderer"),
+        create_step("MigrationManager"),
+        create_step("AdminSetup"),
+    ]
+    if server_step is not None:
+        steps.append(server_step)
+    return Pipeline(steps, tracer=tracer, checkpoint=checkpoint, history=history, profiler=profiler)
+
+
+def load_resume_state(pipeline, checkpoint, state: dict) -> tuple[dict, set]:
+    """Work out, from a loaded checkpoint, which steps still have to run."""
+    from my_django_starter.builder.checkpoint import missing_artifacts
+
+    if state["steps"] != pipeline.step_names:
+        raise RuntimeError("Checkpoint was written by a different pipeline; start a fresh run instead.")
+
+    context = state["context"]
+    completed = set(state["completed"])
+    missing = missing_artifacts(context)
+    if missing:
+        status_tag(f"OUTPUTS MISSING ({', '.join(missing)}); RE-RUNNING THE STEPS THAT CREATE THEM", symbol="⚠️", color="YELLOW")
+        completed = pipeline.invalidate(completed, missing)
+
+    if context.get('current_dir') and os.path.isdir(context['current_dir']):
+        os.chdir(context['current_dir'])
+
+    pipeline.checkpoint = checkpoint
+    status_tag(f"RESUMING AFTER {len(completed)} OF {len(pipeline.steps)} STEPS", symbol="🔁", color="CYAN")
+    return context, completed
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    from my_django_starter.modules.win_path_helper.win_path_helper import ensure_cli_works
+    ensure_cli_works()  # Fixes PATH automatically (Windows only)
+
+    if args.command == "batch":
+        from my_django_starter.batch import run_batch
+        return run_batch(args.spec_dir, jobs=args.jobs, output_dir=args.output,
+                         offline=args.offline, wheelhouse=args.wheelhouse)
+    if args.command == "cache":
+        from my_django_starter.cache import run_cache_command
+        return run_cache_command(args)
+    if args.command == "stats":
+        from my_django_starter.stats import run_stats_command
+        return run_stats_command(args)
+
+    from my_django_starter.builder.trace import PipelineTracer
+    from my_django_starter.builder.checkpoint import Checkpoint
+    from my_django_starter.builder.history import run_history
+    tracer = PipelineTracer() if args.trace else None
+    profiler = None
+    if args.profile_steps or args.profile_all:
+        from my_django_starter.builder.profiling import StepProfiler
+        steps = None if args.profile_all else [name.strip() for name in args.profile_steps.split(",") if name.strip()]
+        profiler = StepProfiler(args.profile_dir, steps=steps)  # resolves the directory now, like the trace path
+    # Resolve now: ProjectCreator changes the working directory mid-run.
+    trace_path = os.path.abspath(args.trace) if args.trace else None
+    
+    try:
+        spec = build_spec(args)
+    except (FileNotFoundError, RuntimeError, ValueError) as e:
+        status_tag(f"INVALID SPEC: {e}", symbol="❌", color="RED")
+        return 2  # bad input exits 2, like argparse's usage errors; a failed resume exits 1
+
+    options = {
+        'run_server': not args.no_server and (spec is None or spec.get('run_server', True)),
+        'server': args.server or (spec or {}).get('server') or "runserver",
+        'preload': args.preload or bool((spec or {}).get('preload')),
+        'venv_cache': args.venv_cache or bool(spec and spec.get('venv_cache')),
+        'offline': args.offline,
+        'wheelhouse': args.wheelhouse,
+    }
+    resume = None
+    if args.resume:
+        try:
+            resume = Checkpoint.load(args.resume)
+        except FileNotFoundError as e:
+            status_tag(f"CANNOT RESUME: {e}", symbol="❌", color="RED")
+            return 1
+        # Rebuild the pipeline the interrupted run used, whatever today's flags say
+        options.update(resume[1].get("options") or {})
+
+    try:
+        pipeline = build_pipeline(tracer=tracer, checkpoint=Checkpoint(options=options),
+                                  run_server=options['run_server'], venv_cache=options['venv_cache'],
+                                  server=options['server'], preload=options['preload'],
+                                  history=run_history(), profiler=profiler)
+    except ValueError as e:
+        status_tag(f"INVALID SERVER: {e}", symbol="❌", color="RED")
+        return 2
+    if profiler is not None:
+        try:
+            profiler.check(pipeline.step_names)
+        except ValueError as e:
+            status_tag(f"INVALID --profile-steps: {e}", symbol="❌", color="RED")
+            return 2
+    completed = set()
+
+    if resume is not None:
+        try:
+            context, completed = load_resume_state(pipeline, *resume)
+        except RuntimeError as e:
+            status_tag(f"CANNOT RESUME: {e}", symbol="❌", color="RED")
+            return 1
+    else:
+        context = initial_context(spec, offline=options['offline'], wheelhouse=options['wheelhouse'], lock=args.lock)
 
-    # Create pipeline
-    pipeline = Pipeline([
-        Banner(),
-        OSDetector(),
-        VirtualEnvCreator(),
-        DjangoInstaller(),
-        ProjectCreator(),
-        AppCreator(),
-        SettingsModifier(),
-        EnvManager(),
-        RequirementsGenerator(),
-        HomePageRenderer(),
-        MediaFileHandler(),
-        MigrationManager(),
-        AdminSetup(),
-        ServerRunner()
-    ])
+    if context.get('spec') is not None:
+        enable_live_view()  # nothing will prompt, so the status view can redraw freely
 
     # Execute pipeline
-    pipeline.build_all(context)
+    try:
+        pipeline.build_all(context, completed)
+    finally:
+        if tracer:
+            summary_path = tracer.export(trace_path)
+            print()
+            print(tracer.summary())
+            status_tag(f"TRACE WRITTEN TO {trace_path} (SUMMARY: {summary_path})", symbol="📊", color="CYAN")
+        if profiler and profiler.written:
+            print()
+            status_tag(f"{len(profiler.written)} STEP PROFILES WRITTEN TO {profiler.output_dir} (.prof + .txt)",
+                       symbol="📊", color="CYAN")
 
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
@@ -4,8 +4,14 @@ import shutil
 import subprocess
 from abc import ABC, abstractmethod
 from my_django_starter.builder.base import Step
+from my_django_starter.builder.documents import commit_project
+from my_django_starter.builder.manage_worker import get_manage_worker
+from my_django_starter.builder.overlay import OVERLAY, project_fs
+from my_django_starter.builder.django_templates import UnsupportedTemplate, check_module_name, load_template
 from my_django_starter.animations.terminal_fx import status_tag, type_writer
 from .constants import SERIALIZERS_PY_CONTENT, VIEWS_PY_CONTENT, URLS_PY_CONTENT, ALLOWED_APP_FILES
+from .app_generator import generate_apps
+from .model_generator import generate_model_files
 
 
 # Strategy interface
@@ -18,10 +24,28 @@ class AppCreationStrategy(ABC):
 # Strategy: Validate inputs for app creation
 class InputValidationStrategy(AppCreationStrategy):
     def perform(self, context: dict) -> None:
+        spec = context.get('spec')
+        if spec is not None:
+            context['app_names'] = self._get_spec_app_names(spec.get('apps') or [])
+            return
         total_apps = self._validate_total_apps()
         app_names = self._get_app_names(total_apps)
         context['app_names'] = app_names
 
+    def _get_spec_app_names(self, requested) -> list:
+        if not requested:
+            raise ValueError("No app names given in the spec!")
+        app_names = []
+        for app_name in requested:
+            app_name = str(app_name).strip()
+            if not re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', app_name):
+                suggested_name = re.sub(r'[^a-zA-Z0-9_]', '_', app_name).strip('_')
+                raise ValueError(f"'{app_name}' is NOT a valid Python identifier (try '{suggested_name}')")
+            if app_name in app_names:
+                raise ValueError(f"App name '{app_name}' is used more than once")
+            app_names.append(app_name)
+        return app_names
+
     def _validate_total_apps(self) -> int:
         while True:
             total_apps = input("5) TOTAL APPS TO CREATE : ").strip()
@@ -72,7 +96,7 @@ class InputValidationStrategy(AppCreationStrategy):
         return app_names
 
 
-# Strategy: Create Django app using subprocess
+# Strategy: Create Django app with startapp in the manage.py worker
 class SubprocessAppCreationStrategy(AppCreationStrategy):
     def perform(self, context: dict) -> None:
         venv_path = context.get('venv_path')
@@ -83,18 +107,19 @@ class SubprocessAppCreationStrategy(AppCreationStrategy):
         if not venv_path or not project_path or not app_names:
             raise ValueError("❌ Required context missing: venv_path, project_path, or app_names!")
 
-        manage_py = os.path.join(project_path, "manage.py")
         python_cmd = f"{venv_path}/Scripts/python" if "windows" in os_name else f"{venv_path}/bin/python"
+        commit_project(context)  # startapp needs manage.py and settings.py on disk
+        worker = get_manage_worker(python_cmd, project_path)
 
-        for app_name in app_names:
-            type_writer(f"[🔧 CREATING APP '{app_name.upper()}'...]", color="CYAN")
-            print()
+        type_writer(f"[🔧 CREATING APPS {', '.join(name.upper() for name in app_names)}...]", color="CYAN")
+        print()
 
+        for app_name in app_names:
             try:
-                subprocess.run([python_cmd, manage_py, "startapp", app_name], check=True)
+                worker.call(["startapp", app_name], label=f"startapp {app_name}")
                 status_tag(f"APP '{app_name}' CREATED", symbol="✅", color="GREEN")
                 print()
-            except subprocess.CalledProcessError:
+            except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
                 status_tag(f"ERROR CREATING APP '{app_name}'", symbol="❌", color="RED")
                 raise
 
@@ -150,13 +175,72 @@ class AppStructureCreationStrategy(AppCreationStrategy):
                     shutil.rmtree(item_path)
 
 
+# Strategy: Write each app's final layout directly from the venv's app_template
+class DirectAppCreationStrategy(AppCreationStrategy):
+    def __init__(self, fallback: list = None):
+        # startapp + restructure, for Django versions whose template we can't render
+        self.fallback = fallback or [SubprocessAppCreationStrategy(), AppStructureCreationStrategy()]
+
+    def perform(self, context: dict) -> None:
+        venv_path = context.get('venv_path')
+        project_path = context.get('project_path')
+        app_names = context.get('app_names', [])
+
+        if not venv_path or not project_path or not app_names:
+            raise ValueError("❌ Required context missing: venv_path, project_path, or app_names!")
+
+        try:
+            template = load_template(venv_path, "app")
+            for app_name in app_names:
+                check_module_name(app_name)
+        except (UnsupportedTemplate, OSError, SyntaxError, ValueError):
+            for strategy in self.fallback:
+                strategy.perform(context)
+            return
+
+        type_writer(f"[🔧 CREATING APPS {', '.join(name.upper() for name in app_names)}...]", color="CYAN")
+        print()
+
+        errors = generate_apps(template, project_path, app_names, fs=project_fs(context))
+        for app_name, error in zip(app_names, errors):
+            if error is not None:
+                status_tag(f"ERROR CREATING APP '{app_name}': {error}", symbol="❌", color="RED")
+                raise RuntimeError(f"Failed to create app '{app_name}'") from error
+            status_tag(f"APP '{app_name}' CREATED", symbol="✅", color="GREEN")
+            print()
+
+
+# Strategy: Write models, admin, serializers and the initial migration from the spec
+class ModelGenerationStrategy(AppCreationStrategy):
+    def perform(self, context: dict) -> None:
+        models = (context.get('spec') or {}).get('models')
+        if not models:
+            return
+        project_path = context.get('project_path')
+        if not project_path:
+            raise ValueError("❌ Required context missing: project_path!")
+
+        migrated = generate_model_files(project_path, models, project_fs(context))
+        # MigrationManager leaves these apps out of makemigrations
+        context['generated_migrations'] = migrated
+        for app_name, app_models in models.items():
+            if not app_models:
+                continue
+            migration = "0001_initial" if app_name in migrated else "makemigrations"
+            status_tag(f"MODELS FOR '{app_name}' GENERATED ({', '.join(app_models)}; {migration})", symbol="✅", color="GREEN")
+            print()
+
+
 # Main class coordinating all strategies
 class AppCreator(Step):
+    reads = ('venv_path', 'project_path', 'os')
+    writes = ('app_names', 'generated_migrations', 'stdin')
+
     def __init__(self):
         self.strategies = [
             InputValidationStrategy(),
-            SubprocessAppCreationStrategy(),
-            AppStructureCreationStrategy()
+            DirectAppCreationStrategy(),
+            ModelGenerationStrategy()
         ]
 
     def execute(self, context: dict):
@@ -164,3 +248,10 @@ class AppCreator(Step):
         print()  # Spacing
         for strategy in self.strategies:
             strategy.perform(context)
+
+    def counters(self, context: dict) -> dict:
+        overlay = context.get(OVERLAY)
+        return {
+            "apps": len(context.get('app_names') or []),
+            "staged_paths": overlay.pending if overlay is not None else 0,
+        }
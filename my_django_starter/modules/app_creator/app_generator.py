@@ -0,0 +1,53 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from my_django_starter.builder.django_templates import DjangoTemplate
+from my_django_starter.builder.overlay import DirectFS
+from .constants import SERIALIZERS_PY_CONTENT, VIEWS_PY_CONTENT, URLS_PY_CONTENT, ALLOWED_APP_FILES
+
+# Entries of Django's app_template that survive into the final layout
+TEMPLATE_FILES = {name for name in ALLOWED_APP_FILES if name.endswith(".py")}
+
+
+def app_layout(app_name: str) -> tuple[list, dict]:
+    """Directories and files (relative to the app folder) every generated app gets."""
+    static_path = os.path.join("static", app_name)
+    directories = [
+        os.path.join("templates", app_name),
+        os.path.join(static_path, "images"),
+        os.path.join(static_path, "css"),
+        os.path.join(static_path, "js"),
+    ]
+    api_path = f"api_of_{app_name}"
+    files = {
+        os.path.join(api_path, "serializers.py"): SERIALIZERS_PY_CONTENT,
+        os.path.join(api_path, "views.py"): VIEWS_PY_CONTENT,
+        os.path.join(api_path, "urls.py"): URLS_PY_CONTENT,
+    }
+    return directories, files
+
+
+def generate_app(template: DjangoTemplate, project_path: str, app_name: str,
+                 directories: list = None, files: dict = None, fs=None):
+    """
+    Write an app's final layout in one pass: the kept app_template files
+    (apps.py with the right AppConfig, models.py, ...) plus our own.
+    """
+    fs = fs or DirectFS()
+    if directories is None and files is None:
+        directories, files = app_layout(app_name)
+    app_path = os.path.join(project_path, app_name)
+    template.render(app_name, app_path, include=TEMPLATE_FILES, fs=fs)
+
+    for directory in directories or ():
+        fs.makedirs(os.path.join(app_path, directory))
+    for relative, content in (files or {}).items():
+        fs.write(os.path.join(app_path, relative), content)
+
+
+def generate_apps(template: DjangoTemplate, project_path: str, app_names: list, fs=None) -> list:
+    """Generate every app concurrently; returns one exception (or None) per app."""
+    if not app_names:
+        return []
+    with ThreadPoolExecutor(max_workers=min(8, len(app_names))) as pool:
+        futures = [pool.submit(generate_app, template, project_path, app_name, fs=fs) for app_name in app_names]
+        return [future.exception() for future in futures]
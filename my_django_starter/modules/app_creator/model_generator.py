@@ -0,0 +1,420 @@
+import os
+import re
+import ast
+import hashlib
+
+# Field classes a spec may use; all of them live in django.db.models
+FIELD_TYPES = {
+    "BigIntegerField", "BinaryField", "BooleanField", "CharField", "DateField",
+    "DateTimeField", "DecimalField", "DurationField", "EmailField", "FileField",
+    "FloatField", "GenericIPAddressField", "ImageField", "IntegerField", "JSONField",
+    "PositiveBigIntegerField", "PositiveIntegerField", "PositiveSmallIntegerField",
+    "SlugField", "SmallIntegerField", "TextField", "TimeField", "URLField", "UUIDField",
+    "ForeignKey", "OneToOneField", "ManyToManyField",
+}
+RELATION_TYPES = {"ForeignKey", "OneToOneField", "ManyToManyField"}
+ON_DELETE = {"CASCADE", "PROTECT", "RESTRICT", "SET_NULL", "SET_DEFAULT", "DO_NOTHING"}
+USER_MODEL = "auth.User"
+
+# Extra requirements generated code needs
+SERIALIZER_PACKAGE = "djangorestframework"
+FIELD_PACKAGES = {"ImageField": "Pillow"}
+
+# Bare names a field's default may be (callables, so instances aren't shared)
+CALLABLE_DEFAULTS = {"dict", "list"}
+
+INITIAL_MIGRATION = "0001_initial"
+_AUTO_FIELD = re.compile(r"""default_auto_field\s*=\s*['"]([\w.]+)['"]""")
+
+
+# ---------------------- spec parsing ---------------------- #
+
+def _name(node) -> str:
+    """Bare names (CASCADE, models.CASCADE, Category) by their last part."""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    value = ast.literal_eval(node)
+    if not isinstance(value, str):
+        raise ValueError
+    return value
+
+
+def _source(option: str, node) -> str:
+    if option == "default" and isinstance(node, ast.Name) and node.id in CALLABLE_DEFAULTS:
+        return node.id
+    return repr(ast.literal_eval(node))
+
+
+def parse_field(definition) -> dict:
+    """
+    Accept `CharField(max_length=200)` or a {type = "CharField", max_length = 200}
+    table. Both come back as {"type", "to", "on_delete", "options"}, with each
+    option as the Python source to pass it. A positional argument is the
+    relation target.
+    """
+    if isinstance(definition, dict):
+        field = {"type": definition.get("type"), "options": {}}
+        for key, value in definition.items():
+            if key in ("to", "on_delete"):
+                field[key] = value
+            elif key != "type":
+                if not isinstance(value, (str, int, float, bool, list, dict)):
+                    raise ValueError(f"Unsupported value for {key}: {value!r}")
+                field["options"][key] = repr(value)
+        return field
+    if not isinstance(definition, str):
+        raise ValueError(f"Field definition must be a string or a table, not {definition!r}")
+    try:
+        node = ast.parse(definition.strip(), mode="eval").body
+        if isinstance(node, (ast.Name, ast.Attribute)):
+            node = ast.Call(func=node, args=[], keywords=[])
+        if not isinstance(node, ast.Call) or len(node.args) > 1 or any(kw.arg is None for kw in node.keywords):
+            raise ValueError
+        field = {"type": _name(node.func), "options": {}}
+        if node.args:
+            field["to"] = _name(node.args[0])
+        for keyword in node.keywords:
+            if keyword.arg in ("to", "on_delete"):
+                field[keyword.arg] = _name(keyword.value)
+            else:
+                field["options"][keyword.arg] = _source(keyword.arg, keyword.value)
+    except (SyntaxError, ValueError):
+        raise ValueError(f"Cannot parse field definition {definition!r}") from None
+    return field
+
+
+def _label(app_name: str, model_name: str, to: str) -> str:
+    """Relation targets as 'app.Model' labels."""
+    if to in ("AUTH_USER_MODEL", "settings.AUTH_USER_MODEL"):
+        return USER_MODEL
+    if to == "self":
+        return f"{app_name}.{model_name}"
+    return to if "." in to else f"{app_name}.{to}"
+
+
+def _check_field(where: str, name: str, field: dict):
+    if not name.isidentifier() or name.startswith("_") or "__" in name:
+        raise ValueError(f"{where}: '{name}' is not a valid field name")
+    field_type = field.get("type")
+    if field_type not in FIELD_TYPES:
+        raise ValueError(f"{where}.{name}: unknown field type {field_type!r}")
+    for option in field["options"]:
+        if not option.isidentifier():
+            raise ValueError(f"{where}.{name}: invalid option {option!r}")
+    if field_type in RELATION_TYPES and not isinstance(field.get("to"), str):
+        raise ValueError(f"{where}.{name}: {field_type} needs a target model")
+    if field_type in ("ForeignKey", "OneToOneField"):
+        field["on_delete"] = str(field.get("on_delete", "CASCADE")).rsplit(".", 1)[-1]
+        if field["on_delete"] not in ON_DELETE:
+            raise ValueError(f"{where}.{name}: on_delete must be one of {', '.join(sorted(ON_DELETE))}")
+    elif "on_delete" in field:
+        raise ValueError(f"{where}.{name}: on_delete only applies to ForeignKey and OneToOneField")
+
+
+def _parse_index(where: str, index, fields: dict) -> list:
+    names = [part.strip() for part in index.split(",")] if isinstance(index, str) else list(index)
+    if not names:
+        raise ValueError(f"{where}: empty index")
+    for name in names:
+        field = fields.get(str(name).lstrip("-"))
+        if field is None:
+            raise ValueError(f"{where}: index on unknown field {name!r}")
+        if field["type"] == "ManyToManyField":
+            raise ValueError(f"{where}: cannot index the many-to-many field {name!r}")
+    return [str(name) for name in names]
+
+
+def normalize_models(raw: dict, app_names: list) -> dict:
+    """
+    Validate the spec's `models` table and return it as
+    {app: {Model: {"fields": {name: parse_field(...)}, "indexes": [[...]]}}}.
+    """
+    if not isinstance(raw, dict):
+        raise ValueError("'models' must map app names to their models")
+    models = {}
+    for app_name, app_models in raw.items():
+        if app_name not in app_names:
+            raise ValueError(f"Models given for '{app_name}', which is not one of the apps")
+        models[app_name] = {}
+        for model_name, model in (app_models or {}).items():
+            where = f"{app_name}.{model_name}"
+            if not model_name.isidentifier() or not model_name[0].isupper():
+                raise ValueError(f"'{where}' is not a valid model name (use CamelCase)")
+            fields = {}
+            for name, definition in (model.get("fields") or {}).items():
+                field = parse_field(definition)
+                _check_field(where, name, field)
+                if "to" in field:
+                    field["to"] = _label(app_name, model_name, field["to"])
+                    if not re.match(r"^[A-Za-z_]\w*\.[A-Za-z_]\w*$", field["to"]):
+                        raise ValueError(f"{where}.{name}: invalid target model {field['to']!r}")
+                fields[name] = field
+            indexes = [_parse_index(where, index, fields) for index in model.get("indexes") or ()]
+            models[app_name][model_name] = {"fields": fields, "indexes": indexes}
+
+    # Relations into spec apps must name a model the spec defines
+    for app_name, app_models in models.items():
+        for model_name, model in app_models.items():
+            for name, field in model["fields"].items():
+                target_app, target_model = field.get("to", ".").split(".")
+                if target_app in models and target_model not in models[target_app]:
+                    raise ValueError(f"{app_name}.{model_name}.{name}: no model '{field['to']}' in the spec")
+    return models
+
+
+def model_packages(models: dict) -> list:
+    """Requirements the generated code imports."""
+    packages = [SERIALIZER_PACKAGE] if any(models.values()) else []
+    for app_models in models.values():
+        for model in app_models.values():
+            for field in model["fields"].values():
+                package = FIELD_PACKAGES.get(field["type"])
+                if package and package not in packages:
+                    packages.append(package)
+    return packages
+
+
+# ---------------------- models.py, admin.py, serializers.py ---------------------- #
+
+def _options(field: dict) -> list:
+    return [f"{key}={source}" for key, source in field["options"].items()]
+
+
+def _model_field(app_name: str, model_name: str, field: dict) -> str:
+    args = []
+    to = field.get("to")
+    if to == USER_MODEL:
+        args.append("settings.AUTH_USER_MODEL")
+    elif to == f"{app_name}.{model_name}":
+        args.append("'self'")
+    elif to:
+        target_app, target_model = to.split(".")
+        args.append(repr(target_model if target_app == app_name else to))
+    if "on_delete" in field:
+        args.append(f"on_delete=models.{field['on_delete']}")
+    return f"models.{field['type']}({', '.join(args + _options(field))})"
+
+
+def _primary_key(model: dict) -> bool:
+    """Whether a field replaces the automatic `id`."""
+    return any(field["options"].get("primary_key") == "True" for field in model["fields"].values())
+
+
+def _uses_user_model(app_models: dict) -> bool:
+    return any(field.get("to") == USER_MODEL for model in app_models.values() for field in model["fields"].values())
+
+
+def render_models(app_name: str, app_models: dict) -> str:
+    lines = ["from django.conf import settings\n"] if _uses_user_model(app_models) else []
+    lines.append("from django.db import models\n")
+    for model_name, model in app_models.items():
+        lines += ["\n", "\n", f"class {model_name}(models.Model):\n"]
+        for name, field in model["fields"].items():
+            lines.append(f"    {name} = {_model_field(app_name, model_name, field)}\n")
+        if model["indexes"]:
+            if model["fields"]:
+                lines.append("\n")
+            lines += ["    class Meta:\n", "        indexes = [\n"]
+            lines += [f"            models.Index(fields={fields!r}),\n" for fields in model["indexes"]]
+            lines.append("        ]\n")
+        elif not model["fields"]:
+            lines.append("    pass\n")
+    return "".join(lines)
+
+
+def render_admin(app_models: dict) -> str:
+    lines = ["from django.contrib import admin\n", "\n", f"from .models import {', '.join(sorted(app_models))}\n"]
+    for model_name, model in app_models.items():
+        columns = [] if _primary_key(model) else ["id"]
+        columns += [name for name, field in model["fields"].items() if field["type"] != "ManyToManyField"]
+        lines += [
+            "\n", "\n",
+            f"@admin.register({model_name})\n",
+            f"class {model_name}Admin(admin.ModelAdmin):\n",
+            f"    list_display = {tuple(columns[:6])!r}\n",
+        ]
+    return "".join(lines)
+
+
+def render_serializers(app_models: dict) -> str:
+    lines = [
+        "# serializers.py\n",
+        "from rest_framework import serializers\n", "\n",
+        f"from ..models import {', '.join(sorted(app_models))}\n",
+    ]
+    for model_name in app_models:
+        lines += [
+            "\n", "\n",
+            f"class {model_name}Serializer(serializers.ModelSerializer):\n",
+            "    class Meta:\n",
+            f"        model = {model_name}\n",
+            "        fields = '__all__'\n",
+        ]
+    return "".join(lines)
+
+
+# ---------------------- 0001_initial.py ---------------------- #
+
+def _index_name(app_name: str, model_name: str, model: dict, names: list) -> str:
+    """The name Django's Index.set_name_with_model() gives an unnamed index."""
+    table = f"{app_name}_{model_name.lower()}"
+    columns = []
+    for name in names:
+        field = model["fields"][name.lstrip("-")]
+        if "db_column" in field["options"]:
+            column = ast.literal_eval(field["options"]["db_column"])
+        else:
+            column = f"{name.lstrip('-')}_id" if "on_delete" in field else name.lstrip("-")
+        columns.append(("-" if name.startswith("-") else "") + column)
+    digest = hashlib.md5()
+    for part in [table] + columns + ["idx"]:
+        digest.update(part.encode())
+    name = f"{table[:11]}_{columns[0].lstrip('-')[:7]}_{digest.hexdigest()[:6]}_idx"
+    if name[0] == "_" or name[0].isdigit():
+        name = f"D{name[1:]}"
+    return name
+
+
+def _migration_field(field: dict) -> str:
+    options = dict(field["options"])
+    if options.get("primary_key") == "True":
+        options["serialize"] = "False"
+    if "on_delete" in field:
+        options["on_delete"] = f"django.db.models.deletion.{field['on_delete']}"
+    if "to" in field:
+        target_app, target_model = field["to"].split(".")
+        options["to"] = "settings.AUTH_USER_MODEL" if field["to"] == USER_MODEL else repr(f"{target_app}.{target_model.lower()}")
+    return f"models.{field['type']}({', '.join(f'{key}={options[key]}' for key in sorted(options))})"
+
+
+def _creation_order(app_name: str, app_models: dict) -> list:
+    """Models ordered so each comes after the models of its app it points at; None on a cycle."""
+    ordered, visiting = [], set()
+
+    def visit(model_name):
+        if model_name in ordered:
+            return True
+        if model_name in visiting:
+            return False
+        visiting.add(model_name)
+        for field in app_models[model_name]["fields"].values():
+            target_app, target_model = field.get("to", ".").split(".")
+            if target_app == app_name and target_model != model_name and not visit(target_model):
+                return False
+        ordered.append(model_name)
+        return True
+
+    return ordered if all(visit(model_name) for model_name in app_models) else None
+
+
+def render_initial_migration(app_name: str, app_models: dict, auto_field: str, dependencies: list) -> str:
+    """0001_initial.py creating every model of the app, fields and indexes included."""
+    order = _creation_order(app_name, app_models)
+    if order is None:
+        raise ValueError(f"models of '{app_name}' refer to each other in a cycle")
+
+    fields = [field for model in app_models.values() for field in model["fields"].values()]
+    lines = ["# Generated by my-django-starter from the project spec\n", "\n"]
+    if _uses_user_model(app_models):
+        lines.append("from django.conf import settings\n")
+    lines.append("from django.db import migrations, models\n")
+    if any("on_delete" in field for field in fields):
+        lines.append("import django.db.models.deletion\n")
+    lines += ["\n", "\n", "class Migration(migrations.Migration):\n", "\n", "    initial = True\n", "\n"]
+
+    lines.append("    dependencies = [\n")
+    if _uses_user_model(app_models):
+        lines.append("        migrations.swappable_dependency(settings.AUTH_USER_MODEL),\n")
+    lines += [f"        ({app!r}, {INITIAL_MIGRATION!r}),\n" for app in sorted(dependencies)]
+    lines += ["    ]\n", "\n", "    operations = [\n"]
+
+    for model_name in order:
+        model = app_models[model_name]
+        lines += ["        migrations.CreateModel(\n", f"            name={model_name!r},\n", "            fields=[\n"]
+        if not _primary_key(model):
+            lines.append(f"                ('id', models.{auto_field.rsplit('.', 1)[1]}(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),\n")
+        # The autodetector adds relations after the other fields
+        for name, field in sorted(model["fields"].items(), key=lambda item: "to" in item[1]):
+            lines.append(f"                ({name!r}, {_migration_field(field)}),\n")
+        lines.append("            ],\n")
+        if model["indexes"]:
+            lines += ["            options={\n", "                'indexes': [\n"]
+            for names in model["indexes"]:
+                index_name = _index_name(app_name, model_name, model, names)
+                lines.append(f"                    models.Index(fields={names!r}, name={index_name!r}),\n")
+            lines += ["                ],\n", "            },\n"]
+        lines.append("        ),\n")
+    lines.append("    ]\n")
+    return "".join(lines)
+
+
+def plan_migrations(models: dict, excluded=()) -> dict:
+    """
+    Which apps can get a generated 0001_initial: {app: [spec apps it depends on]}.
+    Apps pointing at models outside the spec (other than the user model), at
+    apps in a dependency cycle, or at apps left to makemigrations (`excluded`
+    among them), are left to makemigrations themselves, so no generated
+    migration ever depends on one that doesn't exist yet.
+    """
+    dependencies = {}
+    for app_name, app_models in models.items():
+        if not app_models or app_name in excluded or _creation_order(app_name, app_models) is None:
+            continue
+        targets = {field["to"].split(".")[0] for model in app_models.values()
+                   for field in model["fields"].values() if "to" in field and field["to"] != USER_MODEL}
+        targets.discard(app_name)
+        if targets <= set(models):
+            dependencies[app_name] = sorted(targets)
+
+    def cyclic(app_name, path=()):
+        if app_name in path:
+            return True
+        return any(cyclic(target, path + (app_name,)) for target in dependencies.get(app_name, ()))
+
+    dependencies = {app: targets for app, targets in dependencies.items() if not cyclic(app)}
+    changed = True
+    while changed:
+        changed = False
+        for app_name, targets in list(dependencies.items()):
+            if any(target not in dependencies for target in targets):
+                del dependencies[app_name]
+                changed = True
+    return dependencies
+
+
+def default_auto_field(apps_py: str) -> str:
+    """The app's primary key class, as its AppConfig declares it."""
+    match = _AUTO_FIELD.search(apps_py or "")
+    return match.group(1) if match else "django.db.models.AutoField"
+
+
+def generate_model_files(project_path: str, models: dict, fs) -> list:
+    """
+    Write models.py, admin.py, api_of_<app>/serializers.py and, where
+    plan_migrations() allows it, migrations/0001_initial.py for every app
+    with models in the spec. Returns the apps that got a migration.
+    """
+    auto_fields = {
+        app_name: default_auto_field(fs.read(os.path.join(project_path, app_name, "apps.py")))
+        for app_name, app_models in models.items() if app_models
+    }
+    # Custom primary key classes need an import the generator can't know
+    plan = plan_migrations(models, {app for app, field in auto_fields.items() if not field.startswith("django.db.models.")})
+
+    migrated = []
+    for app_name in auto_fields:
+        app_models = models[app_name]
+        app_path = os.path.join(project_path, app_name)
+        fs.write(os.path.join(app_path, "models.py"), render_models(app_name, app_models))
+        fs.write(os.path.join(app_path, "admin.py"), render_admin(app_models))
+        fs.write(os.path.join(app_path, f"api_of_{app_name}", "serializers.py"), render_serializers(app_models))
+        if app_name not in plan:
+            continue
+        migrations_path = os.path.join(app_path, "migrations")
+        fs.write(os.path.join(migrations_path, "__init__.py"), "")
+        fs.write(os.path.join(migrations_path, f"{INITIAL_MIGRATION}.py"),
+                 render_initial_migration(app_name, app_models, auto_fields[app_name], plan[app_name]))
+        migrated.append(app_name)
+    return migrated
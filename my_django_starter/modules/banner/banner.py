@@ -1,11 +1,42 @@
 # modules/banner.py
+import os
 import shutil
-from pyfiglet import Figlet
+import hashlib
+import tempfile
+from functools import lru_cache
 from my_django_starter.builder.base import Step
 from abc import ABC, abstractmethod
 
 
-# Strategy Interface 
+@lru_cache(maxsize=None)
+def render_figlet(text: str, font: str, width: int) -> str:
+    """
+    Figlet art for `text`, cached on disk per font and terminal width:
+    importing pyfiglet and loading a font costs more than the rest of startup.
+    """
+    from my_django_starter.builder.wheelhouse import cache_root
+    digest = hashlib.sha1(f"{font}\0{width}\0{text}".encode()).hexdigest()[:12]
+    path = os.path.join(cache_root(), "banners", f"{font}-{width}-{digest}.txt")
+    try:
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        pass
+
+    from pyfiglet import Figlet
+    banner = Figlet(font=font, width=width).renderText(text)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(banner)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # unwritable cache: render again next time
+    return banner
+
+
+# Strategy Interface
 class BannerStrategy(ABC):
     @abstractmethod
     def render(self, text: str) -> str:
@@ -16,19 +47,16 @@ class BannerStrategy(ABC):
 class SlantBannerStrategy(BannerStrategy):
     def render(self, text: str) -> str:
         terminal_width = shutil.get_terminal_size((80, 20)).columns
-        figlet = Figlet(font="slant", width=terminal_width)
-        banner = figlet.renderText(text)
+        banner = render_figlet(text, "slant", terminal_width)
         return f"\033[1;36m{banner}\033[0m"
-        
 
-# Banner Step Class : Client 
+
+# Banner Step Class : Client
 class Banner(Step):
-    def __init__(self, strategy: BannerStrategy = SlantBannerStrategy()):
-        self.strategy = strategy
+    def __init__(self, strategy: BannerStrategy = None):
+        self.strategy = strategy or SlantBannerStrategy()
 
     def execute(self, context: dict):
         text = "my-django-starter"
         banner = self.strategy.render(text)
         print(banner)
-
-
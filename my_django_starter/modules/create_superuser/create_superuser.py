@@ -3,9 +3,12 @@ import subprocess
 import re
 from getpass import getpass
 from my_django_starter.builder.base import Step
+from my_django_starter.builder.manage_worker import get_manage_worker
 from my_django_starter.animations.terminal_fx import status_tag, type_writer
 
 class AdminSetup(Step):
+    reads = ('python_cmd', 'project_path', 'migrated_apps')
+    writes = ('stdin',)
 
     def execute(self, context: dict):
         print()
@@ -14,7 +17,11 @@ class AdminSetup(Step):
 
         """Template Method: Defines the skeleton of the algorithm."""
         python_cmd, project_path = self._validate_context(context)
-        username, email, password = self._collect_user_input()
+        spec = context.get('spec')
+        if spec is not None:
+            username, email, password = self._collect_spec_input(spec.get('superuser') or {})
+        else:
+            username, email, password = self._collect_user_input()
         self._create_superuser(python_cmd, project_path, username, email, password)
 
     def _validate_context(self, context: dict) -> tuple[str, str]:
@@ -26,6 +33,17 @@ class AdminSetup(Step):
             raise ValueError("Required context data (python_cmd or project_path) missing!")
         return python_cmd, project_path
 
+    def _collect_spec_input(self, superuser: dict) -> tuple[str, str, str]:
+        """Take superuser credentials from the spec; the password comes from the environment."""
+        username = str(superuser.get('username') or 'admin').strip()
+        email = str(superuser.get('email') or 'admin@example.com').strip()
+        password = os.environ.get('DJANGO_SUPERUSER_PASSWORD', '').strip()
+        if not re.match(r'^[\w\.-]+@[\w\.-]+\.\w+$', email):
+            raise ValueError(f"Invalid superuser email: {email}")
+        if not password:
+            raise ValueError("Superuser password missing! Set DJANGO_SUPERUSER_PASSWORD or pass --superuser-password")
+        return username, email, password
+
     def _collect_user_input(self) -> tuple[str, str, str]:
         """Collect and validate superuser credentials interactively."""
         # Username with default option
@@ -63,20 +81,20 @@ class AdminSetup(Step):
 
     def _create_superuser(self, python_cmd: str, project_path: str, username: str, email: str, password: str):
         """Create a Django superuser non-interactively using provided credentials."""
-        manage_py = os.path.join(project_path, "manage.py")
         try:
-            # Set environment variables for non-interactive createsuperuser
-            env = os.environ.copy()
-            env['DJANGO_SUPERUSER_USERNAME'] = username
-            env['DJANGO_SUPERUSER_EMAIL'] = email
-            env['DJANGO_SUPERUSER_PASSWORD'] = password
+            # Environment variables for non-interactive createsuperuser; the
+            # worker sets them only for the duration of the command
+            env = {
+                'DJANGO_SUPERUSER_USERNAME': username,
+                'DJANGO_SUPERUSER_EMAIL': email,
+                'DJANGO_SUPERUSER_PASSWORD': password,
+            }
 
             # Run createsuperuser command
-            subprocess.run(
-                [python_cmd, manage_py, "createsuperuser", "--noinput"],
-                env=env,
-                check=True,
-                cwd=project_path
+            get_manage_worker(python_cmd, project_path).call(
+                ["createsuperuser", "--noinput"],
+                label="createsuperuser",
+                env=env
             )
             print()
             status_tag(f"[✅ SUPERUSER CREATED ... ]", color="GREEN")
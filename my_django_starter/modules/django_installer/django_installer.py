@@ -2,6 +2,7 @@
 import subprocess
 from abc import ABC, abstractmethod
 from my_django_starter.builder.base import Step
+from my_django_starter.builder.packages import install_packages
 from my_django_starter.animations.terminal_fx import status_tag, type_writer
 
 # === Strategy Interface ===
@@ -20,9 +21,13 @@ class PyPIInstaller(InstallerStrategy):
             raise ValueError("❌ Pip command not found in context!")
         return pip_cmd
 
-    def _get_django_package(self) -> tuple[str, str]:
-        user_input = input("3) DJANGO VERSION [PRESS ENTER FOR LATEST]: ").strip()
-        if user_input == "":
+    def _get_django_package(self, context: dict) -> tuple[str, str]:
+        spec = context.get('spec')
+        if spec is not None:
+            user_input = str(spec.get('django_version') or '').strip()
+        else:
+            user_input = input("3) DJANGO VERSION [PRESS ENTER FOR LATEST]: ").strip()
+        if user_input in ("", "latest"):
             package_name = "django"
             version = "latest"
         else:
@@ -37,9 +42,10 @@ class PyPIInstaller(InstallerStrategy):
         type_writer(f"[🔧 INSTALLING {pkg.upper()}...]", color="CYAN")
         print()
 
-    def _run_install_command(self, pip_cmd: str, pkg: str) -> bool:
+    def _run_install_command(self, pip_cmd: str, packages: list, context: dict) -> bool:
         try:
-            subprocess.run([pip_cmd, "install", pkg], check=True)
+            resolved = install_packages(pip_cmd, packages, context)
+            context.setdefault('resolved_packages', {}).update(resolved)
             return True
         except subprocess.CalledProcessError:
             return False 
@@ -54,23 +60,37 @@ class PyPIInstaller(InstallerStrategy):
 
 
     def install(self, context: dict):
+        """Install Django plus every package other steps registered, in one pip run."""
         pip_cmd = self._get_pip_cmd(context)
-        django_pkg, version = self._get_django_package()
-        
-        self._print_install_start(django_pkg)
+        django_pkg, version = self._get_django_package(context)
+        context['django_version'] = version
+
+        installed = context.setdefault('installed_packages', [])
+        wanted = [django_pkg] + [pkg for pkg in context.get('packages', []) if pkg != django_pkg]
+        # Skip what is already in the venv, e.g. cloned from a cached template.
+        pending = [pkg for pkg in wanted if pkg not in installed]
+        if not pending:
+            status_tag(f"{', '.join(wanted).upper()} ALREADY INSTALLED", symbol="✅", color="GREEN")
+            return
 
-        success = self._run_install_command(pip_cmd, django_pkg)
+        label = ", ".join(pending)
+        self._print_install_start(label)
+
+        success = self._run_install_command(pip_cmd, pending, context)
 
         if success:
-            context['django_version'] = version
-            self._print_success(django_pkg)
+            installed.extend(pending)
+            self._print_success(label)
         else:
-            self._print_failure(django_pkg)
-            raise RuntimeError(f"Installation failed for package: {django_pkg}")
+            self._print_failure(label)
+            raise RuntimeError(f"Installation failed for packages: {label}")
 
 
 # === Context Class ===
 class DjangoInstaller(Step):
+    reads = ('pip_cmd', 'installed_packages', 'packages')
+    writes = ('django_version', 'installed_packages', 'resolved_packages', 'stdin')
+
     def __init__(self):
         self.strategy = PyPIInstaller()  # Default strategy
 
@@ -1,11 +1,15 @@
 import os
-import subprocess
-import re
 from my_django_starter.builder.base import Step
+from my_django_starter.builder.documents import settings_document
+from my_django_starter.builder.overlay import project_fs
 from my_django_starter.animations.terminal_fx import status_tag, type_writer
 from .gitignore_template import GITIGNORE_TEMPLATE
 
 class EnvManager(Step):
+    reads = ('venv_path', 'project_path', 'project_name')
+    writes = ('env_path', 'settings_doc')
+    # settings.py will import decouple; DjangoInstaller installs it up front.
+    packages = ('python-decouple',)
 
     def _validate_context(self):
         self.venv_path = self.context.get('venv_path')
@@ -15,54 +19,30 @@ class EnvManager(Step):
         if not self.venv_path or not self.project_path or not self.project_name:
             raise ValueError("Missing venv_path, project_path, or project_name in context")
 
-    def _determine_pip_path(self):
-        os_name = self.context.get('os', '').lower()
-        self.pip_cmd = f"{self.venv_path}/Scripts/pip" if "windows" in os_name else f"{self.venv_path}/bin/pip"
-
-    def _install_dependencies(self):
-        try:
-            subprocess.run([self.pip_cmd, "install", "python-decouple"], check=True)
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError("Failed to install python-decouple") from e
-
     def _extract_secret_key(self):
-        settings_path = os.path.join(self.project_path, self.project_name, "settings.py")
+        self.settings = settings_document(self.context)
         try:
-            with open(settings_path, "r") as f:
-                self.settings_content = f.readlines()
-        except IOError as e:
-            raise RuntimeError("Unable to read settings.py") from e
-
-        self.secret_key = None
-        self.secret_key_line = None
-        for i, line in enumerate(self.settings_content):
-            if line.strip().startswith("SECRET_KEY"):
-                match = re.match(r"SECRET_KEY\s*=\s*['\"](.*?)['\"]", line.strip())
-                if match:
-                    self.secret_key = match.group(1)
-                    self.secret_key_line = i
-                break
-
-        if not self.secret_key:
+            self.secret_key = self.settings.get("SECRET_KEY")
+        except KeyError:
             raise ValueError("SECRET_KEY not found in settings.py")
+        except ValueError:
+            # Already reads from .env (a resumed or repeated run)
+            self.secret_key = None
 
     def _update_settings_py(self):
-        self.settings_content[self.secret_key_line] = "SECRET_KEY = config('SECRET_KEY')\n"
-        if "from decouple import config\n" not in self.settings_content:
-            self.settings_content.insert(0, "from decouple import config\n")
-
-        settings_path = os.path.join(self.project_path, self.project_name, "settings.py")
-        try:
-            with open(settings_path, "w") as f:
-                f.writelines(self.settings_content)
-        except IOError as e:
-            raise RuntimeError("Failed to update settings.py") from e
+        self.settings.add_import("from decouple import config")
+        self.settings.set_setting("SECRET_KEY", "config('SECRET_KEY')")
 
     def _create_env_file(self):
         env_path = os.path.join(self.project_path, ".env")
+        if self.secret_key is None:
+            if not self.fs.exists(env_path):
+                raise ValueError("SECRET_KEY not found in settings.py or .env")
+            self.context['env_path'] = env_path
+            return
         try:
-            with open(env_path, "w") as f:
-                f.write(f"SECRET_KEY={self.secret_key}\n")
+            self.fs.write(env_path, f"SECRET_KEY={self.secret_key}\n")
+            self.context['env_path'] = env_path
         except IOError as e:
             raise RuntimeError("Failed to create .env file") from e
 
@@ -70,8 +50,7 @@ class EnvManager(Step):
         gitignore_path = os.path.join(self.project_path, ".gitignore")
         venv_name = os.path.basename(self.venv_path)
         try:
-            with open(gitignore_path, "w") as f:
-                f.write(self._generate_gitignore_content(venv_name))
+            self.fs.write(gitignore_path, self._generate_gitignore_content(venv_name))
         except IOError as e:
             raise RuntimeError("Failed to create .gitignore") from e
 
@@ -82,10 +61,11 @@ class EnvManager(Step):
         type_writer("[🔧 MANAGING ENVIRONMENT VARIABLE ...]", color="CYAN")
         self.context = context
         self._validate_context()
-        self._determine_pip_path()
-        self._install_dependencies()
+        self.fs = project_fs(context)
         self._extract_secret_key()
-        self._update_settings_py()
+        # .env first: a commit made meanwhile (AppCreator's startapp fallback)
+        # must never see settings.py reading a key that is not there yet
         self._create_env_file()
+        self._update_settings_py()
         self._create_gitignore()
         
\ No newline at end of file
@@ -1,6 +1,8 @@
 GITIGNORE_TEMPLATE = """# Virtual environment
 {venv_name}/
 .env
+.mydjango_checkpoint.json
+.mydjango_models.json
 db.sqlite3
 __pycache__/
 *.py[cod]
@@ -3,6 +3,11 @@ import subprocess
 import shutil
 from abc import ABC, abstractmethod
 from my_django_starter.builder.base import Step
+from my_django_starter.builder.manage_worker import get_manage_worker
+from my_django_starter.builder.django_templates import UnsupportedTemplate, load_template
+from my_django_starter.builder.documents import SettingsDocument, UrlsDocument, commit_project, settings_document, urls_document
+from my_django_starter.builder.overlay import project_fs
+from my_django_starter.modules.app_creator.app_generator import TEMPLATE_FILES
 from .html_content import HOME_HTML , VIEWS_CONTENT , URLS_CONTENT
 from my_django_starter.animations.terminal_fx import status_tag, type_writer
 
@@ -10,32 +15,28 @@ from my_django_starter.animations.terminal_fx import status_tag, type_writer
 # Strategy: File Creation
 class FileCreationStrategy(ABC):
     @abstractmethod
-    def create_file(self, path: str):
+    def create_file(self, fs, path: str):
         pass
 
 
 class SerializerFileStrategy(FileCreationStrategy):
-    def create_file(self, path: str):
-        with open(path, "w") as f:
-            f.write("# serializers.py\n\n")
+    def create_file(self, fs, path: str):
+        fs.write(path, "# serializers.py\n\n")
 
 
 class ViewsFileStrategy(FileCreationStrategy):
-    def create_file(self, path: str):
-        with open(path, "w") as f:
-            f.write(VIEWS_CONTENT)
+    def create_file(self, fs, path: str):
+        fs.write(path, VIEWS_CONTENT)
 
 
 
 class UrlsFileStrategy(FileCreationStrategy):
-    def create_file(self, path: str):
-        with open(path, "w") as f:
-            f.write(URLS_CONTENT)
+    def create_file(self, fs, path: str):
+        fs.write(path, URLS_CONTENT)
 
 class HtmlFileStrategy(FileCreationStrategy):
-    def create_file(self, path: str):
-        with open(path, "w") as f:
-            f.write(HOME_HTML)
+    def create_file(self, fs, path: str):
+        fs.write(path, HOME_HTML)
 
 
 
@@ -44,69 +45,50 @@ class HtmlFileStrategy(FileCreationStrategy):
 # Strategy: Settings Update
 class SettingsUpdateStrategy(ABC):
     @abstractmethod
-    def update(self, settings_path: str, app_name: str):
+    def update(self, settings: SettingsDocument, app_name: str):
         pass
 
 class AddAppToSettingsStrategy(SettingsUpdateStrategy):
-    def update(self, settings_path: str, app_name: str):
-        with open(settings_path, "r") as f:
-            settings_content = f.readlines()
-
-        installed_apps_line = None
-        for i, line in enumerate(settings_content):
-            if line.strip().startswith("INSTALLED_APPS"):
-                installed_apps_line = i
-                break
-
-        if installed_apps_line is None:
-            raise ValueError("INSTALLED_APPS not found in settings.py!")
-
-        for i, line in enumerate(settings_content[installed_apps_line:]):
-            if ']' in line:
-                settings_content[installed_apps_line + i:installed_apps_line + i] = [f"    '{app_name}',\n"]
-                break
-
-        with open(settings_path, "w") as f:
-            f.writelines(settings_content)
-
-
+    def update(self, settings: SettingsDocument, app_name: str):
+        settings.add_installed_app(app_name)
 
 
 # Strategy: URLs Update
 class UrlsUpdateStrategy(ABC):
     @abstractmethod
-    def update(self, urls_path: str, app_name: str):
+    def update(self, urls: UrlsDocument, app_name: str):
         pass
 
 class AddHomeUrlsStrategy(UrlsUpdateStrategy):
-    def update(self, urls_path: str, app_name: str):
-        with open(urls_path, "r") as f:
-            urls_content = f.readlines()
-
-        for i, line in enumerate(urls_content):
-            if line.strip().startswith("urlpatterns"):
-                for j, subline in enumerate(urls_content[i:]):
-                    if "[" in subline:
-                        urls_content[i + j + 1:i + j + 1] = [f"    path('', include('{app_name}.api_of_{app_name}.urls')),\n"]
-                        break
-                break
-
-        with open(urls_path, "w") as f:
-            f.writelines(urls_content)
-
-
-
+    def update(self, urls: UrlsDocument, app_name: str):
+        urls.add_include('', f"{app_name}.api_of_{app_name}.urls", first=True)
 
 
 # Main HomePageRenderer Class
 class HomePageRenderer(Step):
+    # Writing settings_doc orders this step after the earlier settings.py
+    # edits (EnvManager, MediaFileHandler, SettingsModifier), so settings.py
+    # is complete when the startapp fallback boots Django.
+    reads = ('python_cmd', 'venv_path', 'project_path', 'project_name', 'app_names')
+    writes = ('apps', 'settings_doc', 'urls_doc')
+
+    def _create_home_app(self, python_cmd: str, venv_path: str, project_path: str, home_app_name: str) -> bool:
+        """Render the kept app_template files directly; returns True if startapp had to be used instead."""
+        try:
+            load_template(venv_path, "app").render(home_app_name, os.path.join(project_path, home_app_name),
+                                                   include=TEMPLATE_FILES, fs=self.fs)
+            return False
+        except (UnsupportedTemplate, SyntaxError):
+            pass
+        except (OSError, RuntimeError) as e:
+            raise RuntimeError(f"Failed to create home app: {e}")
 
-    def _create_home_app(self, python_cmd: str, project_path: str, home_app_name: str):
-        manage_py = os.path.join(project_path, "manage.py")
         try:
-            subprocess.run([python_cmd, manage_py, "startapp", home_app_name], check=True)
+            commit_project(self.context)  # startapp needs manage.py and settings.py on disk
+            get_manage_worker(python_cmd, project_path).call(["startapp", home_app_name], label="startapp home")
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Failed to create home app: {e}")
+        return True
 
     def _setup_app_structure(self, project_path: str, home_app_name: str):
         app_path = os.path.join(project_path, home_app_name)
@@ -115,11 +97,11 @@ class HomePageRenderer(Step):
         static_path = os.path.join(app_path, "static", home_app_name)
 
         try:
-            os.makedirs(api_path, exist_ok=True)
-            os.makedirs(templates_path, exist_ok=True)
-            os.makedirs(os.path.join(static_path, "images"), exist_ok=True)
-            os.makedirs(os.path.join(static_path, "css"), exist_ok=True)
-            os.makedirs(os.path.join(static_path, "js"), exist_ok=True)
+            self.fs.makedirs(api_path)
+            self.fs.makedirs(templates_path)
+            self.fs.makedirs(os.path.join(static_path, "images"))
+            self.fs.makedirs(os.path.join(static_path, "css"))
+            self.fs.makedirs(os.path.join(static_path, "js"))
         except OSError as e:
             raise RuntimeError(f"Failed to create directories: {e}")
 
@@ -128,14 +110,14 @@ class HomePageRenderer(Step):
         try:
             for file_name, strategy in self.file_strategies.items():
                 if file_name != "home.html":
-                    strategy.create_file(os.path.join(api_path, file_name))
+                    strategy.create_file(self.fs, os.path.join(api_path, file_name))
         except IOError as e:
             raise RuntimeError(f"Failed to create API files: {e}")
 
     def _create_templates(self, project_path: str, home_app_name: str):
         templates_path = os.path.join(project_path, home_app_name, "templates", home_app_name)
         try:
-            self.file_strategies["home.html"].create_file(os.path.join(templates_path, "home.html"))
+            self.file_strategies["home.html"].create_file(self.fs, os.path.join(templates_path, "home.html"))
         except IOError as e:
             raise RuntimeError(f"Failed to create home.html: {e}")
 
@@ -143,7 +125,7 @@ class HomePageRenderer(Step):
         static_path = os.path.join(project_path, home_app_name, "static", home_app_name)
         try:
             for folder in ["images", "css", "js"]:
-                open(os.path.join(static_path, folder, f".gitkeep"), "a").close()
+                self.fs.write(os.path.join(static_path, folder, ".gitkeep"), "")
         except IOError as e:
             raise RuntimeError(f"Failed to create static files: {e}")
 
@@ -169,18 +151,16 @@ class HomePageRenderer(Step):
         except (OSError, IOError) as e:
             raise RuntimeError(f"Failed to clean unnecessary files: {e}")
 
-    def _update_settings(self, project_path: str, project_name: str, home_app_name: str):
-        settings_path = os.path.join(project_path, project_name, "settings.py")
+    def _update_settings(self, context: dict, home_app_name: str):
         try:
-            self.settings_strategy.update(settings_path, home_app_name)
-        except (IOError, ValueError) as e:
+            self.settings_strategy.update(settings_document(context), home_app_name)
+        except (IOError, ValueError, SyntaxError) as e:
             raise RuntimeError(f"Failed to update settings.py: {e}")
 
-    def _update_urls(self, project_path: str, project_name: str, home_app_name: str):
-        urls_path = os.path.join(project_path, project_name, "urls.py")
+    def _update_urls(self, context: dict, home_app_name: str):
         try:
-            self.urls_strategy.update(urls_path, home_app_name)
-        except IOError as e:
+            self.urls_strategy.update(urls_document(context), home_app_name)
+        except (IOError, ValueError, SyntaxError) as e:
             raise RuntimeError(f"Failed to update urls.py: {e}")
 
 
@@ -210,13 +190,16 @@ class HomePageRenderer(Step):
         if not python_cmd or not project_path or not project_name:
             raise ValueError("Required context data (python_cmd, project_path, or project_name) missing!")
 
+        self.context = context
+        self.fs = project_fs(context)
         home_app_name = "home"
-        self._create_home_app(python_cmd, project_path, home_app_name)
+        used_startapp = self._create_home_app(python_cmd, context.get('venv_path') or '', project_path, home_app_name)
         self._setup_app_structure(project_path, home_app_name)
         self._create_api_files(project_path, home_app_name)
         self._create_templates(project_path, home_app_name)
         self._create_static_files(project_path, home_app_name)
-        self._clean_unnecessary_files(project_path, home_app_name)
-        self._update_settings(project_path, project_name, home_app_name)
-        self._update_urls(project_path, project_name, home_app_name)
+        if used_startapp:
+            self._clean_unnecessary_files(project_path, home_app_name)
+        self._update_settings(context, home_app_name)
+        self._update_urls(context, home_app_name)
         context['apps'] = app_names
@@ -1,19 +1,19 @@
 import os
 from abc import ABC, abstractmethod
 from my_django_starter.builder.base import Step
+from my_django_starter.builder.documents import SettingsDocument, UrlsDocument, settings_document, urls_document
+from my_django_starter.builder.overlay import project_fs
 
 # Strategy: Directory Creation
 class DirectoryCreationStrategy(ABC):
     @abstractmethod
-    def create_directory(self, path: str):
+    def create_directory(self, fs, path: str):
         pass
 
 class MediaDirectoryStrategy(DirectoryCreationStrategy):
-    def create_directory(self, path: str):
+    def create_directory(self, fs, path: str):
         try:
-            os.makedirs(path, exist_ok=True)
-            with open(os.path.join(path, ".gitkeep"), "w") as f:
-                f.write("")
+            fs.write(os.path.join(path, ".gitkeep"), "")
         except (OSError, IOError) as e:
             raise RuntimeError(f"Failed to create media directory: {e}")
 
@@ -21,70 +21,35 @@ class MediaDirectoryStrategy(DirectoryCreationStrategy):
 # Strategy: Settings Update
 class SettingsUpdateStrategy(ABC):
     @abstractmethod
-    def update(self, settings_path: str):
+    def update(self, settings: SettingsDocument):
         pass
 
 class MediaSettingsStrategy(SettingsUpdateStrategy):
-    def update(self, settings_path: str):
-        try:
-            with open(settings_path, "r") as f:
-                settings_content = f.readlines()
-
-            # Check if os import exists
-            os_import_exists = any(line.strip().startswith("import os") for line in settings_content)
-            if not os_import_exists:
-                settings_content.insert(0, "import os\n")
-
-            # Check if MEDIA settings already exist
-            media_settings_exist = any("MEDIA_URL" in line or "MEDIA_ROOT" in line for line in settings_content)
-            if not media_settings_exist:
-                settings_content.append("\n# Media files configuration\n")
-                settings_content.append("MEDIA_URL = '/media/'\n")
-                settings_content.append("MEDIA_ROOT = os.path.join(BASE_DIR, 'media')\n")
-
-            with open(settings_path, "w") as f:
-                f.writelines(settings_content)
-        except IOError as e:
-            raise RuntimeError(f"Failed to update settings.py: {e}")
+    def update(self, settings: SettingsDocument):
+        settings.add_import("import os")
+        # Leave MEDIA settings alone if the project already defines them
+        if "MEDIA_URL" not in settings.names and "MEDIA_ROOT" not in settings.names:
+            settings.set_many({
+                "MEDIA_URL": "'/media/'",
+                "MEDIA_ROOT": "os.path.join(BASE_DIR, 'media')",
+            }, comment="# Media files configuration")
 
 
 # Strategy: URLs Update
 class UrlsUpdateStrategy(ABC):
     @abstractmethod
-    def update(self, urls_path: str):
+    def update(self, urls: UrlsDocument):
         pass
 
 class MediaUrlsStrategy(UrlsUpdateStrategy):
-    def update(self, urls_path: str):
-        try:
-            with open(urls_path, "r") as f:
-                urls_content = f.readlines()
-
-            # Check if media serving configuration already exists
-            media_serving_exists = any("static(settings.MEDIA_URL" in line for line in urls_content)
-            if not media_serving_exists:
-                # Add necessary imports
-                for i, line in enumerate(urls_content):
-                    if line.strip().startswith("from django.urls"):
-                        urls_content[i] = line.rstrip() + ", include\n"
-                        break
-
-                # Add static import and media serving configuration
-                for i, line in enumerate(urls_content):
-                    if line.strip().startswith("urlpatterns"):
-                        urls_content.insert(i, "from django.conf import settings\n")
-                        urls_content.insert(i + 1, "from django.conf.urls.static import static\n")
-                        urls_content.append("\nif settings.DEBUG:\n")
-                        urls_content.append("    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)\n")
-                        break
-
-                with open(urls_path, "w") as f:
-                    f.writelines(urls_content)
-        except IOError as e:
-            raise RuntimeError(f"Failed to update urls.py: {e}")
+    def update(self, urls: UrlsDocument):
+        urls.add_media_serving()
 
 # Main MediaFileHandler Class
 class MediaFileHandler(Step):
+    reads = ('project_path', 'project_name')
+    writes = ('media_root', 'settings_doc', 'urls_doc')
+
     def __init__(self):
         self.directory_strategy = MediaDirectoryStrategy()
         self.settings_strategy = MediaSettingsStrategy()
@@ -98,18 +63,23 @@ class MediaFileHandler(Step):
             raise ValueError("Required context data (project_path or project_name) missing!")
 
         media_path = os.path.join(project_path, "media")
-        settings_path = os.path.join(project_path, project_name, "settings.py")
-        urls_path = os.path.join(project_path, project_name, "urls.py")
 
-        self._create_media_directory(media_path)
-        self._update_settings(settings_path)
-        self._update_urls(urls_path)
+        self._create_media_directory(project_fs(context), media_path)
+        try:
+            self._update_settings(settings_document(context))
+        except (IOError, SyntaxError) as e:
+            raise RuntimeError(f"Failed to update settings.py: {e}")
+        try:
+            self._update_urls(urls_document(context))
+        except (IOError, SyntaxError) as e:
+            raise RuntimeError(f"Failed to update urls.py: {e}")
+        context['media_root'] = media_path
 
-    def _create_media_directory(self, media_path: str):
-        self.directory_strategy.create_directory(media_path)
+    def _create_media_directory(self, fs, media_path: str):
+        self.directory_strategy.create_directory(fs, media_path)
 
-    def _update_settings(self, settings_path: str):
-        self.settings_strategy.update(settings_path)
+    def _update_settings(self, settings: SettingsDocument):
+        self.settings_strategy.update(settings)
 
-    def _update_urls(self, urls_path: str):
-        self.urls_strategy.update(urls_path)
\ No newline at end of file
+    def _update_urls(self, urls: UrlsDocument):
+        self.urls_strategy.update(urls)
\ No newline at end of file
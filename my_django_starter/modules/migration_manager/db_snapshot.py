@@ -0,0 +1,106 @@
+# db_snapshot.py
+import os
+import ast
+import glob
+import hashlib
+import tempfile
+from my_django_starter.builder.commands import get_command_runner
+from my_django_starter.builder.wheelhouse import cache_root
+
+# Runs in the project's venv: migrate the given apps into an empty database.
+# call_command skips system checks, so the minimal settings are enough.
+SNAPSHOT_SOURCE = r'''
+import sys
+import django
+from django.conf import settings
+db_path, apps = sys.argv[1], sys.argv[2:]
+settings.configure(
+    INSTALLED_APPS=apps,
+    DATABASES={"default": {"ENGINE": "django.db.backends.sqlite3", "NAME": db_path}},
+    SECRET_KEY="db-snapshot",
+    USE_TZ=True,
+)
+django.setup()
+from django.core.management import call_command
+call_command("migrate", interactive=False, verbosity=0)
+'''
+
+# The DATABASES block startproject writes; snapshots only apply to it
+DEFAULT_DATABASES = "{'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': BASE_DIR / 'db.sqlite3'}}"
+
+
+def default_snapshot_root() -> str:
+    return os.path.join(cache_root(), "db-snapshots")
+
+
+def installed_django_version(venv_path: str) -> str:
+    """Django's version in the venv, from its dist-info directory name."""
+    patterns = [
+        os.path.join(venv_path, "lib", "python*", "site-packages", "[Dd]jango-*.dist-info"),
+        os.path.join(venv_path, "Lib", "site-packages", "[Dd]jango-*.dist-info"),
+    ]
+    for pattern in patterns:
+        for match in glob.glob(pattern):
+            return os.path.basename(match)[len("django-"):-len(".dist-info")]
+    return None
+
+
+def snapshot_apps(settings) -> list:
+    """
+    The contrib apps a snapshot would cover, or None when settings.py strays
+    from what a snapshot can stand in for (other database, custom user model).
+    """
+    if "AUTH_USER_MODEL" in settings.names:
+        return None
+    databases = settings.names.get("DATABASES")
+    if databases is None:
+        return None
+    value = ast.parse(databases.text).body[0].value
+    if ast.dump(value) != ast.dump(ast.parse(DEFAULT_DATABASES, mode="eval").body):
+        return None
+    try:
+        installed_apps = settings.get("INSTALLED_APPS")
+    except (KeyError, ValueError):
+        return None
+    return sorted(app for app in installed_apps if app.startswith("django.contrib."))
+
+
+class SnapshotCache:
+    """
+    db.sqlite3 files with only the contrib apps' migrations applied, keyed by
+    Django version and the set of contrib apps. A new project starts from a
+    copy, so `migrate` only has the project's own apps left to apply.
+    """
+
+    def __init__(self, root: str = None):
+        self.root = root or default_snapshot_root()
+
+    def key(self, django_version: str, apps: list) -> str:
+        digest = hashlib.sha1("\n".join(sorted(apps)).encode()).hexdigest()[:12]
+        return f"django-{django_version}-{digest}"
+
+    def path(self, django_version: str, apps: list) -> str:
+        return os.path.join(self.root, self.key(django_version, apps) + ".sqlite3")
+
+    def get(self, django_version: str, apps: list) -> str:
+        path = self.path(django_version, apps)
+        return path if os.path.isfile(path) else None
+
+    def build(self, python_cmd: str, django_version: str, apps: list) -> str:
+        """Migrate a fresh database for `apps` and store it; safe to race with other builders."""
+        os.makedirs(self.root, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(suffix=".sqlite3.tmp", dir=self.root)
+        os.close(fd)
+        os.remove(tmp_path)  # sqlite must create the file itself
+        try:
+            get_command_runner().run([python_cmd, "-c", SNAPSHOT_SOURCE, tmp_path] + list(apps),
+                                     label="db snapshot", capture=True)
+            path = self.path(django_version, apps)
+            os.replace(tmp_path, path)
+            return path
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def get_or_build(self, python_cmd: str, django_version: str, apps: list) -> str:
+        return self.get(django_version, apps) or self.build(python_cmd, django_version, apps)
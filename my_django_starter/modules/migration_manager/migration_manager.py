@@ -1,26 +1,59 @@
 import os
+import shutil
 import subprocess
 from my_django_starter.builder.base import Step
+from my_django_starter.builder.documents import commit_project, settings_document
+from my_django_starter.builder.manage_worker import get_manage_worker
 from my_django_starter.animations.terminal_fx import status_tag, type_writer
+from .db_snapshot import SnapshotCache, installed_django_version, snapshot_apps
+from .model_scan import ModelState
 
 
 class MigrationManager(Step):
+    reads = ('python_cmd', 'venv_path', 'project_path', 'app_names', 'generated_migrations', 'apps', 'settings_doc', 'urls_doc')
+    writes = ('migrated_apps',)
 
-    def _run_makemigrations(self, python_cmd, manage_py, app_names):
+    def __init__(self, snapshots: SnapshotCache = None):
+        self.snapshots = snapshots or SnapshotCache()
+
+    def _restore_snapshot(self, context, python_cmd, project_path):
+        """
+        Start a new project's database from a cached copy with the contrib
+        apps already migrated, so `migrate` only applies the project's apps.
+        """
+        db_path = os.path.join(project_path, "db.sqlite3")
+        if os.path.exists(db_path):
+            return
+        apps = snapshot_apps(settings_document(context))
+        django_version = installed_django_version(context.get("venv_path") or "")
+        if apps is None or not django_version:
+            return
+        try:
+            snapshot = self.snapshots.get_or_build(python_cmd, django_version, apps)
+            shutil.copyfile(snapshot, db_path)
+        except (subprocess.SubprocessError, OSError) as e:
+            status_tag(f"DATABASE SNAPSHOT SKIPPED: {e}", color="YELLOW")
+            return
+        status_tag(f"DATABASE RESTORED FROM SNAPSHOT (Django {django_version})", color="GREEN")
+
+    def _run_makemigrations(self, worker, app_names):
         type_writer("[🔧 DATABASE SETUP  ...]", color="CYAN")
         print()
         type_writer("[🔧 MAKEMIGRATIONS  ...]", color="CYAN")
         print()
+        if not app_names:
+            status_tag("NO MODEL CHANGES, MAKEMIGRATIONS SKIPPED", color="GREEN")
+            return
         try:
-            subprocess.run([python_cmd, manage_py, "makemigrations"] + app_names, check=True)
+            worker.call(["makemigrations"] + app_names, label="makemigrations")
         except subprocess.CalledProcessError as e:
             raise RuntimeError("makemigrations failed") from e
 
-    def _run_migrate(self, python_cmd, manage_py):
+    def _run_migrate(self, worker):
         type_writer("[🔧 MIGRATE  ...]", color="CYAN")
         print()
         try:
-            subprocess.run([python_cmd, manage_py, "migrate"], check=True)
+            worker.call(["migrate"], label="migrate")
         except subprocess.CalledProcessError as e:
             raise RuntimeError("migrate failed") from e
 
@@ -32,8 +65,23 @@ class MigrationManager(Step):
         if not python_cmd or not project_path:
             raise ValueError("Missing 'python_cmd' or 'project_path' in context")
 
-        manage_py = os.path.join(project_path, "manage.py")
+        # Django is about to read the project, so everything generated so far
+        # goes to disk now
+        commit_project(context)
 
-        self._run_makemigrations(python_cmd, manage_py, app_names)
-        self._run_migrate(python_cmd, manage_py)
+        # Both commands share one Django process (see builder/manage_worker.py)
+        worker = get_manage_worker(python_cmd, project_path)
+        # Before makemigrations, whose consistency check creates the database
+        self._restore_snapshot(context, python_cmd, project_path)
+        # Fresh apps have an empty models.py, apps with models from the spec
+        # come with their initial migration, and unchanged ones were handled
+        # by an earlier run; only the rest go through the autodetector
+        model_state = ModelState(project_path)
+        generated = set(context.get("generated_migrations") or ())
+        pending = [app for app in model_state.pending(app_names)
+                   if app not in generated or app in model_state.fingerprints]
+        self._run_makemigrations(worker, pending)
+        model_state.record(app_names)
+        self._run_migrate(worker)
+        context["migrated_apps"] = app_names
         
\ No newline at end of file
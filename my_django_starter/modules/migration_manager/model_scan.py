@@ -0,0 +1,96 @@
+# model_scan.py
+import os
+import ast
+import json
+import glob
+import hashlib
+
+MODELS_STATE_FILE = ".mydjango_models.json"
+
+
+def _model_sources(app_dir: str) -> list:
+    """models.py, or every module of a models/ package."""
+    package = os.path.join(app_dir, "models")
+    if os.path.isdir(package):
+        return sorted(glob.glob(os.path.join(package, "*.py")))
+    path = os.path.join(app_dir, "models.py")
+    return [path] if os.path.isfile(path) else []
+
+
+def _migration_files(app_dir: str) -> list:
+    return sorted(
+        os.path.basename(path) for path in glob.glob(os.path.join(app_dir, "migrations", "*.py"))
+        if os.path.basename(path) != "__init__.py"
+    )
+
+
+def defines_models(app_dir: str) -> bool:
+    """
+    Whether the app's models module declares any class. Any class counts (it
+    may subclass a project base model), and so does a file that doesn't parse,
+    so makemigrations still gets to report the error.
+    """
+    for path in _model_sources(app_dir):
+        with open(path, "rb") as f:
+            source = f.read()
+        try:
+            tree = ast.parse(source)
+        except SyntaxError:
+            return True
+        if any(isinstance(node, ast.ClassDef) for node in tree.body):
+            return True
+    return False
+
+
+def needs_makemigrations(app_dir: str) -> bool:
+    # An app with migrations but no models any more still needs a
+    # migration that deletes them
+    return defines_models(app_dir) or bool(_migration_files(app_dir))
+
+
+def app_fingerprint(app_dir: str) -> str:
+    """Hash of the app's model sources and the names of its migrations."""
+    digest = hashlib.sha1()
+    for path in _model_sources(app_dir):
+        digest.update(os.path.relpath(path, app_dir).encode() + b"\0")
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    for name in _migration_files(app_dir):
+        digest.update(b"\0migration:" + name.encode())
+    return digest.hexdigest()
+
+
+class ModelState:
+    """
+    Fingerprints of each app's models as of the last successful
+    makemigrations, kept in the project root so a resumed run (or the next one)
+    only passes apps whose models changed.
+    """
+
+    def __init__(self, project_path: str):
+        self.project_path = project_path
+        self.path = os.path.join(project_path, MODELS_STATE_FILE)
+        try:
+            with open(self.path, "r") as f:
+                self.fingerprints = json.load(f)
+        except (OSError, ValueError):
+            self.fingerprints = {}
+
+    def pending(self, app_names: list) -> list:
+        """The apps makemigrations still has to look at."""
+        pending = []
+        for app_name in app_names:
+            app_dir = os.path.join(self.project_path, app_name)
+            if self.fingerprints.get(app_name) == app_fingerprint(app_dir):
+                continue
+            if needs_makemigrations(app_dir):
+                pending.append(app_name)
+        return pending
+
+    def record(self, app_names: list):
+        for app_name in app_names:
+            self.fingerprints[app_name] = app_fingerprint(os.path.join(self.project_path, app_name))
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.fingerprints, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
@@ -4,6 +4,9 @@ from my_django_starter.builder.base import Step
 from my_django_starter.animations.terminal_fx import status_tag
 
 class OSDetector(Step):
+    reads = ()
+    writes = ('os',)
+
     def execute(self, context: dict):
         os_name = platform.system()
         context['os'] = os_name
@@ -2,9 +2,49 @@ import os
 import subprocess
 import re
 from my_django_starter.builder.base import Step
+from my_django_starter.builder.commands import get_command_runner
 from my_django_starter.animations.terminal_fx import status_tag, type_writer
+from abc import ABC, abstractmethod
+from my_django_starter.builder.django_templates import UnsupportedTemplate, check_module_name, load_template
+from my_django_starter.builder.documents import SETTINGS_DOC, URLS_DOC
+from my_django_starter.builder.overlay import OVERLAY, project_fs
+
+
+# ---------------- Project Creation Strategies ----------------
+class ProjectCreationStrategy(ABC):
+    @abstractmethod
+    def create_project(self, project_name: str, context: dict):
+        pass
+
+
+class StartProjectStrategy(ProjectCreationStrategy):
+    def create_project(self, project_name: str, context: dict):
+        get_command_runner().run([context['python_cmd'], "-m", "django", "startproject", project_name], label="startproject", cwd=os.getcwd())
+
+
+class TemplateRenderStrategy(ProjectCreationStrategy):
+    """
+    Render the venv's own project_template in-process instead of spawning
+    `django-admin startproject`; falls back to the subprocess when the
+    template needs Django's real template engine.
+    """
+    def __init__(self, fallback: ProjectCreationStrategy = None):
+        self.fallback = fallback or StartProjectStrategy()
+
+    def create_project(self, project_name: str, context: dict):
+        try:
+            template = load_template(context['venv_path'], "project")
+            check_module_name(project_name)
+        except (UnsupportedTemplate, KeyError, OSError, SyntaxError, ValueError):
+            return self.fallback.create_project(project_name, context)
+        template.render(project_name, context['project_path'], fs=project_fs(context))
 
 class ProjectCreator(Step):
+    reads = ('python_cmd', 'venv_path', 'django_version')
+    writes = ('project_path', 'project_name', 'current_dir', 'stdin')
+
+    def __init__(self, strategy: ProjectCreationStrategy = None):
+        self.strategy = strategy or TemplateRenderStrategy()
 
     def is_valid_identifier(self, name: str) -> bool:
         return bool(re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', name))
@@ -12,7 +52,14 @@ class ProjectCreator(Step):
     def suggest_name(self, name: str) -> str:
         return re.sub(r'[^a-zA-Z0-9_]', '_', name).strip('_')
 
-    def get_valid_project_name(self) -> str:
+    def get_valid_project_name(self, context: dict) -> str:
+        spec = context.get('spec')
+        if spec is not None:
+            project_name = str(spec.get('project_name') or '').strip()
+            if not self.is_valid_identifier(project_name):
+                raise ValueError(f"'{project_name}' is NOT a valid Python identifier (try '{self.suggest_name(project_name)}')")
+            return project_name
+
         while True:
             project_name = input("4) ROOT FOLDER NAME OF DJANGO PROJECT : ").strip()
 
@@ -31,19 +78,24 @@ class ProjectCreator(Step):
             if retry == 'y' and suggested_name:
                 return suggested_name 
 
-    def create_django_project(self, python_cmd: str, project_name: str, context: dict): 
+    def create_django_project(self, project_name: str, context: dict):
         try:
-            subprocess.run([python_cmd, "-m", "django", "startproject", project_name], check=True)
-            status_tag(f"DJANGO PROJECT '{project_name}' CREATED", symbol="✅", color="GREEN")
-
             project_path = os.path.abspath(project_name)
             context['project_path'] = project_path
             context['project_name'] = project_name
+            # Anything left over from an earlier attempt describes another tree
+            for key in (OVERLAY, SETTINGS_DOC, URLS_DOC):
+                context.pop(key, None)
+
+            self.strategy.create_project(project_name, context)
+            status_tag(f"DJANGO PROJECT '{project_name}' CREATED", symbol="✅", color="GREEN")
 
-            os.chdir(project_path)
-            context['current_dir'] = os.getcwd()
+            # The rendered project only reaches disk when the overlay is committed
+            if os.path.isdir(project_path):
+                os.chdir(project_path)
+            context['current_dir'] = project_path
 
-        except subprocess.CalledProcessError:
+        except (subprocess.CalledProcessError, RuntimeError):
             status_tag(f"ERROR CREATING PROJECT '{project_name}'", symbol="❌", color="RED")
             raise
 
@@ -53,5 +105,5 @@ class ProjectCreator(Step):
         if not python_cmd:
             raise ValueError("❌ Python command not found in context!")
 
-        project_name = self.get_valid_project_name()
-        self.create_django_project(python_cmd, project_name, context)
\ No newline at end of file
+        project_name = self.get_valid_project_name(context)
+        self.create_django_project(project_name, context)
\ No newline at end of file
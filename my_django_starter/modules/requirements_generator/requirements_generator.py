@@ -1,10 +1,16 @@
 import os
 import subprocess
 from my_django_starter.builder.base import Step
+from my_django_starter.builder.commands import get_command_runner
+from my_django_starter.builder.overlay import project_fs
+from my_django_starter.builder.packages import format_lock, format_requirements, installed_distributions
+from my_django_starter.builder.wheelhouse import Wheelhouse
 from my_django_starter.animations.terminal_fx import status_tag, type_writer
 
- 
+
 class RequirementsGenerator(Step):
+    reads = ('venv_path', 'pip_cmd', 'project_path', 'installed_packages', 'wheelhouse', 'lock')
+    writes = ('requirements_path',)
 
     def _extract_context(self, context):
         pip_cmd = context.get("pip_cmd")
@@ -14,17 +20,41 @@ class RequirementsGenerator(Step):
             raise ValueError("Missing 'pip_cmd' or 'project_path' in context")
         return pip_cmd, project_path
 
-    def _generate_requirements(self, pip_cmd, requirements_path):
+    def _generate_requirements(self, fs, venv_path, pip_cmd, requirements_path):
+        """Write requirements.txt; returns the pinned {name: version}, or None if pip freeze had to do it."""
         try:
-            with open(requirements_path, "w") as f:
-                subprocess.run([pip_cmd, "freeze"], stdout=f, check=True)
+            # Read the venv's metadata directly; pip freeze only for what that can't reproduce
+            installed = installed_distributions(venv_path) if venv_path else None
+            if installed is not None:
+                content = format_requirements(installed)
+            else:
+                content = get_command_runner().run([pip_cmd, "freeze"], label="pip freeze", capture=True).output
+            fs.write(requirements_path, content)
+            return installed
         except (subprocess.CalledProcessError, IOError):
             status_tag("ERROR GENERATING requirements.txt", symbol="❌", color="RED")
             raise
 
+    def _generate_lock(self, fs, installed, wheelhouse, lock_path):
+        if installed is None:
+            status_tag("NO requirements.lock: the venv has packages pip freeze must describe", color="YELLOW")
+            return
+        hashes = Wheelhouse(wheelhouse).hashes(installed)
+        missing = [name for name in installed if name not in hashes]
+        if missing:
+            status_tag(f"NO requirements.lock: no cached wheel for {', '.join(sorted(missing))} "
+                       f"(fill the wheelhouse with 'mydjango cache prefetch')", color="YELLOW")
+            return
+        fs.write(lock_path, format_lock(installed, hashes))
+        status_tag("requirements.lock WRITTEN", symbol="✅", color="GREEN")
+
     def execute(self, context: dict):
         type_writer("[🔧 GENERATING REQUIREMENTS.TXT ...]", color="CYAN")
         print()
         pip_cmd, project_path = self._extract_context(context)
+        fs = project_fs(context)
         requirements_path = os.path.join(project_path, "requirements.txt")
-        self._generate_requirements(pip_cmd, requirements_path)
\ No newline at end of file
+        installed = self._generate_requirements(fs, context.get('venv_path'), pip_cmd, requirements_path)
+        if context.get('lock'):
+            self._generate_lock(fs, installed, context.get('wheelhouse'), os.path.join(project_path, "requirements.lock"))
+        context['requirements_path'] = requirements_path
@@ -0,0 +1,77 @@
+# readiness.py
+import time
+import socket
+import http.client
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8000
+
+
+class ServerNotReady(RuntimeError):
+    """The server exited, or never answered, before the deadline."""
+
+
+def probe_host(host: str) -> str:
+    """Where to connect to reach a server bound to `host` (wildcards mean loopback)."""
+    host = host.strip("[]")
+    if host in ("", "0.0.0.0"):
+        return "127.0.0.1"
+    if host == "::":
+        return "::1"
+    return host
+
+
+def url(host: str, port: int, path: str = "/") -> str:
+    host = probe_host(host)
+    return f"http://[{host}]:{port}{path}" if ":" in host else f"http://{host}:{port}{path}"
+
+
+def port_available(host: str, port: int) -> bool:
+    """Whether something could bind `host:port` right now."""
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    with socket.socket(family, socket.SOCK_STREAM) as sock:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            sock.bind((host.strip("[]"), port))
+        except OSError:
+            return False
+    return True
+
+
+def _http_status(host: str, port: int, path: str, timeout: float) -> int:
+    connection = http.client.HTTPConnection(host, port, timeout=timeout)
+    try:
+        connection.request("GET", path, headers={"User-Agent": "my-django-starter readiness probe"})
+        return connection.getresponse().status
+    finally:
+        connection.close()
+
+
+def wait_until_ready(process, host: str, port: int, path: str = "/", timeout: float = 30.0,
+                     interval: float = 0.05, started: float = None) -> dict:
+    """
+    Poll until `process` accepts TCP connections on host:port and answers an
+    HTTP GET for `path` (any status counts: the server is up). Returns the
+    seconds from `started` to the first connection and to the first response.
+    Raises ServerNotReady if the process exits or `timeout` passes first.
+    """
+    started = time.perf_counter() if started is None else started
+    deadline = started + timeout
+    target = probe_host(host)
+    connected = None
+    while True:
+        returncode = process.poll()
+        if returncode is not None:
+            raise ServerNotReady(f"server exited with code {returncode} before answering on {url(host, port)}")
+        now = time.perf_counter()
+        if now > deadline:
+            stage = "answered HTTP" if connected is not None else "accepted connections"
+            raise ServerNotReady(f"server never {stage} on {url(host, port)} within {timeout:.0f}s")
+        try:
+            if connected is None:
+                socket.create_connection((target, port), timeout=min(1.0, deadline - now)).close()
+                connected = time.perf_counter() - started
+            status = _http_status(target, port, path, timeout=max(0.1, min(5.0, deadline - now)))
+            return {"connect": connected, "first_response": time.perf_counter() - started, "status": status}
+        except (OSError, http.client.HTTPException):
+            time.sleep(interval)
@@ -1,14 +1,112 @@
 import os
+import time
+import signal
 import subprocess
+from abc import ABC, abstractmethod
 from my_django_starter.builder.base import Step
-from my_django_starter.animations.terminal_fx import status_tag, type_writer
+from my_django_starter.builder.documents import commit_project
+from my_django_starter.animations.terminal_fx import status_tag
+from .readiness import DEFAULT_HOST, DEFAULT_PORT, ServerNotReady, port_available, url, wait_until_ready
+
+
+def available_cpus() -> int:
+    """CPUs this process may run on (respects affinity masks and cgroup pinning)."""
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return os.cpu_count() or 1
+
+
+# Strategy interface
+class ServerStrategy(ABC):
+    name = None
+    label = "SERVER"
+    package = None  # installed with Django when this server is chosen
+
+    @abstractmethod
+    def command(self, python_cmd: str, project_path: str, project_name: str, host: str, port: int) -> list:
+        pass
+
+
+# Strategy: Django's single-threaded development server
+class RunserverStrategy(ServerStrategy):
+    name = "runserver"
+    label = "DEVELOPMENT SERVER"
+
+    def command(self, python_cmd, project_path, project_name, host, port):
+        addrport = f"[{host}]:{port}" if ":" in host else f"{host}:{port}"
+        return [python_cmd, os.path.join(project_path, "manage.py"), "runserver", addrport]
+
+
+# Strategy: gunicorn with threaded workers, sized from the CPU count
+class GunicornStrategy(ServerStrategy):
+    name = "gunicorn"
+    label = "GUNICORN SERVER"
+    package = "gunicorn"
+
+    def __init__(self, preload: bool = False, cpus: int = None):
+        self.preload = preload
+        cpus = cpus or available_cpus()
+        self.workers = 2 * cpus + 1  # gunicorn's recommended starting point
+        self.threads = 2 if cpus > 1 else 4
+
+    def command(self, python_cmd, project_path, project_name, host, port):
+        bind = f"[{host}]:{port}" if ":" in host else f"{host}:{port}"
+        args = [
+            python_cmd, "-m", "gunicorn", f"{project_name}.wsgi:application",
+            "--chdir", project_path, "--bind", bind,
+            "--workers", str(self.workers), "--threads", str(self.threads), "--worker-class", "gthread",
+            "--graceful-timeout", "10", "--access-logfile", "-",
+        ]
+        return args + ["--preload"] if self.preload else args
+
+
+# Strategy: uvicorn serving the ASGI application, one process per CPU
+class UvicornStrategy(ServerStrategy):
+    name = "uvicorn"
+    label = "UVICORN SERVER"
+    package = "uvicorn"
+
+    def __init__(self, cpus: int = None):
+        self.workers = cpus or available_cpus()
+
+    def command(self, python_cmd, project_path, project_name, host, port):
+        return [
+            python_cmd, "-m", "uvicorn", f"{project_name}.asgi:application",
+            "--app-dir", project_path, "--host", host, "--port", str(port),
+            "--lifespan", "off", "--timeout-graceful-shutdown", "10",
+            "--workers", str(self.workers),
+        ]
+
+
+SERVERS = {strategy.name: strategy for strategy in (RunserverStrategy, GunicornStrategy, UvicornStrategy)}
+
+
+def server_strategy(name: str = "runserver", preload: bool = False) -> ServerStrategy:
+    if name not in SERVERS:
+        raise ValueError(f"Unknown server '{name}' (choose from {', '.join(SERVERS)})")
+    if name == "gunicorn" and os.name == "nt":
+        raise ValueError("gunicorn does not run on Windows; use --server=uvicorn or runserver")
+    if name == "gunicorn":
+        return GunicornStrategy(preload=preload)
+    if preload:
+        # uvicorn can only import the app up front by giving up its workers
+        raise ValueError(f"--preload needs --server=gunicorn ({name} cannot preload)")
+    return SERVERS[name]()
+
 
 class ServerRunner(Step):
+    def __init__(self, strategy: ServerStrategy = None, ready_timeout: float = 30.0):
+        self.strategy = strategy or RunserverStrategy()
+        self.ready_timeout = ready_timeout
+        if self.strategy.package:
+            self.packages = (self.strategy.package,)
+
     def execute(self, context: dict):
         """Template Method: Defines the skeleton of the algorithm."""
         python_cmd, project_path = self._validate_context(context)
+        commit_project(context)  # the server runs until Ctrl+C, so don't wait for the pipeline to finish
         self._change_directory(project_path)
-        self._run_server(python_cmd, project_path)
+        self._run_server(python_cmd, project_path, context)
 
     def _validate_context(self, context: dict) -> tuple[str, str]:
         """Validate required context data."""
@@ -27,21 +125,76 @@ class ServerRunner(Step):
             status_tag(f"ERROR CHANGING TO PROJECT DIRECTORY: {project_path}", symbol="❌", color="RED")
             raise RuntimeError(f"Failed to change directory: {e}")
 
-    def _run_server(self, python_cmd: str, project_path: str):
-        """Run the Django development server."""
-        manage_py = os.path.join(project_path, "manage.py")
+    def _address(self) -> tuple[str, int]:
+        """DJANGO_HOST / DJANGO_PORT, defaulting to runserver's own 127.0.0.1:8000."""
+        host = os.getenv('DJANGO_HOST', DEFAULT_HOST).strip("[]") or DEFAULT_HOST
+        try:
+            port = int(os.getenv('DJANGO_PORT', DEFAULT_PORT))
+        except ValueError:
+            raise ValueError(f"DJANGO_PORT must be a number, not {os.getenv('DJANGO_PORT')!r}")
+        return host, port
+
+    def _stop(self, process):
+        """Ask the server to finish in-flight requests, then make sure it is gone."""
+        if process.poll() is None:
+            self._signal(process, signal.SIGTERM)
+            try:
+                process.wait(timeout=15)
+            except subprocess.TimeoutExpired:
+                self._signal(process, signal.SIGKILL if os.name != "nt" else signal.SIGTERM)
+                process.wait()
+
+    def _signal(self, process, signum):
+        # The whole group: runserver's reloader and gunicorn/uvicorn workers too
+        if os.name == "nt":
+            process.send_signal(signum)
+            return
+        try:
+            os.killpg(process.pid, signum)
+        except ProcessLookupError:
+            pass
+
+    def _popen(self, args: list):
+        # Own process group: Ctrl+C reaches only us, and we stop the server
+        # with SIGTERM, which gunicorn and uvicorn treat as a graceful shutdown
+        if os.name == "nt":
+            return subprocess.Popen(args, creationflags=subprocess.CREATE_NEW_PROCESS_GROUP)
+        return subprocess.Popen(args, start_new_session=True)
+
+    def _run_server(self, python_cmd: str, project_path: str, context: dict):
+        """Run the chosen server and wait until it answers."""
+        label = self.strategy.label
+        host, port = self._address()
+        if not port_available(host, port):
+            status_tag(f"PORT {port} ON {host} IS ALREADY IN USE (set DJANGO_PORT to pick another)", symbol="❌", color="RED")
+            raise RuntimeError(f"Cannot start the {label.lower()}: {host}:{port} is already in use")
+
+        args = self.strategy.command(python_cmd, project_path, context.get('project_name'), host, port)
+        started = time.perf_counter()
+        try:
+            process = self._popen(args)
+        except OSError as e:
+            status_tag(f"ERROR STARTING {label}", symbol="❌", color="RED")
+            raise RuntimeError(f"Failed to start the {label.lower()}: {e}")
+
         try:
-            process = subprocess.Popen([python_cmd, manage_py, "runserver"])
-            host = os.getenv('DJANGO_HOST', '127.0.0.1')
-            port = os.getenv('DJANGO_PORT', '8000')
+            try:
+                ready = wait_until_ready(process, host, port, timeout=self.ready_timeout, started=started)
+            except ServerNotReady as e:
+                status_tag(f"{label} FAILED: {e}", symbol="❌", color="RED")
+                raise RuntimeError(f"{label.capitalize()} did not start: {e}") from e
 
-            status_tag(f"[✅ DEVELOPMENT SERVER STARTED AT http://{host}:{port}]", color="GREEN")
+            context['server_url'] = url(host, port)
+            context['server_startup'] = ready['first_response']
+            status_tag(f"[✅ {label} READY AT {url(host, port)} "
+                       f"(first response in {ready['first_response']:.2f}s)]", color="GREEN")
             print()
             status_tag("[📌 STOP THE SERVER WITH CTRL+C]", color="YELLOW")
             print()
             process.wait()
-        except subprocess.CalledProcessError as e:
-            status_tag("ERROR STARTING DEVELOPMENT SERVER", symbol="❌", color="RED")
-            raise RuntimeError(f"Failed to start development server: {e}")
         except KeyboardInterrupt:
-            status_tag("[✅ DEVELOPMENT SERVER STOPPED]", color="GREEN")
\ No newline at end of file
+            status_tag(f"[🛑 STOPPING {label} ...]", color="YELLOW")
+            self._stop(process)
+            status_tag(f"[✅ {label} STOPPED]", color="GREEN")
+        finally:
+            self._stop(process)
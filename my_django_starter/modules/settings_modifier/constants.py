@@ -38,14 +38,11 @@ NOT_FOUND_HTML_CONTENT = """<!DOCTYPE html>
 """
 
 # Static files configuration for settings.py
-STATIC_SETTINGS = [
-    "\n",
-    "# Static files configuration\n",
-    "STATIC_URL = 'static/'\n",
-    "STATICFILES_DIRS = [\n",
-    "    BASE_DIR / 'static',\n",
-    "]\n"
-]
+STATIC_COMMENT = "# Static files configuration"
+STATIC_SETTINGS = {
+    "STATIC_URL": "'static/'",
+    "STATICFILES_DIRS": "[\n    BASE_DIR / 'static',\n]",
+}
 
 # URL imports for urls.py
 URL_IMPORTS = [
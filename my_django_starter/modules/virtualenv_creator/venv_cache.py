@@ -0,0 +1,181 @@
+# venv_cache.py
+import os
+import hashlib
+import sys
+import json
+import time
+import shutil
+import platform
+import tempfile
+from my_django_starter.builder.wheelhouse import cache_root
+
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3  # 2 GiB
+META_FILE = "meta.json"
+
+
+def default_cache_root() -> str:
+    return os.path.join(cache_root(), "venvs")
+
+
+def cache_key(django_version: str = None, packages: list = ()) -> str:
+    """Templates are only interchangeable for the same interpreter build, Django pin and extra packages."""
+    python = f"{platform.python_implementation().lower()}{platform.python_version()}"
+    key = f"{python}-django-{django_version or 'none'}"
+    if django_version and packages:
+        key += "-" + hashlib.sha1("\n".join(sorted(packages)).encode()).hexdigest()[:8]
+    return key
+
+
+def _tree_size(path: str) -> int:
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            full = os.path.join(root, name)
+            if not os.path.islink(full):
+                total += os.path.getsize(full)
+    return total
+
+
+class VenvCache:
+    """
+    Ready-made virtual environments keyed by interpreter and Django version,
+    with size-bounded LRU eviction. Each entry is `<root>/<key>/venv` plus a
+    meta.json recording its size and when it was last cloned.
+    """
+
+    def __init__(self, root: str = None, max_bytes: int = None):
+        self.root = root or default_cache_root()
+        max_mb = os.environ.get("MYDJANGO_VENV_CACHE_MAX_MB")
+        self.max_bytes = max_bytes or (int(max_mb) * 1024 ** 2 if max_mb else DEFAULT_MAX_BYTES)
+
+    def _entry(self, key: str) -> str:
+        return os.path.join(self.root, key)
+
+    def _read_meta(self, key: str) -> dict:
+        try:
+            with open(os.path.join(self._entry(key), META_FILE)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_meta(self, key: str, meta: dict):
+        path = os.path.join(self._entry(key), META_FILE)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(meta, f, indent=2)
+        os.replace(tmp_path, path)
+
+    def metadata(self, key: str) -> dict:
+        return self._read_meta(key)
+
+    def get(self, key: str) -> str:
+        """Return the template venv for `key`, or None on a miss."""
+        venv = os.path.join(self._entry(key), "venv")
+        if not os.path.isfile(os.path.join(venv, "pyvenv.cfg")):
+            return None
+        meta = self._read_meta(key)
+        meta["last_used"] = time.time()
+        self._write_meta(key, meta)
+        return venv
+
+    def build(self, key: str, populate) -> str:
+        """
+        Create the template for `key` in a scratch directory with
+        `populate(venv_path)` and move it into place. `populate` may return a
+        dict of extra metadata (e.g. the resolved packages). Concurrent builders
+        of the same key race harmlessly: the loser discards its copy.
+        """
+        venv = os.path.join(self._entry(key), "venv")
+        os.makedirs(self._entry(key), exist_ok=True)
+        scratch = tempfile.mkdtemp(prefix=f".{key}-", dir=self.root)
+        try:
+            extra = populate(os.path.join(scratch, "venv")) or {}
+            staged = os.path.join(scratch, "staged")
+            clone_venv(os.path.join(scratch, "venv"), staged, link=False, final_path=venv)
+            try:
+                os.rename(staged, venv)
+            except OSError:
+                return self.get(key)  # another process finished first
+            self._write_meta(key, {
+                "key": key,
+                "python": sys.version.split()[0],
+                "size": _tree_size(venv),
+                "created": time.time(),
+                "last_used": time.time(),
+                **extra,
+            })
+        finally:
+            shutil.rmtree(scratch, ignore_errors=True)
+        self.evict(keep=key)  # never the template the caller is about to clone
+        return venv
+
+    def entries(self) -> list:
+        found = []
+        if os.path.isdir(self.root):
+            for key in os.listdir(self.root):
+                meta = self._read_meta(key)
+                if meta:
+                    found.append(meta)
+        return found
+
+    def evict(self, keep: str = None):
+        """Drop least recently used templates until the cache fits in max_bytes."""
+        entries = sorted(self.entries(), key=lambda meta: meta.get("last_used", 0))
+        total = sum(meta.get("size", 0) for meta in entries)
+        for meta in entries:
+            if total <= self.max_bytes:
+                break
+            if meta["key"] == keep:
+                continue
+            shutil.rmtree(self._entry(meta["key"]), ignore_errors=True)
+            total -= meta.get("size", 0)
+
+
+def _rewrite(src: str, dst: str, old: bytes, new: bytes):
+    with open(src, "rb") as f:
+        data = f.read()
+    with open(dst, "wb") as f:
+        f.write(data.replace(old, new))
+    shutil.copystat(src, dst)
+
+
+def clone_venv(src: str, dst: str, link: bool = True, final_path: str = None):
+    """
+    Copy the venv at `src` to `dst`. Library files are hardlinked when
+    possible (they never change); the scripts directory and pyvenv.cfg are
+    copied with every occurrence of the old venv path replaced by
+    `final_path` (defaults to `dst`, i.e. the clone is used where it lands).
+    """
+    src, dst = os.path.abspath(src), os.path.abspath(dst)
+    old, new = src.encode(), os.path.abspath(final_path or dst).encode()
+    scripts_dir = os.path.join(src, "Scripts" if os.name == "nt" else "bin")
+
+    os.makedirs(dst, exist_ok=True)
+    for root, dirs, files in os.walk(src):
+        # os.walk is top-down, so every parent already exists in the clone.
+        target_root = dst + root[len(src):]
+        if root != src:
+            os.mkdir(target_root)
+
+        for name in list(dirs):
+            source = os.path.join(root, name)
+            if os.path.islink(source):
+                os.symlink(os.readlink(source), os.path.join(target_root, name))
+                dirs.remove(name)
+
+        rewrite_all = os.path.abspath(root) == scripts_dir
+        for name in files:
+            source = os.path.join(root, name)
+            target = os.path.join(target_root, name)
+            if os.path.islink(source):
+                os.symlink(os.readlink(source), target)
+            elif rewrite_all or (root == src and name == "pyvenv.cfg"):
+                _rewrite(source, target, old, new)
+            elif link:
+                try:
+                    os.link(source, target)
+                except OSError:
+                    link = False  # different filesystem: copy from here on
+                    shutil.copy2(source, target)
+            else:
+                shutil.copy2(source, target)
@@ -2,42 +2,93 @@ import os
 import sys 
 import subprocess
 from my_django_starter.builder.base import Step
+from my_django_starter.builder.commands import get_command_runner
+from my_django_starter.builder.packages import install_packages
 from my_django_starter.animations.terminal_fx import status_tag, type_writer
 from abc import ABC, abstractmethod 
+from .venv_cache import VenvCache, cache_key, clone_venv
 
 
 # ---------------- Environment Creation Strategies ----------------
 class EnvCreationStrategy(ABC):
     @abstractmethod
-    def create_env(self, env_name: str):
+    def create_env(self, env_name: str, context: dict = None):
         pass
 
 
 class PythonVenvStrategy(EnvCreationStrategy):
-    def create_env(self, env_name: str):
+    def create_env(self, env_name: str, context: dict = None):
         try:
-            subprocess.run([sys.executable, "-m", "venv", env_name], check=True)
+            get_command_runner().run([sys.executable, "-m", "venv", env_name], label="venv")
         except subprocess.CalledProcessError:
             status_tag("ERROR CREATING VIRTUAL ENVIRONMENT WITH python3 -m venv", symbol="❌", color="RED")
             raise
 
 
 class VirtualenvStrategy(EnvCreationStrategy):
-    def create_env(self, env_name: str):
+    def create_env(self, env_name: str, context: dict = None):
         try:
-            subprocess.run(["virtualenv", env_name], check=True)
+            get_command_runner().run(["virtualenv", env_name], label="virtualenv")
         except subprocess.CalledProcessError:
             status_tag("ERROR CREATING VIRTUAL ENVIRONMENT WITH virtualenv", symbol="❌", color="RED")
             raise
 
 
 class FallbackEnvStrategy(EnvCreationStrategy):
-    def create_env(self, env_name: str):
+    def create_env(self, env_name: str, context: dict = None):
         try:
-            PythonVenvStrategy().create_env(env_name)
+            PythonVenvStrategy().create_env(env_name, context)
         except Exception:
             status_tag("FALLING BACK TO virtualenv...", symbol="⚠️", color="YELLOW")
-            VirtualenvStrategy().create_env(env_name)
+            VirtualenvStrategy().create_env(env_name, context)
+
+
+class CachedVenvStrategy(EnvCreationStrategy):
+    """
+    Clone a ready-made venv (with Django already installed when the version is
+    pinned) from a local cache instead of running `python -m venv` and pip.
+    """
+    def __init__(self, cache: VenvCache = None, fallback: EnvCreationStrategy = None):
+        self.cache = cache or VenvCache()
+        self.fallback = fallback or FallbackEnvStrategy()
+
+    def _pinned_django_version(self, context: dict) -> str:
+        spec = context.get('spec') or {}
+        version = str(spec.get('django_version') or '').strip()
+        return None if version in ("", "latest") else version
+
+    def _populate(self, venv_path: str, requirements: list, context: dict) -> dict:
+        PythonVenvStrategy().create_env(venv_path)
+        if not requirements:
+            return {}
+        pip_cmd = os.path.join(venv_path, "bin", "pip")
+        resolved = install_packages(pip_cmd, requirements, context)
+        return {"requirements": requirements, "resolved": resolved}
+
+    def create_env(self, env_name: str, context: dict = None):
+        context = context if context is not None else {}
+        if os.name == "nt":
+            # Console-script .exe launchers embed absolute paths; not clonable.
+            return self.fallback.create_env(env_name, context)
+
+        django_version = self._pinned_django_version(context)
+        packages = list(context.get('packages', []))
+        # Without a pinned Django the template is a bare venv.
+        requirements = [f"django=={django_version}"] + packages if django_version else []
+        key = cache_key(django_version, packages)
+        template = self.cache.get(key)
+        if template is None:
+            status_tag(f"BUILDING VENV TEMPLATE {key} (FIRST RUN ONLY)", symbol="📦", color="YELLOW")
+            template = self.cache.build(key, lambda venv_path: self._populate(venv_path, requirements, context))
+
+        try:
+            clone_venv(template, env_name)
+        except OSError:
+            status_tag("ERROR CLONING CACHED VIRTUAL ENVIRONMENT", symbol="❌", color="RED")
+            raise
+        meta = self.cache.metadata(key)
+        context.setdefault('installed_packages', []).extend(meta.get('requirements', []))
+        context.setdefault('resolved_packages', {}).update(meta.get('resolved', {}))
 
 
 # ---------------- Activation Command Strategies ----------------
@@ -69,6 +120,9 @@ class PosixActivationStrategy(ActivationCommandStrategy):
 
 # ---------------- Main Virtual Environment Creator ----------------
 class VirtualEnvCreator(Step):
+    reads = ('os', 'packages')
+    writes = ('venv_path', 'python_cmd', 'pip_cmd', 'installed_packages', 'resolved_packages', 'stdin')
+
     def __init__(
         self,
         creation_strategy: EnvCreationStrategy = None,
@@ -77,8 +131,12 @@ class VirtualEnvCreator(Step):
         self.creation_strategy = creation_strategy or FallbackEnvStrategy()
         self.activation_strategy = activation_strategy
 
-    def _prompt_for_env_name(self) -> str:
-        env_name = input("\n2) NAME OF YOUR VIRTUAL ENVIRONMENT: ").strip()
+    def _prompt_for_env_name(self, context: dict) -> str:
+        spec = context.get('spec')
+        if spec is not None:
+            env_name = str(spec.get('venv_name') or '').strip()
+        else:
+            env_name = input("\n2) NAME OF YOUR VIRTUAL ENVIRONMENT: ").strip()
         if not env_name:
             raise ValueError("❌ Virtual environment name cannot be empty!")
         return env_name
@@ -88,8 +146,8 @@ class VirtualEnvCreator(Step):
         type_writer("[🔧 Creating virtual environment...]", color="CYAN")
         print()
 
-    def _create_environment(self, env_name: str):
-        self.creation_strategy.create_env(env_name)
+    def _create_environment(self, env_name: str, context: dict):
+        self.creation_strategy.create_env(env_name, context)
 
     def _initialize_activation_strategy_if_needed(self, context: dict):
         if self.activation_strategy is None:
@@ -105,9 +163,9 @@ class VirtualEnvCreator(Step):
 
     # Main method to execute creation
     def execute(self, context: dict):
-        env_name = self._prompt_for_env_name()
+        env_name = self._prompt_for_env_name(context)
         self._display_creation_banner()
-        self._create_environment(env_name)
+        self._create_environment(env_name, context)
 
         venv_path = os.path.abspath(env_name)
         context['venv_path'] = venv_path
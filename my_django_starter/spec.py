@@ -0,0 +1,152 @@
+# my_django_starter/spec.py
+import os
+import json
+
+# Answers a spec file can provide, i.e. everything the pipeline would
+# otherwise ask for with input()/getpass().
+SPEC_DEFAULTS = {
+    'venv_name': 'venv',
+    'django_version': '',
+    'project_name': None,
+    'apps': [],
+    'models': {},
+    'superuser': {
+        'username': 'admin',
+        'email': 'admin@example.com',
+    },
+    'run_server': True,
+    'server': 'runserver',
+    'preload': False,
+    'venv_cache': False,
+    'lock': False,
+}
+
+PASSWORD_ENV = 'DJANGO_SUPERUSER_PASSWORD'
+
+
+def _read_toml(path: str) -> dict:
+    try:
+        import tomllib  # Python 3.11+
+    except ImportError:
+        try:
+            import tomli as tomllib
+        except ImportError:
+            raise RuntimeError("Reading TOML specs needs Python 3.11+ or 'pip install tomli' (or use a .json spec)")
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
+def load_spec(path: str) -> dict:
+    """Load a project spec from a .toml or .json file."""
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"Spec file not found: {path}")
+    if path.endswith(".json"):
+        with open(path, "r") as f:
+            return json.load(f)
+    return _read_toml(path)
+
+
+def add_spec_arguments(parser):
+    """CLI flags that mirror the keys of a spec file."""
+    group = parser.add_argument_group("headless mode (no prompts)")
+    group.add_argument("--spec", metavar="FILE", help="read every answer from a .toml/.json spec file")
+    group.add_argument("--venv-name", help="name of the virtual environment folder")
+    group.add_argument("--django-version", help="Django version to install (default: latest)")
+    group.add_argument("--project-name", help="root folder name of the Django project")
+    group.add_argument("--app", dest="apps", action="append", metavar="NAME", help="app to create (repeatable)")
+    group.add_argument("--field", dest="fields", action="append", default=[], metavar="APP.MODEL.FIELD=TYPE",
+                       help="model field, e.g. blog.Post.title='CharField(max_length=200)' (repeatable)")
+    group.add_argument("--index", dest="indexes", action="append", default=[], metavar="APP.MODEL=FIELDS",
+                       help="model index over comma-separated fields, e.g. blog.Post=-created,title (repeatable)")
+    group.add_argument("--superuser-username", help="admin username (default: admin)")
+    group.add_argument("--superuser-email", help="admin email (default: admin@example.com)")
+    group.add_argument("--superuser-password", help=f"admin password (prefer the {PASSWORD_ENV} variable)")
+    return group
+
+
+def _split_model_option(option: str, flag: str, parts: int) -> tuple:
+    target, sep, value = option.partition("=")
+    names = target.strip().split(".")
+    if not sep or len(names) != parts or not all(names):
+        raise ValueError(f"{flag} expects {'APP.MODEL.FIELD' if parts == 3 else 'APP.MODEL'}=..., got {option!r}")
+    return names, value.strip()
+
+
+def _cli_models(models: dict, fields: list, indexes: list) -> dict:
+    """Merge --field/--index flags into the spec's `models` table."""
+    models = {app: {name: dict(model) for name, model in (app_models or {}).items()} for app, app_models in models.items()}
+    for option in fields:
+        (app, model, field), definition = _split_model_option(option, "--field", 3)
+        entry = models.setdefault(app, {}).setdefault(model, {})
+        entry['fields'] = dict(entry.get('fields') or {}, **{field: definition})
+    for option in indexes:
+        (app, model), index = _split_model_option(option, "--index", 2)
+        entry = models.setdefault(app, {}).setdefault(model, {})
+        entry['indexes'] = list(entry.get('indexes') or []) + [index]
+    return models
+
+
+def build_spec(args):
+    """
+    Merge a spec file with CLI flags (flags win). Returns None when neither was
+    given, which keeps the pipeline interactive.
+    """
+    flags = {
+        'venv_name': args.venv_name,
+        'django_version': args.django_version,
+        'project_name': args.project_name,
+        'apps': args.apps,
+    }
+    superuser_flags = {
+        'username': args.superuser_username,
+        'email': args.superuser_email,
+        'password': args.superuser_password,
+    }
+    given = [value for value in list(flags.values()) + list(superuser_flags.values()) if value]
+    given += args.fields + args.indexes
+    if not args.spec and not given:
+        return None
+
+    raw = load_spec(args.spec) if args.spec else {}
+    spec = dict(SPEC_DEFAULTS)
+    spec.update({key: value for key, value in raw.items() if key != 'superuser'})
+    spec['superuser'] = dict(SPEC_DEFAULTS['superuser'], **raw.get('superuser', {}))
+    spec.update({key: value for key, value in flags.items() if value is not None})
+    spec['superuser'].update({key: value for key, value in superuser_flags.items() if value is not None})
+    # Keep the password out of the context (and so out of checkpoints);
+    # createsuperuser reads it from the environment anyway.
+    password = spec['superuser'].pop('password', None)
+    if password:
+        os.environ[PASSWORD_ENV] = str(password)
+    # Checked now rather than in AdminSetup, after the whole project is built
+    if not os.environ.get(PASSWORD_ENV, '').strip():
+        raise ValueError(f"Headless mode needs a superuser password (set {PASSWORD_ENV} or pass --superuser-password)")
+
+    if not spec.get('project_name'):
+        raise ValueError("Headless mode needs a project name (project_name in the spec or --project-name)")
+    if not spec.get('apps'):
+        raise ValueError("Headless mode needs at least one app (apps in the spec or --app)")
+    from my_django_starter.modules.app_creator.model_generator import normalize_models
+    spec['models'] = normalize_models(_cli_models(spec.get('models') or {}, args.fields, args.indexes),
+                                      [str(app).strip() for app in spec['apps']])
+    return spec
+
+
+def spec_requirements(spec: dict) -> list:
+    """
+    What a headless run of `spec` (as returned by load_spec) installs with pip:
+    Django, python-decouple, the packages its models import and, when the run
+    ends by starting gunicorn or uvicorn, that server.
+    """
+    from my_django_starter.builder.registry import step_module
+    from my_django_starter.modules.app_creator.model_generator import model_packages, normalize_models
+
+    version = str(spec.get('django_version') or '').strip()
+    requirements = ["django" if version in ("", "latest") else f"django=={version}", "python-decouple"]
+    models = normalize_models(spec.get('models') or {}, [str(app).strip() for app in spec.get('apps') or []])
+    requirements += model_packages(models)
+    if spec.get('run_server', True):
+        package = step_module("ServerRunner").server_strategy(spec.get('server') or "runserver").package
+        if package:
+            requirements.append(package)
+    return requirements
@@ -0,0 +1,130 @@
+# my_django_starter/stats.py
+import os
+import time
+import tempfile
+from my_django_starter.animations.terminal_fx import status_tag
+
+QUANTILES = (50, 95, 99)
+
+
+def add_stats_parser(commands):
+    stats = commands.add_parser("stats", help="percentiles of recorded run and step times")
+    stats.add_argument("--history", metavar="FILE", help="history database (default: ~/.cache/my-django-starter/history.sqlite3)")
+    stats.add_argument("--since", type=float, metavar="DAYS", help="only runs from the last DAYS days")
+    stats.add_argument("--command", dest="run_command", metavar="NAME",
+                       help="only runs of one entry point (mydjango, batch, add-generalapp)")
+    stats.add_argument("--openmetrics", metavar="FILE", help="also write the numbers as an OpenMetrics text file")
+    return stats
+
+
+def _quantiles(values: list) -> list:
+    from my_django_starter.builder.history import percentile
+    return [percentile(values, q) for q in QUANTILES]
+
+
+def _label(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _summary(lines: list, name: str, unit: str, help_text: str, series: dict):
+    """One OpenMetrics summary family; `series` maps a label string to its samples."""
+    lines.append(f"# TYPE {name} summary")
+    if unit:
+        lines.append(f"# UNIT {name} {unit}")
+    lines.append(f"# HELP {name} {help_text}")
+    for labels, values in series.items():
+        for q, value in zip(QUANTILES, _quantiles(values)):
+            lines.append(f'{name}{{{labels}{"," if labels else ""}quantile="{q / 100:g}"}} {value:.6g}')
+        lines.append(f"{name}_count{{{labels}}} {len(values)}")
+        lines.append(f"{name}_sum{{{labels}}} {sum(values):.6g}")
+
+
+def openmetrics(history: dict) -> str:
+    """Render the history as OpenMetrics text (also readable by the Prometheus text parser)."""
+    runs, lines = history["runs"], []
+    ok_runs = [run for run in runs if run["ok"]]
+    commands = sorted({run["command"] for run in runs})
+    by_command = lambda key: {f'command="{_label(c)}"': [run[key] for run in ok_runs if run["command"] == c]
+                              for c in commands if any(run["command"] == c for run in ok_runs)}
+
+    _summary(lines, "mydjango_step_duration_seconds", "seconds", "Wall time of each pipeline step.",
+             {f'step="{_label(step)}"': walls for step, walls in history["steps"].items()})
+    _summary(lines, "mydjango_run_duration_seconds", "seconds", "Wall time of successful runs.", by_command("wall"))
+    _summary(lines, "mydjango_run_subprocesses", "", "Subprocesses started per successful run.", by_command("subprocesses"))
+    _summary(lines, "mydjango_run_written_bytes", "bytes", "Bytes of generated files per successful run.",
+             by_command("bytes_written"))
+
+    lines += ["# TYPE mydjango_runs_recorded gauge", "# HELP mydjango_runs_recorded Runs in the history, by outcome."]
+    for command in commands:
+        for outcome, flag in (("ok", 1), ("failed", 0)):
+            count = sum(1 for run in runs if run["command"] == command and run["ok"] == flag)
+            lines.append(f'mydjango_runs_recorded{{command="{_label(command)}",outcome="{outcome}"}} {count}')
+    if runs:
+        lines += ["# TYPE mydjango_last_run_timestamp_seconds gauge",
+                  "# UNIT mydjango_last_run_timestamp_seconds seconds",
+                  "# HELP mydjango_last_run_timestamp_seconds When the most recent run started.",
+                  f"mydjango_last_run_timestamp_seconds {max(run['started'] for run in runs):.3f}"]
+    return "\n".join(lines + ["# EOF"]) + "\n"
+
+
+def _write_atomically(path: str, content: str):
+    # Node exporter's textfile collector may read at any moment; never show it half a file
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".mydjango-", suffix=".tmp", dir=directory)
+    with os.fdopen(fd, "w") as f:
+        f.write(content)
+    os.chmod(tmp_path, 0o644)
+    os.replace(tmp_path, path)
+
+
+def _print_table(history: dict):
+    runs = history["runs"]
+    failed = sum(1 for run in runs if not run["ok"])
+    versions = {}
+    for run in runs:
+        versions[run["django_version"] or "?"] = versions.get(run["django_version"] or "?", 0) + 1
+    first = time.strftime("%Y-%m-%d", time.localtime(min(run["started"] for run in runs)))
+    status_tag(f"{len(runs)} RUNS ({failed} FAILED) SINCE {first}; DJANGO "
+               + ", ".join(f"{version} x{count}" for version, count in sorted(versions.items())), symbol="📊", color="CYAN")
+    print()
+
+    header = f"{'STEP':<26}{'RUNS':>6}" + "".join(f"{f'P{q} s':>10}" for q in QUANTILES)
+    print(header)
+    print("-" * len(header))
+    for step, walls in history["steps"].items():
+        print(f"{step:<26}{len(walls):>6}" + "".join(f"{value:>10.3f}" for value in _quantiles(walls)))
+    print("-" * len(header))
+    for command in sorted({run["command"] for run in runs}):
+        ok_runs = [run for run in runs if run["ok"] and run["command"] == command]
+        if not ok_runs:
+            continue
+        print(f"{command + ' (whole run)':<26}{len(ok_runs):>6}"
+              + "".join(f"{value:>10.3f}" for value in _quantiles([run["wall"] for run in ok_runs])))
+        print(f"{'  apps per run':<26}{'':>6}" + "".join(f"{value:>10.0f}" for value in _quantiles([run["app_count"] for run in ok_runs])))
+        print(f"{'  subprocesses per run':<26}{'':>6}" + "".join(f"{value:>10.0f}" for value in _quantiles([run["subprocesses"] for run in ok_runs])))
+        print(f"{'  KB written per run':<26}{'':>6}" + "".join(f"{value / 1024:>10.1f}" for value in _quantiles([run["bytes_written"] for run in ok_runs])))
+
+
+def run_stats_command(args) -> int:
+    from my_django_starter.builder.history import default_history_path, load_history
+
+    path = args.history or default_history_path()
+    if path is None:
+        status_tag("RUN HISTORY IS TURNED OFF (MYDJANGO_HISTORY=off)", color="YELLOW")
+        return 1
+    since = time.time() - args.since * 86400 if args.since is not None else None
+    try:
+        history = load_history(path, since=since, command=args.run_command)
+    except FileNotFoundError as e:
+        status_tag(f"{e}: nothing recorded yet", color="YELLOW")
+        return 1
+    if not history["runs"]:
+        status_tag(f"NO RUNS RECORDED IN {path} FOR THAT SELECTION", color="YELLOW")
+        return 1
+
+    _print_table(history)
+    if args.openmetrics:
+        _write_atomically(args.openmetrics, openmetrics(history))
+        print()
+        status_tag(f"OPENMETRICS WRITTEN TO {args.openmetrics}", symbol="✅", color="GREEN")
+    return 0
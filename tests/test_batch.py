@@ -0,0 +1,92 @@
+import os
+import sys
+import subprocess
+import multiprocessing
+import pytest
+from my_django_starter.batch import _scoped_environ, prefetch_wheels
+from my_django_starter.spec import PASSWORD_ENV
+from my_django_starter.builder.commands import get_command_runner
+from my_django_starter.builder.wheelhouse import Wheelhouse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# A wheel directory with Django in it (default: the mydjango wheelhouse)
+WHEELHOUSE = os.environ.get("MYDJANGO_TEST_WHEELHOUSE") or Wheelhouse().path
+
+
+def test_scoped_environ_keeps_the_inherited_password(monkeypatch):
+    monkeypatch.setenv(PASSWORD_ENV, "from-parent")
+    monkeypatch.delenv("PIP_CACHE_DIR", raising=False)
+    with _scoped_environ({"PIP_CACHE_DIR": "/tmp/pip"}):
+        assert os.environ[PASSWORD_ENV] == "from-parent"
+        os.environ[PASSWORD_ENV] = "from-spec"  # what build_spec does for a spec with a password
+    assert os.environ[PASSWORD_ENV] == "from-parent"
+    assert "PIP_CACHE_DIR" not in os.environ
+
+
+def test_scoped_environ_drops_a_password_set_by_a_spec(monkeypatch):
+    monkeypatch.delenv(PASSWORD_ENV, raising=False)
+    with _scoped_environ({}):
+        os.environ[PASSWORD_ENV] = "from-spec"
+    assert PASSWORD_ENV not in os.environ
+
+
+class RecordingWheelhouse:
+    def prefetch(self, requirements):
+        self.requirements = requirements
+
+
+def test_prefetch_covers_model_packages(tmp_path):
+    (tmp_path / "api.toml").write_text('project_name = "api"\napps = ["blog"]\nserver = "uvicorn"\n'
+                                       '[models.blog.Post]\nfields = { title = "CharField(max_length=200)" }\n')
+    (tmp_path / "plain.toml").write_text('project_name = "plain"\napps = ["shop"]\ndjango_version = "4.2"\n')
+    wheelhouse = RecordingWheelhouse()
+    assert prefetch_wheels([str(path) for path in sorted(tmp_path.iterdir())], wheelhouse)
+    # Batch runs never start a server, so uvicorn is not needed
+    assert wheelhouse.requirements == ["django", "django==4.2", "djangorestframework", "python-decouple"]
+
+
+def _run_in_child():
+    get_command_runner().run([sys.executable, "-c", "pass"], capture=True)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork")
+def test_command_runner_works_in_forked_workers():
+    # The parent's runner loop lives on a thread a forked child doesn't get
+    get_command_runner().run([sys.executable, "-c", "pass"], capture=True)
+    child = multiprocessing.get_context("fork").Process(target=_run_in_child)
+    child.start()
+    child.join(60)
+    hung = child.is_alive()
+    if hung:
+        child.terminate()
+    assert not hung and child.exitcode == 0
+
+
+def _django_version(wheelhouse: str):
+    versions = [wheel["version"] for wheel in Wheelhouse(wheelhouse).wheels() if wheel["name"] == "django"]
+    return max(versions, key=lambda v: [int(p) if p.isdigit() else 0 for p in v.split(".")]) if versions else None
+
+
+@pytest.mark.skipif(not _django_version(WHEELHOUSE), reason=f"no Django wheel in {WHEELHOUSE}")
+def test_batch_without_offline(tmp_path):
+    # Not --offline, so the parent prefetches (starting its command runner)
+    # before forking; pip is pointed at the local wheelhouse instead of PyPI.
+    specs = tmp_path / "specs"
+    specs.mkdir()
+    common = (f'venv_name = "env"\ndjango_version = "{_django_version(WHEELHOUSE)}"\napps = ["blog"]\n'
+              'run_server = false\nvenv_cache = true\n')
+    (specs / "alpha.toml").write_text(common + 'project_name = "alpha"\n[superuser]\nusername = "root"\n'
+                                      'email = "root@example.com"\npassword = "alpha-Passw0rd!"\n')
+    # No password of its own: relies on the one the parent passes down
+    (specs / "beta.toml").write_text(common + 'project_name = "beta"\n[superuser]\nusername = "root"\n'
+                                     'email = "root@example.com"\n')
+
+    env = dict(os.environ, PYTHONPATH=ROOT, MYDJANGO_HISTORY="off", MYDJANGO_CACHE_DIR=str(tmp_path / "cache"),
+               PIP_NO_INDEX="1", PIP_FIND_LINKS=WHEELHOUSE, DJANGO_SUPERUSER_PASSWORD="parent-Passw0rd!")
+    result = subprocess.run(
+        [sys.executable, "-m", "my_django_starter.main", "--wheelhouse", WHEELHOUSE, "batch", str(specs),
+         "-j", "1", "-o", str(tmp_path / "out")],
+        env=env, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, timeout=900,
+    )
+    assert result.returncode == 0, result.stdout
+    assert "2/2 PROJECTS SCAFFOLDED" in result.stdout
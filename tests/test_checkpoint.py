@@ -0,0 +1,59 @@
+import os
+import pytest
+from my_django_starter.main import load_resume_state
+from my_django_starter.builder.base import Step
+from my_django_starter.builder.checkpoint import Checkpoint, missing_artifacts
+from my_django_starter.builder.overlay import project_fs
+from my_django_starter.builder.pipeline import Pipeline
+
+
+class Writer(Step):
+    reads = ('project_path',)
+    writes = ('written', 'app_names')
+
+    def execute(self, context):
+        fs = project_fs(context)
+        fs.write(os.path.join(context['project_path'], "manage.py"), "")
+        fs.write(os.path.join(context['project_path'], "blog", "models.py"), "# models\n")
+        fs.write(os.path.join(context['project_path'], "logo.png"), b"\x89PNG")
+        context['written'] = True
+        context['app_names'] = ["blog"]
+
+
+class Finisher(Step):
+    reads = ('written',)
+    writes = ('finished',)
+    fail = True
+
+    def execute(self, context):
+        if self.fail:
+            raise RuntimeError("interrupted")
+        context['finished'] = True
+
+
+def test_resume_keeps_files_that_were_only_in_the_overlay(tmp_path, monkeypatch):
+    project = tmp_path / "site"
+    context = {'project_path': str(project), 'unsaved': object()}
+    with pytest.raises(RuntimeError):
+        Pipeline([Writer(), Finisher()], checkpoint=Checkpoint(str(tmp_path))).build_all(context)
+    assert not project.exists()
+
+    checkpoint, state = Checkpoint.load(str(tmp_path))
+    assert 'unsaved' not in state['context']
+    assert missing_artifacts(state['context']) == []
+    monkeypatch.setattr(Finisher, "fail", False)
+    pipeline = Pipeline([Writer(), Finisher()])
+    context, completed = load_resume_state(pipeline, checkpoint, state)
+    assert completed == {0}
+    pipeline.build_all(context, completed)
+    assert (project / "blog" / "models.py").read_text() == "# models\n"
+    assert (project / "logo.png").read_bytes() == b"\x89PNG"
+
+
+def test_missing_app_directories_are_reported(tmp_path):
+    (tmp_path / "manage.py").write_text("")
+    context = {'project_path': str(tmp_path), 'app_names': ["blog"], 'apps': ["blog"]}
+    assert missing_artifacts(context) == ["app_names", "apps"]
+    (tmp_path / "blog").mkdir()
+    (tmp_path / "home").mkdir()
+    assert missing_artifacts(context) == []
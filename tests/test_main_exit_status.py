@@ -0,0 +1,61 @@
+import os
+import sys
+import subprocess
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def mydjango(*argv, cwd):
+    env = dict(os.environ, PYTHONPATH=ROOT, MYDJANGO_HISTORY="off")
+    env.pop("DJANGO_SUPERUSER_PASSWORD", None)
+    return subprocess.run([sys.executable, "-m", "my_django_starter.main", *argv], cwd=cwd, env=env,
+                          stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+
+
+def test_invalid_spec_exits_2(tmp_path):
+    result = mydjango("--spec", str(tmp_path / "missing.toml"), cwd=tmp_path)
+    assert result.returncode == 2
+    assert "INVALID SPEC" in result.stdout
+
+
+def test_unknown_profile_step_exits_2(tmp_path):
+    result = mydjango("--no-server", "--profile-steps", "NoSuchStep", cwd=tmp_path)
+    assert result.returncode == 2
+    assert "INVALID --profile-steps" in result.stdout
+
+
+def test_headless_run_without_password_exits_2(tmp_path):
+    spec = tmp_path / "spec.toml"
+    spec.write_text('project_name = "site"\napps = ["blog"]\n')
+    result = mydjango("--spec", str(spec), "--no-server", cwd=tmp_path)
+    assert result.returncode == 2
+    assert "superuser password" in result.stdout
+    assert os.listdir(tmp_path) == ["spec.toml"]
+
+
+def test_resume_without_checkpoint_exits_1(tmp_path):
+    result = mydjango("--resume", str(tmp_path), cwd=tmp_path)
+    assert result.returncode == 1
+    assert "CANNOT RESUME" in result.stdout
+    assert not os.listdir(tmp_path)
+
+
+def test_unknown_server_is_a_usage_error(tmp_path):
+    result = mydjango("--no-server", "--server", "nginx", cwd=tmp_path)
+    assert result.returncode == 2
+    assert "invalid choice: 'nginx'" in result.stdout
+
+
+def test_uvicorn_cannot_preload():
+    from my_django_starter.modules.server_runner.server_runner import server_strategy
+    with pytest.raises(ValueError, match="--preload needs --server=gunicorn"):
+        server_strategy("uvicorn", preload=True)
+
+
+def test_server_options_are_ignored_without_a_server(tmp_path):
+    # Gets past the server check; the bad --profile-steps stops it before anything runs
+    result = mydjango("--no-server", "--server", "uvicorn", "--preload", "--profile-steps", "NoSuchStep", cwd=tmp_path)
+    assert result.returncode == 2
+    assert "INVALID SERVER" not in result.stdout
+    assert "INVALID --profile-steps" in result.stdout
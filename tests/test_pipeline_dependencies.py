@@ -0,0 +1,70 @@
+import threading
+from my_django_starter.main import build_pipeline
+from my_django_starter.animations.terminal_fx import prompting, status_tag
+from my_django_starter.builder.base import Step
+from my_django_starter.builder.pipeline import Pipeline, build_dependencies
+
+
+def step_deps(*names):
+    pipeline = build_pipeline(run_server=False)
+    step_names = pipeline.step_names
+    deps = build_dependencies(pipeline.steps)
+    return {name: {step_names[i] for i in deps[step_names.index(name)]} for name in names}
+
+
+def test_project_edits_do_not_wait_for_app_creator():
+    deps = step_deps("EnvManager", "MediaFileHandler", "SettingsModifier")
+    assert "AppCreator" not in deps["EnvManager"]
+    assert "AppCreator" not in deps["MediaFileHandler"]
+    # INSTALLED_APPS needs the app names
+    assert "AppCreator" in deps["SettingsModifier"]
+
+
+def test_home_page_waits_for_every_settings_edit():
+    deps = step_deps("HomePageRenderer")["HomePageRenderer"]
+    assert {"EnvManager", "MediaFileHandler", "SettingsModifier"} <= deps
+
+
+class Prompt(Step):
+    reads = ()
+    writes = ('answer', 'stdin')
+
+    def __init__(self, asked, released):
+        self.asked, self.released = asked, released
+
+    def execute(self, context):
+        self.asked.set()
+        assert self.released.wait(5)
+        context['answer'] = 42
+
+
+class Background(Step):
+    def __init__(self, reads, writes, event=None):
+        self.reads, self.writes, self.event = reads, writes, event
+
+    def execute(self, context):
+        if self.event is not None:
+            self.event.set()
+
+
+def test_pool_steps_start_successors_while_a_step_prompts():
+    # first -> second on the pool must both finish while Prompt is still waiting
+    asked, second_ran = threading.Event(), threading.Event()
+    steps = [
+        Background((), ('doc',)),
+        Background(('doc',), ('doc',), event=second_ran),
+        Prompt(asked, second_ran),
+    ]
+    context = {}
+    Pipeline(steps).build_all(context)
+    assert context['answer'] == 42
+
+
+def test_other_threads_wait_for_the_prompt(capsys):
+    with prompting():
+        print("question? ", end="")
+        worker = threading.Thread(target=lambda: (status_tag("DONE"), print("plain")))
+        worker.start()
+        worker.join()
+        print("answer")
+    assert capsys.readouterr().out == "question? answer\n[🔔] DONE\nplain\n"
@@ -0,0 +1,37 @@
+import sys
+import threading
+import tracemalloc
+from my_django_starter.builder.base import Step
+from my_django_starter.builder.pipeline import Pipeline
+from my_django_starter.builder.profiling import StepProfiler
+
+OVERLAP = sys.version_info < (3, 12)  # one cProfile profiler per process from 3.12
+
+
+class Meet(Step):
+    reads = ()
+
+    def __init__(self, key, barrier):
+        self.writes = (key,)
+        self.key, self.barrier = key, barrier
+
+    def execute(self, context):
+        if OVERLAP:
+            self.barrier.wait(5)  # raises BrokenBarrierError unless the other step runs meanwhile
+        context[self.key] = bytearray(1024)
+
+
+class First(Meet):
+    pass
+
+
+class Second(Meet):
+    pass
+
+
+def test_profiled_steps_run_side_by_side(tmp_path):
+    barrier = threading.Barrier(2)
+    profiler = StepProfiler(str(tmp_path), steps=None)
+    Pipeline([First("a", barrier), Second("b", barrier)], profiler=profiler).build_all({})
+    assert sorted(name for name, _, _ in profiler.written) == ["First", "Second"]
+    assert not tracemalloc.is_tracing()
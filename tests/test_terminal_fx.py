@@ -0,0 +1,7 @@
+from my_django_starter.animations.terminal_fx import type_writer
+
+
+def test_type_writer_still_accepts_delay(capsys):
+    type_writer("positional", 0.01)
+    type_writer("keyword", delay=0.01, color="GREEN")
+    assert capsys.readouterr().out == "positional\nkeyword\n"
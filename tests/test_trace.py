@@ -0,0 +1,26 @@
+import sys
+import subprocess
+import pytest
+from my_django_starter.builder.commands import get_command_runner
+from my_django_starter.builder.trace import PipelineTracer
+
+
+def test_commands_are_recorded_against_their_step():
+    tracer = PipelineTracer()
+    popen = subprocess.Popen
+    with tracer.activate():
+        assert subprocess.Popen is popen
+        with tracer.step("Step"):
+            get_command_runner().run([sys.executable, "-c", "pass"], label="noop", capture=True)
+    (record,) = tracer.steps
+    assert record["processes"] == 1
+    (span,) = [event for event in tracer.events if event["cat"] == "subprocess"]
+    assert span["name"] == "noop" and span["args"]["step"] == "Step"
+
+
+def test_observer_is_removed_when_the_run_fails():
+    tracer = PipelineTracer()
+    with pytest.raises(RuntimeError):
+        with tracer.activate():
+            raise RuntimeError("step failed")
+    assert tracer._record_command not in get_command_runner().observers
@@ -0,0 +1,21 @@
+import os
+from my_django_starter.modules.virtualenv_creator.venv_cache import VenvCache
+
+
+def fake_venv(path):
+    os.makedirs(os.path.join(path, "bin"))
+    with open(os.path.join(path, "pyvenv.cfg"), "w") as f:
+        f.write("home = /usr/bin\n")
+    with open(os.path.join(path, "bin", "payload"), "wb") as f:
+        f.write(b"x" * 4096)
+
+
+def test_build_keeps_the_new_template_over_the_size_limit(tmp_path):
+    cache = VenvCache(root=str(tmp_path), max_bytes=1)
+    venv = cache.build("older", fake_venv)
+    assert cache.get("older") == venv
+
+    venv = cache.build("newer", fake_venv)
+    assert os.path.isfile(os.path.join(venv, "pyvenv.cfg"))
+    assert cache.get("newer") == venv
+    assert cache.get("older") is None  # least recently used, so evicted instead